@@ -0,0 +1,41 @@
+"""
+Microbenchmark of the colour helpers run by default rules (e.g. the default
+border colour of QRect, the default text colour of QText).
+
+    python -m benchmarks.bench_colour
+"""
+import timeit
+
+from qlet.ncomps.core.colour import QColour, brightness, contrast_bw, is_light
+
+
+COLOURS = [f"#{i * 0x10101:06X}" for i in range(0, 256, 8)]
+
+
+def uncached_brightness(colour: str) -> float:
+    """ the string path before colours were interned: parse on every call """
+    colour = colour[1:] if colour.startswith("#") else colour
+    if len(colour) == 8:
+        colour = colour[2:]
+    r, g, b = (int(colour[i:i + 2], 16) for i in (0, 2, 4))
+    return 0.299 * r + 0.587 * g + 0.114 * b
+
+
+def main(number: int = 20_000) -> None:
+    interned = [QColour.parse(colour) for colour in COLOURS]
+    cases = {
+        "uncached str brightness": lambda: [uncached_brightness(c) >= 128 for c in COLOURS],
+        "str is_light": lambda: [is_light(c) for c in COLOURS],
+        "QColour is_light": lambda: [is_light(c) for c in interned],
+        "str contrast_bw": lambda: [contrast_bw(c) for c in COLOURS],
+        "QColour contrast_bw": lambda: [contrast_bw(c) for c in interned],
+        "QColour brightness": lambda: [brightness(c) for c in interned],
+    }
+    calls = number * len(COLOURS)
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=number, repeat=3))
+        print(f"{name:<26}{seconds / calls * 1e9:>8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
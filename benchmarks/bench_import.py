@@ -0,0 +1,58 @@
+"""
+Import time of qlet modules, measured with ``python -X importtime`` in a fresh
+interpreter (the best of a few runs), checked against a budget: the engine
+(``qlet.ncomps.core``) must not import flet, and each module must import
+within its budget. Exits with status 1 on a regression.
+
+    python -m benchmarks.bench_import
+"""
+import subprocess
+import sys
+
+
+# module: (budget in ms, whether it may import flet)
+BUDGETS: dict[str, tuple[float, bool]] = {
+    "qlet": (20, False),
+    "qlet.ncomps.core.item": (150, False),
+    "qlet.ncomps.core.prototype": (150, False),
+    "qlet.ncomps.q_root_item": (2000, True),
+}
+
+
+def import_time(module: str) -> tuple[float, set[str]]:
+    """ :returns: the cumulative import time of module in ms, and all the modules imported with it """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    seconds = None
+    imported = set()
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and not name[1:].startswith(" "):
+            seconds = int(cumulative) / 1000
+        imported.add(name.strip())
+    assert seconds is not None, f"{module} was not imported"
+    return seconds, imported
+
+
+def main(runs: int = 5) -> int:
+    failures = []
+    for module, (budget, flet_allowed) in BUDGETS.items():
+        results = [import_time(module) for _ in range(runs)]
+        ms = min(seconds for seconds, _ in results)
+        uses_flet = "flet" in results[0][1]
+        print(f"{module:<30}{ms:>8.1f} ms  (budget {budget} ms){'  imports flet' if uses_flet else ''}")
+        if ms > budget:
+            failures.append(f"{module} imports in {ms:.1f} ms, over its budget of {budget} ms")
+        if uses_flet and not flet_allowed:
+            failures.append(f"{module} imports flet")
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
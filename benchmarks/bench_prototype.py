@@ -0,0 +1,30 @@
+"""
+Construction of a card (a QRect with a QText) by its constructors and by
+cloning a prototype.
+
+    python -m benchmarks.bench_prototype
+"""
+import timeit
+
+from qlet.ncomps.core.prototype import Prototype
+from qlet.ncomps.q_rect import QRect
+from qlet.ncomps.q_text import QText
+
+
+def card() -> QRect:
+    rect = QRect(width=200, height=40, bgcolour="#202020", padding=4, border_radius=4)
+    rect.add_child(QText(text="hello", width=lambda d: d.parent.width, height=20))
+    return rect
+
+
+def main() -> None:
+    number = 1000
+    prototype = Prototype(card())
+    built = timeit.timeit(card, number=number) / number
+    cloned = timeit.timeit(prototype.clone, number=number) / number
+    print(f"constructors {built * 1e6:8.0f} us")
+    print(f"clone        {cloned * 1e6:8.0f} us  ({built / cloned:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Control count and serialized size of a 1k item tree in each render mode, when
+added to the page and when updated after a resize.
+
+    python -m benchmarks.bench_render_mode
+"""
+import dataclasses
+import json
+import time
+
+import flet as ft
+
+from qlet.ncomps.q_rect import QRect
+from qlet.ncomps.q_root_item import QRootItem
+from qlet.ncomps.q_text import QText
+
+
+class AbsoluteRect(QRect):
+    RENDER_MODE = "absolute"
+
+
+class AbsoluteText(QText):
+    RENDER_MODE = "absolute"
+
+
+class LeanRect(QRect):
+    RENDER_MODE = "lean"
+
+
+class LeanText(QText):
+    RENDER_MODE = "lean"
+
+
+CLASSES = {
+    "wrapped": (QRect, QText),
+    "absolute": (AbsoluteRect, AbsoluteText),
+    "lean": (LeanRect, LeanText),
+}
+
+
+def build_tree(mode: str, columns: int = 10, rows: int = 99) -> QRootItem:
+    rect_cls, text_cls = CLASSES[mode]
+    root = QRootItem(render_mode=mode)
+    root.width = 1000
+    root.height = 1000
+    for column in range(columns):
+        container = rect_cls(
+            x=column * 100, width=100, height=lambda d: d.parent.height, bgcolour="#202020", padding=2,
+        )
+        for row in range(rows):
+            container.add_child(text_cls(y=row * 10, width=96, height=10, text=f"{column}:{row}"))
+        root.add_child(container)
+    root.compute()
+    return root
+
+
+def count_controls(control: ft.Control) -> int:
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+def payload_size(commands: list) -> int:
+    return len(json.dumps([dataclasses.asdict(command) for command in commands]))
+
+
+def main() -> None:
+    print(f"{'mode':<10}{'items':>7}{'controls':>10}{'add bytes':>12}{'resize bytes':>14}{'build ms':>10}")
+    for mode in CLASSES:
+        start = time.perf_counter()
+        root = build_tree(mode)
+        build_ms = (time.perf_counter() - start) * 1e3
+        items = 1 + sum(1 + len(column._children) for column in root._children)
+        added_controls: list[ft.Control] = []
+        added = root._root_component._build_add_commands(index={}, added_controls=added_controls)
+        for n, control in enumerate(added_controls):
+            # ids the client would assign, so that the controls can be updated
+            control._Control__uid = f"_{n}"
+
+        root.height = 1200
+        root.compute()
+        updated: list = []
+        root._root_component.build_update_commands({}, updated, [], [])
+
+        print(
+            f"{mode:<10}{items:>7}{count_controls(root._root_component):>10}"
+            f"{payload_size(added):>12}{payload_size(updated):>14}{build_ms:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Point, region and nearest queries over 100k item rectangles: by walking the
+item tree and reading each item's geometry, and with a SpatialIndex.
+
+    python -m benchmarks.bench_spatial_index
+"""
+import random
+import time
+import timeit
+
+from qlet.ncomps.core.item import Item
+from qlet.ncomps.core.spatial_index import SpatialIndex
+
+
+SIZE = 20_000
+
+
+def build_tree(count: int, generator: random.Random) -> Item:
+    """ groups of 100 items, each with constant global_x_, global_y_, width_ and height_ """
+    root = Item(root=True)
+    for _ in range(count // 100):
+        group = Item()
+        for _ in range(100):
+            group.add_child(Item(
+                global_x_=generator.uniform(0, SIZE), global_y_=generator.uniform(0, SIZE),
+                width_=generator.uniform(10, 200), height_=generator.uniform(10, 100),
+            ))
+        root.add_child(group)
+    return root
+
+
+def walk_at(root: Item, x: float, y: float) -> list[Item]:
+    found = []
+    for group in root._children:
+        for item in group._children:
+            left, top = item.global_x_, item.global_y_
+            if left <= x <= left + item.width_ and top <= y <= top + item.height_:
+                found.append(item)
+    return found
+
+
+def main(count: int = 100_000, queries: int = 1000) -> None:
+    generator = random.Random(0)
+    root = build_tree(count, generator)
+    items = [item for group in root._children for item in group._children]
+    started = time.perf_counter()
+    index = SpatialIndex()
+    for item in items:
+        index.insert(item, item.global_x_, item.global_y_, item.width_, item.height_)
+    print(f"build {count} items              {time.perf_counter() - started:8.3f} s")
+    points = [(generator.uniform(0, SIZE), generator.uniform(0, SIZE)) for _ in range(queries)]
+    assert all(set(walk_at(root, x, y)) == set(index.at(x, y)) for x, y in points[:2])
+    walk = timeit.timeit(lambda: walk_at(root, *points[0]), number=3) / 3
+    cases = {
+        "at(x, y)": lambda: [index.at(x, y) for x, y in points],
+        "intersecting(500 x 500)": lambda: [index.intersecting(x, y, 500, 500) for x, y in points],
+        "nearest(x, y)": lambda: [index.nearest(x, y) for x, y in points],
+    }
+    print(f"tree walk, point query           {walk * 1e6:8.0f} us/query")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=3)) / queries
+        print(f"index, {name:<26}{seconds * 1e6:8.1f} us/query  ({walk / seconds:.0f}x)")
+    moves = [(item, generator.uniform(0, SIZE), generator.uniform(0, SIZE)) for item in items[:queries]]
+    seconds = timeit.timeit(lambda: [index.insert(item, x, y, 50, 50) for item, x, y in moves], number=1)
+    print(f"index, move an item              {seconds / queries * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Building the nested QRect tree of the q_rect.py demo (as the cards of a
+screen) by hand written constructors and from the equivalent spec.
+
+    python -m benchmarks.bench_spec
+"""
+import gc
+import timeit
+
+from qlet.ncomps.core.spec import SpecLoader
+from qlet.ncomps.q_rect import QRect
+
+
+def by_constructors() -> QRect:
+    return QRect(
+        width=lambda d: d.parent.width,
+        height=lambda d: d.parent.height,
+        bgcolour="#7FFFFFFF",
+        children=[
+            QRect(
+                width=lambda d: d.parent.width / 3,
+                height=lambda d: d.parent.height / 3,
+                x=50,
+                y=50,
+                bgcolour="#000000",
+                border_radius=lambda d: d.height / 5,
+                children=[
+                    QRect(
+                        width=lambda d: d.parent.width * 0.8,
+                        height=lambda d: d.parent.height * 0.8,
+                        bgcolour="#FF0000",
+                        border_width=30,
+                        border_width_left=-20,
+                        border_width_right=10,
+                        border_radius=10,
+                        children=[
+                            QRect(
+                                width=lambda d: 50,
+                                height=lambda d: 50,
+                                bgcolour="#0000FF",
+                                align_centre_x=-1,
+                                align_centre_y=-1,
+                                align_x=-1,
+                                align_y=1,
+                                padding=15,
+                                children=[
+                                    QRect(
+                                        expand=True,
+                                        opacity=0.5,
+                                        inset=5,
+                                        bgcolour="#FFFFFF",
+                                        children=[
+                                            QRect(expand=True, opacity=0.3, bgcolour="#000000"),
+                                        ],
+                                    ),
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
+SPEC = {
+    "type": "QRect", "width": "=parent.width", "height": "=parent.height", "bgcolour": "#7FFFFFFF",
+    "children": [{
+        "type": "QRect", "width": "=parent.width / 3", "height": "=parent.height / 3", "x": 50, "y": 50,
+        "bgcolour": "#000000", "border_radius": "=height / 5",
+        "children": [{
+            "type": "QRect", "width": "=parent.width * 0.8", "height": "=parent.height * 0.8",
+            "bgcolour": "#FF0000", "border_width": 30, "border_width_left": -20, "border_width_right": 10,
+            "border_radius": 10,
+            "children": [{
+                "type": "QRect", "width": "=50", "height": "=50", "bgcolour": "#0000FF",
+                "align_centre_x": -1, "align_centre_y": -1, "align_x": -1, "align_y": 1, "padding": 15,
+                "children": [{
+                    "type": "QRect", "expand": True, "opacity": 0.5, "inset": 5, "bgcolour": "#FFFFFF",
+                    "children": [{"type": "QRect", "expand": True, "opacity": 0.3, "bgcolour": "#000000"}],
+                }],
+            }],
+        }],
+    }],
+}
+
+
+def main(number: int = 200) -> None:
+    loader = SpecLoader()
+    constructors = SpecLoader(prototypes=False)
+    cases = {
+        "constructors": by_constructors,
+        "spec, constructors": lambda: constructors.load(SPEC),
+        "spec, prototypes": lambda: loader.load(SPEC),
+    }
+    baseline = None
+    for name, case in cases.items():
+        # trees are cycles, collected between runs so that they do not slow down the next case
+        seconds = min(timeit.repeat(case, setup=gc.collect, number=number, repeat=5)) / number
+        baseline = baseline or seconds
+        print(f"{name:<20}{seconds * 1e6:>8.0f} us/tree  ({baseline / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,28 @@
 __version__ = "0.1.2"
 
-from .comps.qitem import *
-from .comps.qimage import *
-from .comps.qtext import *
\ No newline at end of file
+# the legacy components import flet, they are only imported on first access (PEP 562),
+# so that the flet free modules (e.g. qlet.ncomps.core) can be imported on their own
+_LAZY_ATTRIBUTES = {
+    "QAlign": ".comps.qitem",
+    "QAnchor": ".comps.qitem",
+    "QItem": ".comps.qitem",
+    "QInset": ".comps.qitem",
+    "QImage": ".comps.qimage",
+    "QText": ".comps.qtext",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
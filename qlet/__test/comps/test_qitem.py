@@ -0,0 +1,78 @@
+import unittest
+
+import flet as ft
+
+from qlet.comps.qimage import QImage
+from qlet.comps.qitem import QAlign, QItem
+from qlet.comps.qtext import QText
+
+
+class _FakePage:
+    def __init__(self, width: float, height: float) -> None:
+        self.width = width
+        self.height = height
+        self.padding = 0
+        self.bgcolor = None
+        self.controls: list[ft.Control] = []
+        self.on_resize = None
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+    def resize(self, width: float, height: float) -> None:
+        self.width = width
+        self.height = height
+        self.on_resize(None)
+
+
+class TestQItemResize(unittest.TestCase):
+
+    def make_root(self) -> tuple[QItem, _FakePage]:
+        page = _FakePage(400, 300)
+        root = QItem.init_page(page, resize_fps=None)
+        return root, page
+
+    def test_relative_child_follows_page(self):
+        root, page = self.make_root()
+        half = QItem(width_pct=0.5, height_pct=0.5, align=QAlign(0.5, 0.5))
+        root.add_children(half)
+        padding = half.root_component.content.padding
+        page.resize(600, 300)
+        self.assertEqual((half.width, half.height), (300, 150))
+        # updated in place
+        self.assertIs(half.root_component.content.padding, padding)
+        self.assertEqual(padding.left, -150)
+
+    def test_unchanged_child_is_not_updated(self):
+        root, page = self.make_root()
+        fixed = QItem(width=50, height=50, align=QAlign(0, 0))
+        grandchild = QItem(width_pct=0.5, height_pct=0.5, align=QAlign(0.5, 0.5))
+        fixed.add_children(grandchild)
+        root.add_children(fixed)
+        updated = []
+        grandchild.update_size = lambda: updated.append(grandchild)
+        page.resize(600, 500)
+        self.assertEqual(updated, [])
+        self.assertEqual(page.updates, 1)
+
+    def test_shared_alignment_is_not_mutated(self):
+        root, page = self.make_root()
+        child = QItem(width_pct=0.5, height_pct=0.5, align=ft.alignment.center)
+        root.add_children(child)
+        page.resize(600, 500)
+        self.assertEqual(ft.alignment.center, ft.Alignment(0, 0))
+        self.assertIs(child.root_component.content.alignment, ft.alignment.center)
+
+    def test_text_and_image_follow_size(self):
+        root, page = self.make_root()
+        text = QText(text="hi", width_pct=0.5, height_pct=0.5, size_rel_height=0.5, align=QAlign())
+        image = QImage(src="x.png", width_pct=0.25, height_pct=0.25, align=QAlign())
+        root.add_children((text, image))
+        page.resize(400, 400)
+        self.assertEqual(text._text.size, 100)
+        self.assertEqual((image._image.width, image._image.height), (100, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
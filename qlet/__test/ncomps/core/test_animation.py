@@ -0,0 +1,141 @@
+import unittest
+
+from qlet.ncomps.core.animation import Animator, ease_in_out, ease_out, linear
+from qlet.ncomps.core.item import Item
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class _FakeTimer:
+    def __init__(self, delay: float, callback) -> None:
+        self.delay = delay
+        self.callback = callback
+        self.cancelled = False
+
+    def start(self) -> None:
+        pass
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TestEasing(unittest.TestCase):
+
+    def test_bounds(self):
+        for easing in (linear, ease_in_out, ease_out):
+            self.assertEqual(easing(0), 0)
+            self.assertAlmostEqual(easing(1), 1)
+        self.assertAlmostEqual(ease_in_out(0.5), 0.5)
+
+
+class TestAnimator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.commits = 0
+        self.timers: list[_FakeTimer] = []
+        self.item = Item(root=True, x_=0, y_=0, double_=lambda d: d.self.x_ * 2)
+        self.item.compute()
+
+    def make(self) -> Animator:
+        def commit():
+            self.commits += 1
+            self.item.compute()
+
+        def timer(delay, callback):
+            self.timers.append(_FakeTimer(delay, callback))
+            return self.timers[-1]
+        return Animator(commit, fps=10, clock=lambda: self.now, timer=timer)
+
+    def test_tween(self):
+        animator = self.make()
+        tween = animator.tween(self.item, "x_", 100, duration=1, easing=linear)
+        self.assertTrue(animator.step(0.25))
+        self.assertEqual(self.item.double_, 50)
+        self.assertFalse(animator.step(1.5))
+        self.assertEqual(self.item.x_, 100)
+        self.assertTrue(tween.finished)
+        self.assertEqual(animator.running, 0)
+
+    def test_one_commit_per_frame(self):
+        animator = self.make()
+        animator.tween(self.item, "x_", 100, duration=1)
+        animator.tween(self.item, "y_", 100, duration=1)
+        animator.step(0.5)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual((self.item.x_, self.item.y_), (50, 50))
+
+    def test_replaces_running_animation(self):
+        animator = self.make()
+        first = animator.tween(self.item, "x_", 100, duration=1, easing=linear)
+        self.now = 0.5
+        animator.step()
+        second = animator.tween(self.item, "x_", 0, duration=1, easing=linear)
+        self.assertTrue(first.finished)
+        self.assertEqual(animator.running, 1)
+        animator.step(1.25)
+        self.assertEqual(self.item.x_, 12.5)
+        self.assertFalse(second.finished)
+
+    def test_keyframes(self):
+        animator = self.make()
+        animator.keyframes(self.item, "x_", {0: 0, 0.5: 100, 1: (0, linear)}, duration=2)
+        animator.step(0.5)
+        self.assertEqual(self.item.x_, 50)
+        animator.step(1.5)
+        self.assertEqual(self.item.x_, 50)
+
+    def test_spring_settles(self):
+        animator = self.make()
+        done = []
+        animator.spring(self.item, "x_", 100, on_done=lambda: done.append(True))
+        animator.step(0.05)
+        self.assertTrue(0 < self.item.x_ < 100)
+        now = 0.05
+        while animator.step(now):
+            now += 0.05
+            self.assertLess(now, 10)
+        self.assertEqual(self.item.x_, 100)
+        self.assertEqual(done, [True])
+
+    def test_timer_runs_while_animating(self):
+        animator = self.make()
+        animator.tween(self.item, "x_", 100, duration=0.25)
+        self.assertEqual(len(self.timers), 1)
+        self.assertEqual(self.timers[0].delay, 0)
+        self.now = 0.1
+        self.timers[-1].callback()
+        self.assertEqual(len(self.timers), 2)
+        self.assertAlmostEqual(self.timers[-1].delay, 0.1)
+        self.now = 0.3
+        self.timers[-1].callback()
+        self.assertEqual(len(self.timers), 2)
+        self.assertEqual(animator.frames, 2)
+        # restarts with the next animation
+        animator.tween(self.item, "x_", 0, duration=0.25)
+        self.assertEqual(len(self.timers), 3)
+
+    def test_cancel(self):
+        animator = self.make()
+        tween = animator.tween(self.item, "x_", 100, duration=1)
+        animator.cancel(self.item)
+        self.assertTrue(tween.finished)
+        self.assertFalse(animator.step(0.5))
+        self.assertEqual(self.item.x_, 0)
+
+    def test_root_animator(self):
+        root = QRootItem()
+        item = QItem(width=10, height=10)
+        follower = QItem(x=lambda d: d.parent.width - 10, width=10, height=10)
+        root.add_children([item, follower])
+        root.width = 100
+        root.compute()
+        root.animator.tween(item, "x", 50, duration=0)
+        self.assertFalse(root.animator.step())
+        root.animator.stop()
+        self.assertEqual((item.x, item.global_x), (50, 50))
+        self.assertEqual(follower.x, 90)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from qlet.ncomps.core.colour import (
+    QColour, alpha_val, brightness, contrast_bw, is_light, rgb_val, to_flet_colour,
+)
+
+
+class TestColour(unittest.TestCase):
+
+    def test_parse(self):
+        colour = QColour.parse("#80FF0010")
+        self.assertEqual(colour.value, 0x80FF0010)
+        self.assertEqual((colour.a, colour.r, colour.g, colour.b), (0x80, 0xFF, 0x00, 0x10))
+        self.assertEqual(QColour.parse("FF0010").a, 0xFF)
+        self.assertEqual(QColour.parse("#FF001080", alpha_front=False), colour)
+        self.assertEqual(colour.hex, "#80FF0010")
+        with self.assertRaises(ValueError):
+            QColour.parse("#FFF")
+        with self.assertRaises(ValueError):
+            QColour.parse("#GGGGGG")
+
+    def test_interned(self):
+        self.assertIs(QColour.parse("#123456"), QColour.parse("#123456"))
+        self.assertIs(QColour.parse("#123456"), QColour.rgba(0x12, 0x34, 0x56))
+        self.assertIs(QColour.of(0xFF123456), QColour.parse("#FF123456"))
+
+    def test_helpers_accept_both(self):
+        for colour in ("#FFFFFF", QColour.parse("#FFFFFF")):
+            self.assertEqual(rgb_val(colour), (255, 255, 255))
+            self.assertEqual(alpha_val(colour), 255)
+            self.assertAlmostEqual(brightness(colour), 255)
+            self.assertTrue(is_light(colour))
+            self.assertEqual(contrast_bw(colour), "#000000")
+        self.assertEqual(rgb_val("#11223344", alpha_front=False), (0x11, 0x22, 0x33))
+
+    def test_to_flet_colour(self):
+        self.assertEqual(to_flet_colour(QColour.rgba(1, 2, 3, 4)), "#04010203")
+        self.assertEqual(to_flet_colour("red"), "red")
+        self.assertIsNone(to_flet_colour(None))
+
+    def test_qrect_accepts_colour(self):
+        from qlet.ncomps.q_rect import QRect
+        from qlet.ncomps.q_root_item import QRootItem
+        root = QRootItem()
+        rect = QRect(bgcolour=QColour.parse("#FFFFFF"), border_width=1)
+        root.add_child(rect)
+        root.compute()
+        self.assertEqual(rect._bg_container.bgcolor, "#FFFFFFFF")
+        self.assertEqual(rect.border_colour, "#000000")
@@ -0,0 +1,121 @@
+import asyncio
+import unittest
+
+from qlet.ncomps.core.item import CircleException, Item
+
+
+class _Leaf(Item):
+    def __init__(self, log: list, **kwargs) -> None:
+        self._log = log
+        super().__init__(**kwargs)
+
+    def _on_computed(self) -> None:
+        # the item is consistent whenever a hook runs
+        self._log.append(self.v_ == self.parent_v_ + 1)
+
+
+def build_tree(log: list, width: int = 20, depth: int = 2) -> Item:
+    root = Item(root=True, v_=0)
+
+    def grow(parent: Item, level: int) -> None:
+        for _ in range(width):
+            child = _Leaf(log, parent_v_=lambda d: d.parent.v_, v_=lambda d: d.self.parent_v_ + 1)
+            parent.add_child(child)
+            if level + 1 < depth:
+                grow(child, level + 1)
+    grow(root, 0)
+    return root
+
+
+def leaves(item: Item) -> list[Item]:
+    found = []
+    for child in item._children:
+        found.append(child)
+        found.extend(leaves(child))
+    return found
+
+
+class TestComputeAsync(unittest.TestCase):
+
+    def test_same_result_as_compute(self):
+        log = []
+        root = build_tree(log)
+        slices = asyncio.run(root.compute_async(max_evaluations=50, max_ms=None))
+        self.assertTrue(all(log))
+        self.assertEqual(len(log), 20 + 400)
+        self.assertEqual({item.v_ for item in leaves(root) if not item._children}, {2})
+        self.assertGreater(len(slices.durations), 1)
+        self.assertGreaterEqual(slices.evaluations, 1 + 2 * 420)
+        self.assertAlmostEqual(slices.total, sum(slices.durations))
+
+    def test_yields_to_the_event_loop(self):
+        ticks = []
+
+        async def ticker() -> None:
+            while True:
+                ticks.append(len(log))
+                await asyncio.sleep(0)
+
+        async def main() -> None:
+            task = asyncio.create_task(ticker())
+            await root.compute_async(max_evaluations=10, max_ms=None)
+            task.cancel()
+
+        log = []
+        root = build_tree(log)
+        asyncio.run(main())
+        self.assertGreater(len(ticks), 10)
+        # other tasks run while the tree is half computed
+        self.assertTrue(any(0 < n < len(log) for n in ticks))
+
+    def test_recompute_after_update(self):
+        log = []
+        root = build_tree(log, width=5)
+        asyncio.run(root.compute_async())
+        root.v_ = 10
+        asyncio.run(root.compute_async(max_evaluations=1))
+        self.assertEqual({item.v_ for item in leaves(root) if not item._children}, {12})
+
+    def test_writes_while_suspended(self):
+        root = Item(root=True, v1_=10)
+        children = [Item(v1_=lambda d: d.parent.v1_ + 1) for _ in range(50)]
+        root.add_children(children)
+
+        async def writer() -> None:
+            await asyncio.sleep(0)
+            root.v1_ = 100
+            # applied once the pass is over
+            self.assertEqual(root.v1_, 10)
+
+        async def main() -> None:
+            await asyncio.gather(root.compute_async(max_evaluations=5, max_ms=None), writer())
+
+        asyncio.run(main())
+        self.assertEqual(root.v1_, 100)
+        self.assertEqual({child.v1_ for child in children}, {101})
+        self.assertTrue(all(
+            property.up_to_date for item in [root, *children] for property in item._properties.values()
+        ))
+
+    def test_computes_are_serialised(self):
+        async def main() -> None:
+            first = asyncio.create_task(root.compute_async(max_evaluations=5))
+            await asyncio.sleep(0)
+            with self.assertRaises(RuntimeError):
+                root.compute()
+            await asyncio.gather(first, root.compute_async(max_evaluations=5))
+
+        root = build_tree([], width=5)
+        asyncio.run(main())
+        self.assertIsNone(root._async_compute)
+        root.compute()
+
+    def test_circle_detected_with_small_slices(self):
+        root = Item(root=True, a_=lambda d: d.self.b_, b_=lambda d: d.self.a_)
+        with self.assertRaises(CircleException):
+            asyncio.run(root.compute_async(max_evaluations=1, max_ms=0))
+        self.assertIsNone(root._async_compute)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import unittest
+
+from qlet.ncomps.core.compute_coordinator import ComputeCoordinator
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class TestComputeCoordinator(unittest.TestCase):
+
+    def test_compute_when_free(self):
+        passes = []
+        coordinator = ComputeCoordinator(lambda: passes.append(1))
+        self.assertTrue(coordinator.request_compute())
+        self.assertEqual(passes, [1])
+        self.assertFalse(coordinator.busy)
+
+    def test_requests_during_a_pass_fold_into_one(self):
+        started, release = threading.Event(), threading.Event()
+        passes = []
+
+        def compute():
+            passes.append(threading.get_ident())
+            if len(passes) == 1:
+                started.set()
+                release.wait(5)
+
+        coordinator = ComputeCoordinator(compute)
+        worker = threading.Thread(target=coordinator.request_compute)
+        worker.start()
+        started.wait(5)
+        results = [coordinator.request_compute() for _ in range(10)]
+        release.set()
+        worker.join(5)
+
+        self.assertEqual(results, [False] * 10)
+        self.assertEqual(coordinator.passes, 2)
+        # the follow-up pass runs on the thread that was computing
+        self.assertEqual(passes, [worker.ident, worker.ident])
+
+    def test_writes_from_other_threads_are_queued(self):
+        started, release = threading.Event(), threading.Event()
+        values = []
+        seen = []
+
+        def compute():
+            seen.append(list(values))
+            if len(seen) == 1:
+                started.set()
+                release.wait(5)
+
+        coordinator = ComputeCoordinator(compute)
+        worker = threading.Thread(target=coordinator.request_compute)
+        worker.start()
+        started.wait(5)
+        coordinator.call(values.append, 1)
+        coordinator.call(values.append, 2)
+        self.assertEqual(values, [])
+        coordinator.request_compute()
+        release.set()
+        worker.join(5)
+
+        self.assertEqual(values, [1, 2])
+        # the follow-up pass sees the queued writes
+        self.assertEqual(seen, [[], [1, 2]])
+
+    def test_reentrant_calls_run_immediately(self):
+        calls = []
+        coordinator = ComputeCoordinator(lambda: coordinator.call(calls.append, "inner"))
+        coordinator.request_compute()
+        self.assertEqual(calls, ["inner"])
+
+    def test_free_after_exception(self):
+        def compute():
+            raise RuntimeError("boom")
+        coordinator = ComputeCoordinator(compute)
+        with self.assertRaises(RuntimeError):
+            coordinator.request_compute()
+        self.assertFalse(coordinator.busy)
+
+    def test_held_until_released(self):
+        passes = []
+        coordinator = ComputeCoordinator(lambda: passes.append(1))
+        self.assertTrue(coordinator.acquire())
+        self.assertFalse(coordinator.acquire())
+        self.assertFalse(coordinator.request_compute())
+        self.assertFalse(coordinator.request_compute())
+        self.assertEqual(passes, [])
+        coordinator.release()
+        self.assertEqual(passes, [1])
+        self.assertFalse(coordinator.busy)
+
+    def test_async_waiters_served_in_order(self):
+        coordinator = ComputeCoordinator(lambda: None)
+        order = []
+
+        async def waiter(name: str) -> None:
+            await coordinator.acquire_async()
+            order.append(name)
+            await asyncio.sleep(0)
+            coordinator.release()
+
+        async def main() -> None:
+            self.assertTrue(coordinator.acquire())
+            tasks = [asyncio.create_task(waiter(name)) for name in "abc"]
+            await asyncio.sleep(0)
+            cancelled = asyncio.create_task(waiter("x"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            # released by another thread
+            worker = threading.Thread(target=coordinator.release)
+            worker.start()
+            worker.join(5)
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        self.assertEqual(order, ["a", "b", "c"])
+        self.assertFalse(coordinator.busy)
+
+    def test_root_coordinator(self):
+        root = QRootItem()
+        item = QItem(width=lambda d: d.parent.width / 2, height=10)
+        root.add_child(item)
+        root.coordinator.set(root, "width", 300)
+        root.coordinator.request_compute()
+        self.assertEqual(item.width, 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from qlet.ncomps.core.effect import effect
+from qlet.ncomps.core.item import Item
+
+
+class EffectItem(Item):
+    @Item.cached_classproperty
+    def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
+        return super()._RESERVED_PROPERTY_NAMES | {"a", "b", "c", "enabled"}
+
+    def __init__(self, id: str | None = None, root: bool = False, **kwargs) -> None:
+        self.runs: list[str] = []
+        super().__init__(id, root, (), **kwargs)
+        self.a = 1
+        self.b = lambda d: d.a * 2
+        self.c = 0
+        self.enabled = True
+
+    @effect("a", "b")
+    def _apply_ab(self) -> None:
+        self.runs.append("ab")
+
+    @effect("c", "parent.c")
+    def _apply_c(self) -> None:
+        self.runs.append("c")
+
+    @effect("a", when=lambda item: item.enabled)
+    def _apply_enabled(self) -> None:
+        self.runs.append("enabled")
+
+
+class TestEffect(unittest.TestCase):
+
+    def test_runs_once_per_compute(self):
+        root = EffectItem(root=True)
+        root.compute()
+        self.assertEqual(root.runs, ["ab", "c", "enabled"])
+        root.runs.clear()
+        # a and b both change, the effect runs once
+        root.a = 2
+        root.compute()
+        self.assertEqual(root.runs, ["ab", "enabled"])
+
+    def test_unchanged_inputs(self):
+        root = EffectItem(root=True)
+        root.compute()
+        root.runs.clear()
+        root.compute()
+        root.a = 1
+        root.compute()
+        self.assertEqual(root.runs, [])
+
+    def test_parent_inputs(self):
+        root = EffectItem(root=True)
+        child = EffectItem()
+        root.add_child(child)
+        root.compute()
+        child.runs.clear()
+        root.c = 5
+        root.compute()
+        self.assertEqual(child.runs, ["c"])
+        child.runs.clear()
+        root.a = 5
+        root.compute()
+        self.assertEqual(child.runs, [])
+
+    def test_new_parent(self):
+        root = EffectItem(root=True)
+        child = EffectItem()
+        root.add_child(child)
+        root.compute()
+        root.remove_child(child)
+        other = EffectItem(root=True)
+        other.add_child(child)
+        child.runs.clear()
+        other.compute()
+        self.assertEqual(child.runs, ["c"])
+
+    def test_when(self):
+        root = EffectItem(root=True)
+        root.enabled = False
+        root.compute()
+        self.assertEqual(root.runs, ["ab", "c"])
+
+    def test_override_keeps_declaration(self):
+        class Override(EffectItem):
+            def _apply_ab(self) -> None:
+                self.runs.append("override")
+
+        root = Override(root=True)
+        root.compute()
+        self.assertEqual(root.runs, ["override", "c", "enabled"])
@@ -1,7 +1,9 @@
+import gc
 import multiprocessing
 import queue
 import time
 import unittest
+import weakref
 from functools import cache
 from typing import Callable, Sequence
 
@@ -615,3 +617,65 @@ class TestItem(unittest.TestCase):
         item1.compute()
         self.assertEqual(item1.v1_, 4)
         self.assertEqual(item1_1.v1_, 5)
+
+    def test_remove_child_unlinks_edges(self):
+        root = Item(
+            root=True,
+            v1_=1,
+            children=(
+                child1 := Item(
+                    id="c1",
+                    v1_=lambda d: d.parent.v1_ + 1,
+                ),
+                child2 := Item(
+                    v1_=lambda d: d.c1.v1_ + 1,
+                ),
+            ),
+        )
+        root.compute()
+        self.assertEqual(child2.v1_, 3)
+
+        root.remove_child(child1)
+        self.assertEqual(len(root._get_property("v1_").dependents), 0)
+        self.assertEqual(len(child1._get_property("v1_").dependents), 0)
+        self.assertEqual(len(child1._get_property("v1_").requirements), 0)
+        self.assertIsNone(child1.parent)
+
+        # the removed item is re-evaluated against its new parent
+        other_root = Item(root=True, v1_=10)
+        other_root.add_child(child1)
+        other_root.compute()
+        self.assertEqual(child1.v1_, 11)
+
+    def test_remove_as_requirement(self):
+        root = Item(
+            root=True,
+            v1_=1,
+            v2_=lambda d: d.v1_ + 1,
+        )
+        root.compute()
+        property = root._get_property("v1_")
+        property.remove_as_requirement()
+        self.assertEqual(len(property.dependents), 0)
+        self.assertEqual(len(root._get_property("v2_").requirements), 0)
+
+    def test_add_remove_cycles_do_not_leak(self):
+        root = Item(root=True, v1_=1)
+        v1_property = root._get_property("v1_")
+        removed: list[weakref.ref] = []
+        for i in range(10000):
+            child = Item(
+                v1_=lambda d: d.parent.v1_ + 1,
+                children=Item(v1_=lambda d: d.parent.v1_ + 1),
+            )
+            root.add_child(child)
+            root.compute()
+            self.assertEqual(child._children[0].v1_, 3)
+            root.remove_child(child)
+            self.assertEqual(len(v1_property.dependents), 0)
+            if i % 1000 == 0:
+                removed.append(weakref.ref(child))
+        del child
+        gc.collect()
+        self.assertTrue(all(r() is None for r in removed))
+        self.assertEqual(len(root._children), 0)
@@ -0,0 +1,66 @@
+import unittest
+
+from qlet.ncomps.core.item import Item
+from qlet.ncomps.core.memory import allocated_bytes_per_item, memory_report
+
+
+# Regression limits for the bytes retained by a single default component.
+# Lower them when an optimisation lands, never raise them without a reason.
+QITEM_BYTES_PER_ITEM_LIMIT = 18_000
+QTEXT_BYTES_PER_ITEM_LIMIT = 48_000
+
+
+class TestMemory(unittest.TestCase):
+
+    def test_report_categories(self):
+        root = Item(
+            root=True,
+            v1_=1,
+            children=(
+                Item(v1_=lambda d: d.parent.v1_ + 1),
+                Item(v1_=lambda d: d.parent.v1_ + 2),
+            ),
+        )
+        root.compute()
+        report = memory_report(root)
+        self.assertEqual(report.items, 3)
+        self.assertEqual(report.classes["Item"].instances, 3)
+        self.assertGreater(report.categories["properties"].count, 0)
+        self.assertEqual(report.categories["flet_controls"].bytes, 0)
+        self.assertEqual(report.categories["handles"].bytes, 0)
+        self.assertEqual(
+            report.total_bytes,
+            sum(usage.bytes for usage in report.categories.values()),
+        )
+        self.assertEqual(report.classes["Item"].bytes, report.total_bytes)
+
+    def test_constant_closures(self):
+        item = Item(root=True, v1_=1, v2_=2, v3_=lambda d: d.v1_)
+        report = memory_report(item)
+        self.assertEqual(report.categories["closures"].count, 2 * 3)  # function, closure tuple, cell
+        self.assertEqual(report.categories["rules"].count, 1)
+
+    def test_shared_objects_counted_once(self):
+        children = [Item() for _ in range(10)]
+        root = Item(root=True, children=children)
+        root.compute()
+        report = memory_report(root)
+        # all children share a single ancestors dict and a single peers dict
+        self.assertLess(report.categories["pedigrees"].count, 10 * 10)
+
+    def test_qitem_bytes_per_item(self):
+        from qlet.ncomps.q_item import QItem
+        self.assertLess(allocated_bytes_per_item(QItem, 100), QITEM_BYTES_PER_ITEM_LIMIT)
+
+    def test_qtext_bytes_per_item(self):
+        from qlet.ncomps.q_text import QText
+        self.assertLess(allocated_bytes_per_item(QText, 100), QTEXT_BYTES_PER_ITEM_LIMIT)
+
+    def test_factory_error_propagates(self):
+        import tracemalloc
+
+        def factory() -> Item:
+            raise ValueError("factory")
+        with self.assertRaisesRegex(ValueError, "factory"):
+            allocated_bytes_per_item(factory, 1)
+        self.assertFalse(tracemalloc.is_tracing())
@@ -0,0 +1,75 @@
+import unittest
+
+from qlet.ncomps.core.item import Item
+
+
+class PooledItem(Item):
+    @Item.cached_classproperty
+    def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
+        return super()._RESERVED_PROPERTY_NAMES | {"a", "b"}
+
+    def __init__(self, id: str | None = None, a=1, b=lambda d: d.a + 1, **kwargs) -> None:
+        if not self._reusing:
+            self.builds = getattr(self, "builds", 0) + 1
+        super().__init__(id, False, (), **kwargs)
+        self.a = a
+        self.b = b
+
+
+class TestPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        PooledItem.pool().clear()
+        PooledItem.pool().stats.__init__()
+
+    def test_acquire_release(self):
+        root = Item(root=True)
+        item = PooledItem.acquire(a=5)
+        root.add_child(item)
+        root.compute()
+        self.assertEqual(item.b, 6)
+        self.assertEqual(PooledItem.pool().stats.misses, 1)
+
+        item.release()
+        self.assertIsNone(item.parent)
+        self.assertEqual(len(root._children), 0)
+        self.assertEqual(len(PooledItem.pool()), 1)
+
+        reused = PooledItem.acquire()
+        self.assertIs(reused, item)
+        self.assertEqual(reused.builds, 1)
+        root.add_child(reused)
+        root.compute()
+        self.assertEqual(reused.a, 1)
+        self.assertEqual(reused.b, 2)
+        self.assertEqual(PooledItem.pool().stats.hits, 1)
+        self.assertEqual(PooledItem.pool().stats.hit_rate, 0.5)
+
+    def test_reset_user_defined_properties(self):
+        root = Item(root=True, v1_=3)
+        item = PooledItem.acquire(id="p", v1_=lambda d: d.parent.v1_)
+        root.add_child(item)
+        root.compute()
+        self.assertEqual(item.v1_, 3)
+        item.release()
+
+        item = PooledItem.acquire(v2_=7)
+        self.assertEqual(item.id, "")
+        self.assertNotIn("v1_", item._properties)
+        root.add_child(item)
+        root.compute()
+        self.assertEqual(item.v2_, 7)
+        self.assertEqual(len(root._get_property("v1_").dependents), 0)
+
+    def test_max_size(self):
+        pool = PooledItem.pool()
+        pool.max_size = 2
+        try:
+            items = [PooledItem.acquire() for _ in range(3)]
+            for item in items:
+                item.release()
+            self.assertEqual(len(pool), 2)
+            self.assertEqual(pool.stats.releases, 3)
+            self.assertEqual(pool.stats.discards, 1)
+        finally:
+            pool.max_size = pool.DEFAULT_MAX_SIZE
@@ -0,0 +1,104 @@
+import unittest
+from functools import partial
+
+from qlet.ncomps.core.customizer import ItemCustomizer
+from qlet.ncomps.core.item import Item
+from qlet.ncomps.core.prototype import Prototype
+from qlet.ncomps.q_rect import QRect
+from qlet.ncomps.q_root_item import QRootItem
+from qlet.ncomps.q_text import QText
+
+
+def card() -> QRect:
+    rect = QRect(width=200, height=40, bgcolour="#202020", padding=4)
+    rect.add_child(QText(text="hello", width=lambda d: d.parent.width, height=20))
+    return rect
+
+
+class _Card(ItemCustomizer):
+    PROTOTYPE = True
+
+    def __init__(self) -> None:
+        self.built = 0
+
+    def item(self, **kwargs) -> QRect:
+        self.built += 1
+        return card()
+
+
+class TestPrototype(unittest.TestCase):
+
+    def test_clones_are_independent(self):
+        prototype = Prototype(card())
+        first, second = prototype.clone(), prototype.clone()
+        self.assertIsNot(first, second)
+        self.assertIsNot(first._properties["width"], second._properties["width"])
+        self.assertIsNot(first._root_component, second._root_component)
+        self.assertIsNot(first._children[0]._ft_text, second._children[0]._ft_text)
+        first.width = 100
+        self.assertEqual(second.width, 200)
+        self.assertEqual(prototype.item.width, 200)
+
+    def test_functions_are_shared(self):
+        prototype = Prototype(card())
+        clone = prototype.clone()
+        self.assertIs(
+            clone._children[0]._properties["width"]._f_value,
+            prototype.item._children[0]._properties["width"]._f_value,
+        )
+
+    def test_references_point_to_the_clone(self):
+        clone = Prototype(card()).clone()
+        text = clone._children[0]
+        self.assertIs(text.parent, clone)
+        self.assertIs(clone._root_component.q_data(), clone)
+        self.assertIs(clone._frame_chain[-1], clone._frame)
+        self.assertIn(text._root_component, clone._frame.controls)
+        self.assertNotEqual(clone.displayed_id, text.displayed_id)
+
+    def test_clone_computes_in_a_tree(self):
+        root = QRootItem()
+        prototype = Prototype(card())
+        clones = [prototype.clone() for _ in range(3)]
+        for n, clone in enumerate(clones):
+            clone.y = n * 50
+            root.add_child(clone)
+        root.compute()
+        clones[1].width = 120
+        root.compute()
+        self.assertEqual([clone._children[0].width for clone in clones], [200, 120, 200])
+        self.assertEqual(clones[2]._children[0].global_y, 100)
+        self.assertEqual(len(root._frame.controls), 3)
+
+    def test_shared_containers(self):
+        item = Item(calls_=[1, 2], pair_=(3, [4]), call_=partial(max, 0))
+        clone = Prototype(item).clone()
+        self.assertEqual(clone.calls_, [1, 2])
+        self.assertIsNot(clone.calls_, item.calls_)
+        self.assertIsNot(clone.pair_[1], item.pair_[1])
+        self.assertEqual(clone.call_(5), 5)
+
+    def test_requires_parentless_item(self):
+        parent = Item(root=True)
+        child = Item()
+        parent.add_child(child)
+        with self.assertRaises(AssertionError):
+            Prototype(child)
+
+
+class TestCustomizerPrototype(unittest.TestCase):
+
+    def test_built_once(self):
+        customizer = _Card()
+        items = [customizer(width=100 + n) for n in range(3)]
+        self.assertEqual(customizer.built, 1)
+        self.assertEqual([item.width for item in items], [100, 101, 102])
+        self.assertEqual(len({id(item) for item in items}), 3)
+
+    def test_adopted_id(self):
+        item = _Card()("card")
+        self.assertEqual(item.peer_id, "card")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+
+from qlet.ncomps.core.resize_coalescer import ResizeCoalescer
+
+
+class _FakeTimer:
+    def __init__(self, delay: float, callback) -> None:
+        self.delay = delay
+        self.callback = callback
+        self.started = False
+        self.cancelled = False
+
+    def start(self) -> None:
+        self.started = True
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TestResizeCoalescer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.timers: list[_FakeTimer] = []
+        self.applied: list[tuple[float, float]] = []
+
+    def make(self, max_fps: float | None = 10, apply=None) -> ResizeCoalescer:
+        def timer(delay, callback):
+            self.timers.append(_FakeTimer(delay, callback))
+            return self.timers[-1]
+        return ResizeCoalescer(
+            apply or (lambda w, h: self.applied.append((w, h))),
+            max_fps=max_fps,
+            clock=lambda: self.now,
+            timer=timer,
+        )
+
+    def fire_timer(self) -> None:
+        timer = self.timers[-1]
+        self.now += timer.delay
+        timer.callback()
+
+    def test_first_size_applied_immediately(self):
+        coalescer = self.make()
+        coalescer.submit(100, 200)
+        self.assertEqual(self.applied, [(100, 200)])
+        self.assertEqual(self.timers, [])
+
+    def test_intermediate_sizes_dropped(self):
+        coalescer = self.make()
+        coalescer.submit(100, 100)
+        for width in range(101, 110):
+            self.now += 0.01
+            coalescer.submit(width, 100)
+        self.assertEqual(self.applied, [(100, 100)])
+        self.assertEqual(len(self.timers), 1)
+        self.assertEqual(coalescer.pending, (109, 100))
+        self.fire_timer()
+        self.assertEqual(self.applied, [(100, 100), (109, 100)])
+        self.assertIsNone(coalescer.pending)
+
+    def test_trailing_timer_waits_for_the_rest_of_the_interval(self):
+        coalescer = self.make(max_fps=10)
+        coalescer.submit(100, 100)
+        self.now = 0.04
+        coalescer.submit(120, 100)
+        self.assertAlmostEqual(self.timers[0].delay, 0.06)
+
+    def test_applied_after_interval_without_timer(self):
+        coalescer = self.make(max_fps=10)
+        coalescer.submit(100, 100)
+        self.now = 0.2
+        coalescer.submit(120, 100)
+        self.assertEqual(self.applied, [(100, 100), (120, 100)])
+        self.assertEqual(self.timers, [])
+
+    def test_unchanged_size_skipped(self):
+        coalescer = self.make(max_fps=None)
+        coalescer.submit(100, 100)
+        coalescer.submit(100, 100)
+        self.assertEqual(self.applied, [(100, 100)])
+
+    def test_back_to_applied_size_skipped(self):
+        coalescer = self.make()
+        coalescer.submit(100, 100)
+        self.now = 0.01
+        coalescer.submit(150, 100)
+        coalescer.submit(100, 100)
+        self.fire_timer()
+        self.assertEqual(self.applied, [(100, 100)])
+
+    def test_no_limit(self):
+        coalescer = self.make(max_fps=None)
+        for width in (100, 110, 120):
+            coalescer.submit(width, 100)
+        self.assertEqual([w for w, _ in self.applied], [100, 110, 120])
+        self.assertEqual(self.timers, [])
+
+    def test_sizes_submitted_while_applying_are_coalesced(self):
+        def apply(w, h):
+            self.applied.append((w, h))
+            if len(self.applied) == 1:
+                coalescer.submit(110, 100)
+                coalescer.submit(120, 100)
+        coalescer = self.make(max_fps=None, apply=apply)
+        coalescer.submit(100, 100)
+        self.assertEqual(self.applied, [(100, 100), (120, 100)])
+
+    def test_flush_and_cancel(self):
+        coalescer = self.make()
+        coalescer.submit(100, 100)
+        coalescer.submit(110, 100)
+        coalescer.flush()
+        self.assertEqual(self.applied, [(100, 100), (110, 100)])
+        self.assertTrue(self.timers[0].cancelled)
+        coalescer.submit(120, 100)
+        coalescer.cancel()
+        self.assertIsNone(coalescer.pending)
+        self.timers[-1].callback()
+        self.assertEqual(self.applied, [(100, 100), (110, 100)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import math
+import random
+import unittest
+
+from qlet.ncomps.core.spatial_index import SpatialIndex
+
+
+def contains(rect: tuple, x: float, y: float) -> bool:
+    left, top, width, height = rect
+    return left <= x <= left + width and top <= y <= top + height
+
+
+def distance(rect: tuple, x: float, y: float) -> float:
+    left, top, width, height = rect
+    dx = max(left - x, 0, x - left - width)
+    dy = max(top - y, 0, y - top - height)
+    return math.hypot(dx, dy)
+
+
+class TestSpatialIndex(unittest.TestCase):
+
+    def test_queries(self):
+        index = SpatialIndex(cell_size=10)
+        index.insert("a", 0, 0, 10, 10)
+        index.insert("b", 5, 5, 30, 30)
+        index.insert("c", 100, 100, 5, 5)
+        self.assertEqual(sorted(index.at(7, 7)), ["a", "b"])
+        self.assertEqual(index.at(50, 50), [])
+        self.assertEqual(sorted(index.intersecting(30, 30, 80, 80)), ["b", "c"])
+        self.assertEqual(index.nearest(90, 90), "c")
+        self.assertIsNone(index.nearest(90, 90, max_distance=5))
+        self.assertEqual(index.nearest(-1e6, 0), "a")
+
+    def test_move_and_remove(self):
+        index = SpatialIndex(cell_size=10)
+        index.insert("a", 0, 0, 10, 10)
+        index.insert("a", 50, 50, 10, 10)
+        self.assertEqual(index.at(5, 5), [])
+        self.assertEqual(index.at(55, 55), ["a"])
+        self.assertEqual(index.rect("a"), (50, 50, 10, 10))
+        index.remove("a")
+        index.remove("a")
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index._cells, {})
+
+    def test_large_rects(self):
+        index = SpatialIndex(cell_size=10, max_cells=4)
+        index.insert("page", 0, 0, 1000, 1000)
+        index.insert("dot", 500, 500, 1, 1)
+        self.assertEqual(sorted(index.at(500, 500)), ["dot", "page"])
+        self.assertEqual(index.nearest(2000, 2000), "page")
+        self.assertEqual(sorted(index.intersecting(400, 400, 10, 10)), ["page"])
+
+    def test_same_as_scanning(self):
+        generator = random.Random(0)
+        index = SpatialIndex(cell_size=50, max_cells=16)
+        rects = {}
+        for key in range(1000):
+            rects[key] = tuple(generator.uniform(-1000, 1000) for _ in range(2)) + \
+                tuple(generator.uniform(0, 300) for _ in range(2))
+            index.insert(key, *rects[key])
+        for key in range(0, 1000, 7):
+            del rects[key]
+            index.remove(key)
+        for _ in range(200):
+            x, y = generator.uniform(-1500, 1500), generator.uniform(-1500, 1500)
+            self.assertEqual(sorted(index.at(x, y)), [key for key, rect in rects.items() if contains(rect, x, y)])
+            nearest = index.nearest(x, y)
+            self.assertAlmostEqual(
+                distance(rects[nearest], x, y), min(distance(rect, x, y) for rect in rects.values()),
+            )
+            region = (x, y, 200, 100)
+            self.assertEqual(
+                sorted(index.intersecting(*region)),
+                [
+                    key for key, (left, top, width, height) in rects.items()
+                    if left <= x + 200 and x <= left + width and top <= y + 100 and y <= top + height
+                ],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
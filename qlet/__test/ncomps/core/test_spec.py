@@ -0,0 +1,123 @@
+import json
+import unittest
+
+from qlet.ncomps.core.item import Item
+from qlet.ncomps.core.spec import SpecError, SpecLoader, compile_rule, load_spec
+from qlet.ncomps.q_grid import QGrid
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_list_view import QListView
+from qlet.ncomps.q_rect import QRect
+from qlet.ncomps.q_root_item import QRootItem
+from qlet.ncomps.q_text import QText
+
+
+class _Labelled(Item):
+    built = 0
+
+    def __init__(self, label: str, **kwargs) -> None:
+        type(self).built += 1
+        self.label = label
+        super().__init__(**kwargs)
+
+
+class _Broken(Item):
+    def __init__(self, **kwargs) -> None:
+        raise TypeError("broken")
+
+
+class _Rows(QListView):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(delegate=lambda index: QItem(), **kwargs)
+
+
+CARD = {
+    "type": "QRect", "id": "card", "bgcolour": "#202020",
+    "width": "=parent.width / 3", "height": 40,
+    "children": [
+        {"type": "QText", "text": "hello", "width": "=max(parent.width - 20, 0)", "height": "=card.height / 2"},
+    ],
+}
+
+
+class TestCompileRule(unittest.TestCase):
+
+    def test_cached_by_source(self):
+        self.assertIs(compile_rule("parent.width / 3"), compile_rule("parent.width / 3"))
+
+    def test_invalid_rules(self):
+        for source in ("parent.width +", "__import__('os')", "parent.__class__", "[x for x in parent]",
+                       "lambda: 1", "parent.width.bit_length()"):
+            with self.assertRaises(SpecError, msg=source):
+                compile_rule(source)
+
+
+class TestSpecLoader(unittest.TestCase):
+
+    def compute(self, item: Item) -> QRootItem:
+        root = QRootItem()
+        root.width = 300
+        root.add_child(item)
+        root.compute()
+        return root
+
+    def test_load(self):
+        card = load_spec(CARD)
+        self.compute(card)
+        text = card._children[0]
+        self.assertIsInstance(card, QRect)
+        self.assertIsInstance(text, QText)
+        self.assertEqual((card.id, card.width, card.bgcolour), ("card", 100, "#202020"))
+        self.assertEqual((text.width, text.height, text.text), (80, 20, "hello"))
+
+    def test_same_as_constructors(self):
+        for loader in (SpecLoader(), SpecLoader(prototypes=False)):
+            card = loader.load_json(json.dumps(CARD))
+            self.compute(card)
+            self.assertEqual(card._children[0].width, 80)
+        first, second = SpecLoader().load(CARD), SpecLoader().load(CARD)
+        self.assertIsNot(first._children[0], second._children[0])
+        self.assertIs(
+            first._properties["width"]._f_value, second._properties["width"]._f_value,
+        )
+
+    def test_placement(self):
+        grid = SpecLoader().load({
+            "type": "QGrid", "width": 100, "height": 100,
+            "row_tracks": ["1fr", "1fr"], "column_tracks": ["1fr", "1fr"],
+            "children": [{"type": "QRect", "placement": {"row": 1, "column": 1}}],
+        })
+        self.assertIsInstance(grid, QGrid)
+        self.compute(grid)
+        self.assertEqual((grid._children[0].x, grid._children[0].y), (50, 50))
+
+    def test_custom_types(self):
+        loader = SpecLoader(types={"Node": Item})
+        item = loader.load({"type": "Node", "v_": 1, "w_": "=self.v_ + 1", "children": [{"type": "Item"}]})
+        root = Item(root=True)
+        root.add_child(item)
+        root.compute()
+        self.assertEqual(item.w_, 2)
+        with self.assertRaises(SpecError):
+            loader.load({"type": "Unknown"})
+        with self.assertRaises(SpecError):
+            loader.load({"v_": 1})
+
+
+    def test_types_without_prototype(self):
+        loader = SpecLoader(types={"Labelled": _Labelled, "Broken": _Broken, "Rows": _Rows, "QListView": QListView})
+        item = loader.load({"type": "Labelled", "label": "a", "v_": 1})
+        self.assertEqual((item.label, item.v_), ("a", 1))
+        self.assertEqual(item.built, 1)
+        self.assertIsNone(loader._prototypes[_Labelled])
+        # an error inside a constructor is not mistaken for required arguments
+        with self.assertRaisesRegex(TypeError, "broken"):
+            loader.load({"type": "Broken"})
+        rows = loader.load({"type": "Rows", "row_count": 3})
+        self.assertIsInstance(rows, _Rows)
+        self.assertIsNone(loader._prototypes[_Rows])
+        with self.assertRaisesRegex(AssertionError, "requires a delegate"):
+            loader.load({"type": "QListView"})
+
+
+if __name__ == "__main__":
+    unittest.main()
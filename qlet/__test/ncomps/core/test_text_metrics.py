@@ -0,0 +1,50 @@
+import unittest
+
+from qlet.ncomps.core.text_metrics import FontMetrics
+
+
+class TestTextMetrics(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # every character is 0.5em wide, lines are 1em high
+        self.metrics = FontMetrics(lambda _: 0.5, line_height=1.0, italic_overhang=0.25)
+
+    def test_measure(self):
+        self.assertEqual(self.metrics.measure("abcd", 10), (20, 10, 1))
+        self.assertEqual(self.metrics.measure("abcd\nab", 10), (20, 20, 2))
+        self.assertEqual(self.metrics.measure("abcd", 10, True), (22.5, 10, 1))
+        self.assertEqual(self.metrics.measure("", 10), (0, 10, 1))
+
+    def test_wrap(self):
+        # "aa bb cc" at size 10: words are 10 wide, spaces 5 wide
+        self.assertEqual(self.metrics.measure("aa bb cc", 10, False, 20), (10, 30, 3))
+        self.assertEqual(self.metrics.measure("aa bb cc", 10, False, 25), (25, 20, 2))
+        self.assertEqual(self.metrics.measure("aa bb cc", 10, False, 40), (40, 10, 1))
+        # a word longer than the line is broken
+        self.assertEqual(self.metrics.measure("abcdefgh", 10, False, 20), (20, 20, 2))
+        # wrapping at the width of the text keeps it on one line
+        width = self.metrics.measure("aa bb cc", 7.3).width
+        self.assertEqual(self.metrics.measure("aa bb cc", 7.3, False, width).line_count, 1)
+
+    def test_cached(self):
+        self.metrics.measure("abcd", 10)
+        self.metrics.measure("abcd", 10)
+        self.metrics.measure("abcd", 10, False, 100)
+        info = self.metrics.measure.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_fit(self):
+        self.assertEqual(self.metrics.fit("abcd", 100, 100, False, False), 50)
+        self.assertEqual(self.metrics.fit("abcd", 1000, 30, False, False), 30)
+        # wrapped on two lines of two characters
+        self.assertEqual(self.metrics.fit("ab ab", 50, 100), 50)
+        self.assertEqual(self.metrics.fit("abcd", 0, 0), 1)
+        size = self.metrics.fit("some longer text to fit", 120, 45)
+        extent = self.metrics.measure("some longer text to fit", size, False, 120)
+        self.assertLessEqual(extent.height, 45)
+        self.assertGreater(self.metrics.measure("some longer text to fit", size + 1, False, 120).height, 45)
+
+    def test_approximate(self):
+        metrics = FontMetrics.approximate()
+        self.assertLess(metrics.line_width("iiii", 14), metrics.line_width("mmmm", 14))
+        self.assertAlmostEqual(metrics.measure("Hello", 14).height, 14 * 1.17)
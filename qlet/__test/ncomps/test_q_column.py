@@ -0,0 +1,21 @@
+import unittest
+
+from qlet.ncomps.q_column import QColumn
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class TestQColumn(unittest.TestCase):
+
+    def test_layout(self):
+        root = QRootItem()
+        column = QColumn(width=100, height=lambda d: d.parent.height, spacing=5)
+        root.add_child(column)
+        root.height = 200
+        header, body = QItem(height=30), QItem()
+        column.add_child(header)
+        column.add_child(body, stretch=1)
+        root.compute()
+        self.assertEqual(body.y, 35)
+        self.assertEqual(body.height, 165)
+        self.assertEqual(body.global_y, 35)
@@ -0,0 +1,72 @@
+import unittest
+
+from qlet.ncomps.q_grid import GridTrack, QGrid
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class TestQGrid(unittest.TestCase):
+
+    def make_grid(self, **kwargs) -> tuple[QRootItem, QGrid]:
+        root = QRootItem()
+        grid = QGrid(width=lambda d: d.parent.width, height=lambda d: d.parent.height, **kwargs)
+        root.add_child(grid)
+        root.width = 310
+        root.height = 200
+        return root, grid
+
+    def geometry(self, item: QItem) -> tuple:
+        return item.x, item.y, item.width, item.height
+
+    def test_parse_tracks(self):
+        self.assertEqual(GridTrack.parse(100), GridTrack.fixed(100))
+        self.assertEqual(GridTrack.parse("2fr"), GridTrack.fraction(2))
+        self.assertEqual(GridTrack.parse("fr"), GridTrack.fraction(1))
+        self.assertEqual(GridTrack.parse("auto"), GridTrack.auto())
+        with self.assertRaises(ValueError):
+            GridTrack.parse("wide")
+
+    def test_tracks(self):
+        root, grid = self.make_grid(
+            row_tracks=["auto", "1fr"],
+            column_tracks=[100, "1fr", "2fr"],
+            column_spacing=5,
+        )
+        header, side, a, b = QItem(implicit_height=30), QItem(), QItem(), QItem()
+        grid.add_child(header, row=0, column=0, column_span=3)
+        grid.add_child(side, row=0, column=0, row_span=2)
+        grid.add_child(a, row=1, column=1)
+        grid.add_child(b, row=1, column=2)
+        root.width = 410
+        root.compute()
+        # the header spans several columns but a single (auto) row
+        self.assertEqual(self.geometry(header), (0, 0, 410, 30))
+        self.assertEqual(self.geometry(side), (0, 0, 100, 200))
+        self.assertEqual(self.geometry(a), (105, 30, 100, 170))
+        self.assertEqual(self.geometry(b), (210, 30, 100 * 2, 170))
+        self.assertEqual(b.global_x, 210)
+
+    def test_resize(self):
+        root, grid = self.make_grid(row_tracks=["1fr"] * 2, column_tracks=["1fr"] * 2)
+        cells = [QItem() for _ in range(4)]
+        for index, cell in enumerate(cells):
+            grid.add_child(cell, row=index // 2, column=index % 2)
+        root.compute()
+        self.assertEqual(self.geometry(cells[3]), (155, 100, 155, 100))
+        root.width = 400
+        root.compute()
+        self.assertEqual(self.geometry(cells[3]), (200, 100, 200, 100))
+        # rows are unchanged, so the y of the cells is not rewritten
+        rule = cells[3]._get_property("y")._f_value
+        root.width = 500
+        root.compute()
+        self.assertIs(cells[3]._get_property("y")._f_value, rule)
+
+    def test_remove_child(self):
+        root, grid = self.make_grid()
+        child = QItem()
+        grid.add_child(child)
+        root.compute()
+        grid.remove_child(child)
+        root.compute()
+        self.assertEqual(grid._cells, {})
@@ -0,0 +1,28 @@
+import unittest
+
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_grid_view import QGridView
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class TestQGridView(unittest.TestCase):
+
+    def test_only_visible_cells_materialized(self):
+        root = QRootItem()
+        view = QGridView(
+            width=250, height=100, item_count=10_000, cell_width=50, cell_height=50, overscan=1,
+            delegate=lambda index: QItem(index_=index),
+            bind=lambda item, index: setattr(item, "index_", index),
+        )
+        root.add_child(view)
+        root.compute()
+        self.assertEqual(view.columns, 5)
+        self.assertEqual(view.materialized_indices, list(range(0, 20)))
+        cell = view._materialized[7]
+        self.assertEqual((cell.x, cell.y), (100, 50))
+
+        view.scroll_offset = 1000
+        root.compute()
+        self.assertEqual(view.materialized_indices, list(range(95, 120)))
+        self.assertEqual(len(view._children), 25)
+        self.assertEqual(view._materialized[100].index_, 100)
@@ -0,0 +1,184 @@
+import unittest
+
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class TestQItemZOrder(unittest.TestCase):
+
+    def make_parent(self, zs: list[int]) -> tuple[QRootItem, QItem, list[QItem]]:
+        root = QRootItem()
+        parent = QItem(width=100, height=100)
+        root.add_child(parent)
+        children = [QItem(z=z) for z in zs]
+        parent.add_children(children)
+        root.compute()
+        return root, parent, children
+
+    def frame_order(self, parent: QItem) -> list[QItem]:
+        return [control.q_data() for control in parent._frame.controls]
+
+    def test_sorted_after_adding(self):
+        _, parent, children = self.make_parent([2, 0, 1])
+        self.assertEqual(self.frame_order(parent), [children[1], children[2], children[0]])
+        self.assertFalse(parent._z_order_outdated)
+
+    def test_sort_is_stable(self):
+        _, parent, children = self.make_parent([1, 0, 1, 0])
+        self.assertEqual(self.frame_order(parent), [children[1], children[3], children[0], children[2]])
+
+    def test_resorted_when_z_changes(self):
+        root, parent, children = self.make_parent([0, 1, 2])
+        children[0].z = 5
+        self.assertTrue(parent._z_order_outdated)
+        root.compute()
+        self.assertEqual(self.frame_order(parent), [children[1], children[2], children[0]])
+
+    def test_resorted_when_bound_z_changes(self):
+        root, parent, _ = self.make_parent([])
+        lower = QItem(z=1)
+        upper = QItem(z=lambda d: d.parent.width / 10)
+        parent.add_children([upper, lower])
+        root.compute()
+        self.assertEqual(self.frame_order(parent), [lower, upper])
+        parent.width = 5
+        root.compute()
+        self.assertEqual(self.frame_order(parent), [upper, lower])
+
+    def test_not_sorted_without_changes(self):
+        root, parent, children = self.make_parent([1, 0])
+        parent._frame.controls.reverse()
+        root.compute()
+        # nothing changed, so the (tampered) order is kept
+        self.assertEqual(self.frame_order(parent), [children[0], children[1]])
+
+
+class LeanItem(QItem):
+    RENDER_MODE = "lean"
+
+
+class TestQItemLean(unittest.TestCase):
+
+    def test_single_positioned_container(self):
+        root = QRootItem()
+        parent = LeanItem(x=10, y=20, width=100, height=50, padding=5, padding_left=8)
+        child = LeanItem(x=3, y=4, width=10, height=10)
+        parent.add_child(child)
+        root.add_child(parent)
+        root.compute()
+
+        container = parent._root_component
+        self.assertIs(container, parent._content_container)
+        self.assertEqual(container.content, parent._frame)
+        self.assertEqual((container.left, container.top), (18, 25))
+        self.assertEqual((container.width, container.height), (87, 40))
+        self.assertEqual(parent._frame.controls, [child._root_component])
+        self.assertEqual((child._root_component.left, child._root_component.top), (3, 4))
+
+    def test_follows_geometry(self):
+        root = QRootItem()
+        item = LeanItem(width=lambda d: d.parent.width / 2, height=10)
+        root.add_child(item)
+        root.width = 200
+        root.compute()
+        self.assertEqual(item._root_component.width, 100)
+        root.width = 300
+        root.compute()
+        self.assertEqual(item._root_component.width, 150)
+
+    def test_wrapped_effects_skipped(self):
+        root = QRootItem()
+        item = LeanItem(x=10, width=10, height=10)
+        root.add_child(item)
+        root.compute()
+        self.assertFalse(hasattr(item, "_l1_content_conainter"))
+
+    def test_lean_root(self):
+        root = QRootItem(render_mode="lean")
+        item = LeanItem(width=10, height=10)
+        root.add_child(item)
+        root.width = 200
+        root.compute()
+        self.assertIs(root._container, root._inner_container)
+        self.assertEqual(root._container.width, 200)
+        self.assertEqual(root._frame.controls, [item._root_component])
+        self.assertEqual(QRootItem().RENDER_MODE, "wrapped")
+
+
+class AbsoluteItem(QItem):
+    RENDER_MODE = "absolute"
+
+
+class TestQItemAbsolute(unittest.TestCase):
+
+    def test_positioned_in_parent_stack(self):
+        root = QRootItem()
+        item = AbsoluteItem(x=10, y=20, width=100, height=50, padding=5, padding_left=8)
+        root.add_child(item)
+        root.compute()
+        stack, content = item._root_component, item._l1_content_tr_pointer
+        self.assertEqual((stack.left, stack.top, stack.width, stack.height), (10, 20, 100, 50))
+        self.assertEqual((content.left, content.top, content.width, content.height), (8, 5, 87, 40))
+        self.assertEqual(stack.controls, [content])
+        self.assertIs(content.content, item._content_container)
+
+    def test_parent_resize_does_not_touch_children(self):
+        root = QRootItem()
+        parent = AbsoluteItem(width=lambda d: d.parent.width, height=100)
+        child = AbsoluteItem(x=10, y=10, width=20, height=20)
+        parent.add_child(child)
+        root.add_child(parent)
+        root.width = 200
+        root.compute()
+        root._take_dirty_controls()
+
+        root.width = 300
+        root.compute()
+        self.assertIn(parent, root._dirty_items)
+        self.assertNotIn(child, root._dirty_items)
+        self.assertEqual(parent._root_component.width, 300)
+
+    def test_root_uses_lean_tree(self):
+        root = QRootItem(render_mode="absolute")
+        self.assertIs(root._container, root._inner_container)
+
+
+class TestQItemSharedDefaults(unittest.TestCase):
+
+    def test_defaults_are_not_materialised(self):
+        item = QItem(opacity=1.0, padding=0)
+        self.assertNotIn("opacity", item._properties)
+        self.assertNotIn("padding", item._properties)
+        self.assertNotIn("scale_x", item._properties)
+        self.assertEqual((item.opacity, item.scale_x, item.visible), (1.0, None, True))
+
+    def test_untouched_defaults_have_no_property(self):
+        item = QItem()
+        self.assertTrue(QItem._SHARED_DEFAULTS.keys().isdisjoint(item._properties))
+        # the properties with rules (geometry, global position, ...) only
+        self.assertLessEqual(len(item._properties), 14)
+
+    def test_written_value(self):
+        item = QItem()
+        item.opacity = 0.5
+        self.assertEqual(item.opacity, 0.5)
+        self.assertEqual(item._root_component.opacity, 0.5)
+        item.opacity = 1.0
+        self.assertEqual(item._root_component.opacity, 1.0)
+
+    def test_default_required_by_a_property(self):
+        root = QRootItem()
+        item = QItem(width=10, height=10, padding_left=lambda d: d.padding + 1)
+        root.add_child(item)
+        root.width = 100
+        root.compute()
+        self.assertIn("padding", item._properties)
+        self.assertEqual(item.padding_left, 1)
+        item.padding = 4
+        item.align_x = 1
+        root.compute()
+        self.assertEqual((item.padding_left, item.x), (5, 95))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import flet as ft
+
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_list_view import QListView
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class TestQListView(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.created: list[int] = []
+        self.bound: list[int] = []
+
+    def delegate(self, index: int) -> QItem:
+        self.created.append(index)
+        return QItem(index_=index)
+
+    def bind(self, item: QItem, index: int) -> None:
+        self.bound.append(index)
+        item.index_ = index
+
+    def make_view(self, **kwargs) -> tuple[QRootItem, QListView]:
+        root = QRootItem()
+        view = QListView(width=200, height=100, delegate=self.delegate, **kwargs)
+        root.add_child(view)
+        root.compute()
+        return root, view
+
+    def test_only_visible_rows_materialized(self):
+        root, view = self.make_view(row_count=100_000, row_height=10, overscan=2)
+        self.assertEqual(view.materialized_indices, list(range(0, 13)))
+        self.assertEqual(len(view._children), 13)
+        self.assertEqual(view.content_height, 1_000_000)
+        row = view._materialized[5]
+        self.assertEqual((row.x, row.y, row.width, row.height), (0, 50, 200, 10))
+
+    def test_clips_content(self):
+        root, view = self.make_view(row_count=5)
+        self.assertEqual(view.clip_behaviour, ft.ClipBehavior.HARD_EDGE)
+        self.assertEqual(view._content_container.clip_behavior, ft.ClipBehavior.HARD_EDGE)
+
+    def test_scroll_rebinds_rows(self):
+        root, view = self.make_view(row_count=1000, row_height=10, overscan=0, bind=self.bind)
+        self.assertEqual(len(self.created), 11)
+        view.scroll_offset = 505
+        root.compute()
+        self.assertEqual(view.materialized_indices, list(range(50, 61)))
+        self.assertEqual(len(self.created), 11)
+        self.assertEqual(sorted(self.bound), list(range(50, 61)))
+        row = view._materialized[50]
+        self.assertEqual((row.index_, row.y), (50, -5))
+
+    def test_scroll_releases_rows_without_bind(self):
+        QItem.pool().clear()
+        root, view = self.make_view(row_count=1000, row_height=10, overscan=0)
+        view.scroll_by(50)
+        root.compute()
+        self.assertEqual(view.materialized_indices, list(range(5, 16)))
+        self.assertEqual(len(view._children), 11)
+        self.assertEqual(len(QItem.pool()), 5)
+
+    def test_scroll_offset_clamped(self):
+        root, view = self.make_view(row_count=20, row_height=10, overscan=0)
+        view.scroll_by(1000)
+        self.assertEqual(view.scroll_offset, 100)
+        view.scroll_to(0)
+        self.assertEqual(view.scroll_offset, 0)
+
+    def test_variable_row_heights(self):
+        heights = [10 if i % 2 == 0 else 30 for i in range(1000)]
+        root, view = self.make_view(row_count=1000, row_height=20, row_height_of=heights.__getitem__, overscan=0)
+        self.assertEqual(view.materialized_indices, list(range(0, 6)))
+        # only the rows up to the viewport are measured, the others are estimated
+        self.assertLess(len(view._tops), 10)
+        self.assertEqual(view.content_height, 20_000)
+        view.scroll_to(100)
+        root.compute()
+        self.assertEqual(view.scroll_offset, 2000)
+        self.assertEqual(view.materialized_indices[0], 100)
+        self.assertEqual(view._materialized[101].y, 10)
+
+    def test_resize_outdates_layout(self):
+        root, view = self.make_view(row_count=1000, row_height=10, overscan=0)
+        view.height = 200
+        root.compute()
+        self.assertEqual(view.materialized_indices, list(range(0, 21)))
@@ -0,0 +1,74 @@
+import unittest
+
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_rect import QRect
+from qlet.ncomps.q_root_item import QRootItem
+from qlet.ncomps.q_text import QText
+
+
+class LeanRect(QRect):
+    RENDER_MODE = "lean"
+
+
+class LeanText(QText):
+    RENDER_MODE = "lean"
+
+
+class TestQRectLean(unittest.TestCase):
+
+    def compute(self, item: QItem) -> QItem:
+        root = QRootItem()
+        root.add_child(item)
+        root.width = 1000
+        root.height = 1000
+        root.compute()
+        return item
+
+    def test_background_is_the_positioned_container(self):
+        rect = self.compute(LeanRect(
+            x=10, y=20, width=100, height=50, inset=2, padding=5, bgcolour="#FF0000", border_width=1,
+        ))
+        container = rect._root_component
+        self.assertIs(container, rect._bg_container)
+        self.assertEqual(container.bgcolor, "#FF0000")
+        self.assertEqual((container.left, container.top, container.width, container.height), (12, 22, 96, 46))
+        # the frame keeps its place, inside the padding of the item
+        padding = container.padding
+        self.assertEqual((padding.left, padding.top, padding.right, padding.bottom), (3, 3, 3, 3))
+        self.assertEqual(container.border.left.width, 1)
+
+    def test_text_covers_the_background(self):
+        text = self.compute(LeanText(text="hello", width=100, height=50, inset=2, padding=5))
+        self.assertIs(text._frame.controls[0], text._text_container)
+        box = text._text_container
+        self.assertEqual((box.left, box.top, box.width, box.height), (-3, -3, 96, 46))
+        self.assertEqual(text._ft_text.value, "hello")
+
+    def test_text_stays_below_children(self):
+        text = LeanText(text="hello", width=100, height=50)
+        child = QItem(z=-1, width=10, height=10)
+        text.add_child(child)
+        self.compute(text)
+        self.assertEqual(text._frame.controls, [text._text_container, child._root_component])
+
+
+class AbsoluteRect(QRect):
+    RENDER_MODE = "absolute"
+
+
+class TestQRectAbsolute(unittest.TestCase):
+
+    def test_background_positioned_at_insets(self):
+        root = QRootItem()
+        rect = AbsoluteRect(x=10, y=20, width=100, height=50, inset=2, inset_left=4, bgcolour="#FF0000")
+        root.add_child(rect)
+        root.compute()
+        bg = rect._l1_bg_tr_pointer
+        self.assertEqual(rect._root_component.controls, [bg, rect._l1_content_tr_pointer])
+        self.assertEqual((bg.left, bg.top, bg.width, bg.height), (4, 2, 94, 46))
+        self.assertIs(bg.content, rect._bg_container)
+        self.assertEqual(rect._bg_container.bgcolor, "#FF0000")
+
+
+if __name__ == "__main__":
+    unittest.main()
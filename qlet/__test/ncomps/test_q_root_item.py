@@ -0,0 +1,330 @@
+import asyncio
+import threading
+import unittest
+
+import flet as ft
+
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_list_view import QListView
+from qlet.ncomps.q_rect import QRect
+from qlet.ncomps.q_root_item import QRootItem
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.padding = None
+        self.updates: list[tuple[ft.Control, ...]] = []
+
+    def update(self, *controls: ft.Control) -> None:
+        self.updates.append(controls)
+
+    def add(self, control: ft.Control) -> None:
+        """ marks control and all it contains as sent, as page.add() would """
+        control.page = self
+        for child in control._get_children():
+            self.add(child)
+
+
+class TestQRootItemFlush(unittest.TestCase):
+
+    def make_root(self) -> tuple[QRootItem, QRect, QRect, _FakePage]:
+        root = QRootItem()
+        outer = QRect(width=100, height=100)
+        inner = QRect(width=20, height=20, bgcolour="#FF0000")
+        outer.add_child(inner)
+        root.add_child(outer)
+        root.width = 300
+        root.height = 300
+        root.compute()
+        page = _FakePage()
+        root._page = page
+        page.add(root._root_component)
+        root.flush()
+        page.updates.clear()
+        return root, outer, inner, page
+
+    def test_nothing_changed(self):
+        root, _, _, page = self.make_root()
+        root.compute()
+        root.flush()
+        self.assertEqual(page.updates, [])
+
+    def test_only_mutated_controls(self):
+        root, outer, inner, page = self.make_root()
+        inner.bgcolour = "#00FF00"
+        root.compute()
+        root.flush()
+        self.assertEqual(page.updates, [(inner._bg_container,)])
+        self.assertEqual(inner._bg_container.bgcolor, "#00FF00")
+
+    def test_single_update_per_flush(self):
+        root, outer, inner, page = self.make_root()
+        inner.bgcolour = "#00FF00"
+        outer.opacity = 0.5
+        root.compute()
+        root.flush()
+        self.assertEqual(len(page.updates), 1)
+        # the root component of outer contains the background of inner
+        self.assertEqual(page.updates[0], (outer._root_component,))
+
+    def test_moved_item_covers_its_children(self):
+        root, outer, inner, page = self.make_root()
+        outer.x = 50
+        inner.bgcolour = "#00FF00"
+        root.compute()
+        root.flush()
+        self.assertEqual(len(page.updates), 1)
+        # the background of outer moves too, but nothing of inner is sent twice
+        self.assertEqual(page.updates[0][0], outer._l1_content_conainter)
+        self.assertNotIn(outer._l2_content_tr_pointer, page.updates[0])
+        self.assertNotIn(inner._bg_container, page.updates[0])
+
+    def test_new_child_is_sent_with_its_parent_frame(self):
+        root, outer, inner, page = self.make_root()
+        new = QItem(width=10, height=10)
+        outer.add_child(new)
+        root.compute()
+        root.flush()
+        self.assertEqual(page.updates, [(outer._frame,)])
+        self.assertIn(new._root_component, outer._frame.controls)
+
+    def test_removed_item_is_not_sent(self):
+        root, outer, inner, page = self.make_root()
+        inner.bgcolour = "#00FF00"
+        outer.remove_child(inner)
+        root.compute()
+        root.flush()
+        self.assertEqual(len(page.updates), 1)
+        self.assertNotIn(inner._bg_container, page.updates[0])
+
+    def test_full_update_clears_pending_controls(self):
+        root, outer, inner, page = self.make_root()
+        inner.bgcolour = "#00FF00"
+        root.compute()
+        root._QRootItem__on_update_monitor(page.update)
+        page.updates.clear()
+        root.flush()
+        self.assertEqual(page.updates, [])
+
+
+
+class _LoggedItem(QItem):
+    def __init__(self, log: list, **kwargs) -> None:
+        self._log = log
+        super().__init__(**kwargs)
+
+    def _on_computed(self) -> None:
+        super()._on_computed()
+        self._log.append(self)
+
+
+class TestQRootItemProgressive(unittest.TestCase):
+
+    def make_root(self, log: list) -> tuple[QRootItem, QItem, QItem]:
+        root = QRootItem()
+        root.width = 100
+        root.height = 100
+        shown = QItem(width=100, height=100)
+        hidden = QItem(x=500, width=100, height=100)
+        for column in (hidden, shown):
+            column.add_children([_LoggedItem(log, y=row * 10, width=100, height=10) for row in range(20)])
+            root.add_child(column)
+        return root, shown, hidden
+
+    def test_on_screen_items_first(self):
+        log = []
+        root, shown, hidden = self.make_root(log)
+        asyncio.run(root.compute_progressive(frame_ms=1e3))
+        self.assertEqual(log, shown._children + hidden._children)
+        self.assertEqual(hidden._children[-1].global_y, 190)
+
+    def test_hidden_items_deferred(self):
+        root, shown, _ = self.make_root([])
+        root.compute()
+        shown.visible = False
+        self.assertTrue(root._outside_viewport(shown))
+        self.assertFalse(root._outside_viewport(shown._children[0]))
+
+    def test_each_slice_flushed(self):
+        root, _, _ = self.make_root([])
+        page = _FakePage()
+        root._page = page
+        page.add(root._root_component)
+        slices = asyncio.run(root.compute_progressive(frame_ms=0))
+        self.assertGreater(len(slices.durations), 1)
+        self.assertGreater(len(page.updates), 1)
+        self.assertLessEqual(len(page.updates), len(slices.durations))
+
+
+    def test_coordinator_passes_fold_into_it(self):
+        root, shown, _ = self.make_root([])
+        row = shown._children[0]
+        results = []
+
+        async def main():
+            task = asyncio.create_task(root.compute_progressive(frame_ms=0))
+            await asyncio.sleep(0)
+            root.coordinator.set(row, "height", 30)
+            results.append(root.coordinator.request_compute())
+            root.coordinator.call(root.animator.step)
+            await task
+
+        asyncio.run(main())
+        self.assertEqual(results, [False])
+        self.assertFalse(root.coordinator.busy)
+        self.assertEqual(root.coordinator.passes, 1)
+        self.assertEqual(shown._children[1].global_y, 10)
+        self.assertEqual(row.height, 30)
+
+    def test_other_threads_wait_for_it(self):
+        root, shown, _ = self.make_root([])
+        row = shown._children[0]
+
+        async def main():
+            task = asyncio.create_task(root.compute_progressive(frame_ms=0))
+            await asyncio.sleep(0)
+            worker = threading.Thread(target=root.coordinator.set, args=(row, "width", 50))
+            worker.start()
+            worker.join(5)
+            self.assertEqual(row.width, 100)
+            await task
+
+        asyncio.run(main())
+        self.assertEqual(row.width, 50)
+
+
+class TestQRootItemSpatialIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.root = QRootItem()
+        self.root.width = 1000
+        self.column = QItem(x=100, width=100, height=1000)
+        self.column.add_children([QItem(y=row * 50, width=100, height=50) for row in range(20)])
+        self.root.add_child(self.column)
+        self.root.compute()
+
+    def test_items_at(self):
+        rows = self.column._children
+        self.assertEqual(set(self.root.spatial_index.at(150, 75)), {self.column, rows[1]})
+        self.assertEqual(self.root.spatial_index.at(50, 75), [])
+        self.assertEqual(set(self.root.spatial_index.intersecting(0, 0, 150, 120)), {self.column, *rows[:3]})
+
+    def test_follows_geometry(self):
+        row = self.column._children[3]
+        self.assertIn(row, self.root.spatial_index.at(150, 175))
+        self.column.x = 500
+        row.height = 10
+        self.root.compute()
+        index = self.root.spatial_index
+        self.assertEqual(index.rect(row), (500, 150, 100, 10))
+        self.assertEqual(index.at(150, 175), [])
+        self.assertEqual(set(index.at(550, 155)), {self.column, row})
+
+    def test_added_and_removed_items(self):
+        index = self.root.spatial_index
+        item = QItem(x=800, y=800, width=10, height=10)
+        self.root.add_child(item)
+        self.root.remove_child(self.column)
+        self.root.compute()
+        self.assertEqual(self.root.spatial_index.at(805, 805), [item])
+        self.assertEqual(len(index), 1)
+
+    def test_other_roots_not_tracked(self):
+        index = self.root.spatial_index
+        other = QRootItem()
+        item = QItem(width=10, height=10)
+        other.add_child(item)
+        other.compute()
+        item.width = 20
+        other.compute()
+        self.assertIsNone(item._indexed_by)
+        self.assertIsNone(item._geometry_queued)
+        row = self.column._children[0]
+        self.column.remove_child(row)
+        other.add_child(row)
+        self.assertIsNone(row._indexed_by)
+        self.assertNotIn(row, self.root.spatial_index)
+        self.assertEqual(len(index), 20)
+
+
+class TestQRootItemCull(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.root = QRootItem(cull=True)
+        self.root.width = 100
+        self.root.height = 100
+        self.shown = QItem(width=50, height=50)
+        self.away = QItem(x=500, width=50, height=50)
+        self.away.add_child(QItem(width=10, height=10))
+        self.overflow = QItem(x=200, width=10, height=10)
+        self.overflowing = QItem(x=-150, width=10, height=10)
+        self.overflow.add_child(self.overflowing)
+        self.root.add_children([self.shown, self.away, self.overflow])
+        self.root.compute()
+
+    def test_offscreen_subtrees_hidden(self):
+        self.assertFalse(self.away._root_component.visible)
+        self.assertFalse(self.away._children[0]._culled)
+        self.assertNotEqual(self.shown._root_component.visible, False)
+        # a child drawn on screen keeps its parent shown
+        self.assertFalse(self.overflow._culled)
+        self.assertFalse(self.overflowing._culled)
+
+    def test_toggled_when_state_flips(self):
+        self.root._take_dirty_controls()
+        self.shown.width = 60
+        self.root.compute()
+        self.assertIsNone(self.away._dirty_controls)
+        self.away.x = 40
+        self.root.compute()
+        self.assertTrue(self.away._root_component.visible)
+        self.assertIn(self.away._root_component, self.away._dirty_controls)
+
+    def test_clipped_by_ancestor(self):
+        self.overflow.clip_behaviour = ft.ClipBehavior.HARD_EDGE
+        self.root.compute()
+        self.assertTrue(self.overflow._culled)
+        self.overflow.x = 60
+        self.root.compute()
+        self.assertFalse(self.overflow._culled)
+        self.assertTrue(self.overflowing._culled)
+
+    def test_visible_property_kept(self):
+        self.away.visible = False
+        self.away.x = 0
+        self.root.compute()
+        self.assertFalse(self.away._root_component.visible)
+        self.away.visible = True
+        self.assertTrue(self.away._root_component.visible)
+
+    def test_disabled(self):
+        self.root.cull = False
+        self.assertTrue(self.away._root_component.visible)
+        removed = QItem(x=500, width=10, height=10)
+        self.root.cull = True
+        self.root.add_child(removed)
+        self.root.compute()
+        self.root.remove_child(removed)
+        self.assertFalse(removed._culled)
+
+    def test_removed_from_nested_parent(self):
+        self.away.x = 0
+        self.away.add_child(QItem(x=500, width=10, height=10))
+        self.root.compute()
+        removed = self.away._children[1]
+        self.assertTrue(removed._culled)
+        self.away.remove_child(removed)
+        self.assertFalse(removed._culled)
+
+    def test_rows_clipped_by_list_view(self):
+        view = QListView(width=100, height=50, row_count=100, row_height=10, overscan=2,
+                         delegate=lambda index: QItem())
+        self.root.add_child(view)
+        self.root.compute()
+        self.assertEqual(view._content_container.clip_behavior, ft.ClipBehavior.HARD_EDGE)
+        rows = [view._materialized[index] for index in view.materialized_indices]
+        self.assertEqual([row._culled for row in rows], [False] * 5 + [True] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
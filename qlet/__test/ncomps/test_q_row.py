@@ -0,0 +1,79 @@
+import unittest
+
+from qlet.ncomps.q_item import QItem
+from qlet.ncomps.q_root_item import QRootItem
+from qlet.ncomps.q_row import QRow
+
+
+class TestQRow(unittest.TestCase):
+
+    def make_row(self, **kwargs) -> tuple[QRootItem, QRow]:
+        root = QRootItem()
+        row = QRow(width=lambda d: d.parent.width, height=50, **kwargs)
+        root.add_child(row)
+        root.width = 300
+        return root, row
+
+    def test_offsets(self):
+        root, row = self.make_row(spacing=10)
+        children = [QItem(width=20 * (i + 1)) for i in range(4)]
+        row.add_children(children)
+        root.compute()
+        self.assertEqual([child.x for child in children], [0, 30, 80, 150])
+        self.assertEqual(children[3].global_x, 150)
+
+    def test_offsets_follow_child_sizes(self):
+        root, row = self.make_row()
+        first, second = QItem(width=20), QItem(width=20)
+        row.add_children([first, second])
+        root.compute()
+        first.width = 50
+        root.compute()
+        self.assertEqual(second.x, 50)
+        self.assertEqual(second.global_x, 50)
+
+    def test_stretch(self):
+        root, row = self.make_row(spacing=10, padding=5)
+        fixed, one, two = QItem(width=50), QItem(), QItem()
+        row.add_child(fixed)
+        row.add_child(one, stretch=1)
+        row.add_child(two, stretch=2)
+        root.compute()
+        # 300 - 2 * 5 padding - 2 * 10 spacing - 50 = 220 free
+        self.assertAlmostEqual(one.width, 220 / 3)
+        self.assertAlmostEqual(two.width, 440 / 3)
+        self.assertAlmostEqual(two.x, 50 + 10 + 220 / 3 + 10)
+
+        root.width = 600
+        root.compute()
+        self.assertAlmostEqual(one.width, 520 / 3)
+
+    def test_min_max_size(self):
+        root, row = self.make_row()
+        one, two, three = QItem(), QItem(), QItem()
+        row.add_child(one, stretch=1, max_size=50)
+        row.add_child(two, stretch=1)
+        row.add_child(three, stretch=1, min_size=200)
+        root.compute()
+        self.assertEqual(one.width, 50)
+        self.assertEqual(three.width, 200)
+        self.assertEqual(two.width, 50)
+
+    def test_unchanged_offsets_not_written(self):
+        root, row = self.make_row()
+        first, second, filler = QItem(width=20), QItem(width=20), QItem()
+        row.add_children([first, second])
+        row.add_child(filler, stretch=1)
+        root.compute()
+        rule = second._get_property("x")._f_value
+        root.width = 500
+        root.compute()
+        self.assertEqual(filler.width, 460)
+        self.assertIs(second._get_property("x")._f_value, rule)
+
+    def test_invisible_children_skipped(self):
+        root, row = self.make_row()
+        first, hidden, last = QItem(width=20), QItem(width=20, visible=False), QItem(width=20)
+        row.add_children([first, hidden, last])
+        root.compute()
+        self.assertEqual(last.x, 20)
@@ -0,0 +1,46 @@
+import unittest
+
+from qlet.ncomps.core.text_metrics import measure_text
+from qlet.ncomps.q_root_item import QRootItem
+from qlet.ncomps.q_text import QText
+
+
+class TestQText(unittest.TestCase):
+
+    def compute(self, text: QText) -> QText:
+        root = QRootItem()
+        root.add_child(text)
+        root.width = 1000
+        root.height = 1000
+        root.compute()
+        return text
+
+    def test_implicit_size_from_text(self):
+        text = self.compute(QText(text="Hello, World!", inset=2, border_width=1))
+        extent = measure_text("Hello, World!", 14)
+        self.assertEqual(text.text_size, 14)
+        self.assertAlmostEqual(text.width, extent.width + 6)
+        self.assertAlmostEqual(text.height, extent.height + 6)
+
+        text.text = "Hello"
+        text.parent.compute()
+        self.assertAlmostEqual(text.width, measure_text("Hello", 14).width + 6)
+
+    def test_implicit_height_wraps(self):
+        text = self.compute(QText(text="one two three four five six", width=60))
+        self.assertGreater(text.height, measure_text("one", 14).height)
+
+    def test_text_fit(self):
+        text = self.compute(QText(text="fit", width=200, height=50, text_fit=True))
+        self.assertGreater(text.text_size, 14)
+        self.assertLessEqual(measure_text("fit", text.text_size, False, 200).height, 50)
+        self.assertGreater(measure_text("fit", text.text_size + 1, False, 200).height, 50)
+
+        text.height = 20
+        text.parent.compute()
+        self.assertLess(text.text_size, 20)
+
+    def test_text_fit_implicit_size(self):
+        # a fitted text sized by its content uses its natural size
+        text = self.compute(QText(text="fit", text_fit=True, text_natural_size=20))
+        self.assertEqual(text.text_size, 20)
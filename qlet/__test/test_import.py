@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import unittest
+
+
+def imports_flet(code: str) -> bool:
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint('flet' in sys.modules)"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return output.strip() == "True"
+
+
+class TestImport(unittest.TestCase):
+
+    def test_engine_without_flet(self):
+        self.assertFalse(imports_flet("import qlet.ncomps.core.item, qlet.ncomps.core.prototype"))
+
+    def test_lazy_public_api(self):
+        self.assertFalse(imports_flet("import qlet"))
+        self.assertTrue(imports_flet("from qlet import QItem"))
+        self.assertTrue(imports_flet("from qlet import *"))
+
+    def test_unknown_attribute(self):
+        import qlet
+        with self.assertRaises(AttributeError):
+            qlet.QNothing
+        self.assertIn("QText", dir(qlet))
+
+
+if __name__ == "__main__":
+    unittest.main()
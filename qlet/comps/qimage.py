@@ -26,5 +26,6 @@ class QImage(QItem):
     
     def _on_resized(self) -> None:
         super()._on_resized()
-        self._image.width = self.width
-        self._image.height = self.height
+        if (self._image.width, self._image.height) != (self.width, self.height):
+            self._image.width = self.width
+            self._image.height = self.height
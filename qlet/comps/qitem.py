@@ -4,6 +4,8 @@ from typing import Callable, Sequence
 import flet as ft
 from typing_extensions import Self
 
+from ..ncomps.core.resize_coalescer import DEFAULT_RESIZE_FPS, ResizeCoalescer
+
 __all__ = [
     "QAlign",
     "QAnchor",
@@ -270,13 +272,15 @@ class QItem:
 
         internal_container = self.root_component.content
         assert isinstance(internal_container, ft.Container)
-        internal_container.padding = ft.Padding(
-            left=-self.width / 2,
-            top=-self.height / 2,
-            right=-self.width / 2,
-            bottom=-self.height / 2,
-        )
-        internal_container.alignment = self.align
+        # the padding is created for this container, so it is updated in place
+        padding = internal_container.padding
+        padding.left = -self.width / 2
+        padding.top = -self.height / 2
+        padding.right = -self.width / 2
+        padding.bottom = -self.height / 2
+        if internal_container.alignment != self.align:
+            # the alignment may be shared (e.g. ft.alignment.center), so it is replaced instead
+            internal_container.alignment = self.align
         top_trans_container = internal_container.content
         assert isinstance(top_trans_container, ft.TransparentPointer)
         top_trans_container.width = self.width
@@ -284,6 +288,11 @@ class QItem:
 
     def _recalc_size(self) -> None:
         """ Recalculate or init the size of this item """
+        self._recalc_geometry()
+        self._on_resized()
+
+    def _recalc_geometry(self) -> None:
+        """ Recalculate the size and alignment of this item, without updating its children """
         ref_parent_width = self.ref_parent.width if self.ref_parent.width is not None else 0
         ref_parent_height = self.ref_parent.height if self.ref_parent.height is not None else 0
 
@@ -332,8 +341,6 @@ class QItem:
             self.width = ref_parent_width
             self.height = ref_parent_height
 
-        self._on_resized()
-
     def _add_child_item(self, item: Self) -> None:
         if item not in self.children:
             self.children.append(item)
@@ -365,7 +372,7 @@ class QItem:
         else:
             self._frame.controls.extend(comp)
 
-    def _add_to_page(self, page: ft.Page) -> None:
+    def _add_to_page(self, page: ft.Page, resize_fps: float | None = DEFAULT_RESIZE_FPS) -> None:
         self.width = page.width - page.padding * 2
         self.height = page.height - page.padding * 2
         self._init_internal_container()
@@ -375,12 +382,17 @@ class QItem:
             expand=True,
         ))
 
-        def on_resize(_: ft.ControlEvent) -> None:
-            self.width = page.width - page.padding * 2
-            self.height = page.height - page.padding * 2
+        def apply_size(width: float, height: float) -> None:
+            self.width = width - page.padding * 2
+            self.height = height - page.padding * 2
             self._on_resized()
             page.update()
 
+        coalescer = ResizeCoalescer(apply_size, max_fps=resize_fps)
+
+        def on_resize(_: ft.ControlEvent) -> None:
+            coalescer.submit(page.width, page.height)
+
         page.on_resize = on_resize
 
     def _on_resized(self) -> None:
@@ -390,8 +402,19 @@ class QItem:
             child.update_size()
 
     def update_size(self) -> None:
-        """ Recalculate and update the size of this item. """
-        self._recalc_size()
+        """
+        Recalculate and update the size of this item. If its size and alignment
+        are unchanged, neither its flet controls nor its children are updated.
+        """
+        geometry = (self.width, self.height, self.align)
+        self._recalc_geometry()
+        if (self.width, self.height, self.align) == geometry:
+            # children sized against another item may still change
+            for child in self.children:
+                if child.inited and child.ref_parent is not self:
+                    child.update_size()
+            return
+        self._on_resized()
         self._update_internal_container_on_size()
 
     @classmethod
@@ -399,13 +422,16 @@ class QItem:
             cls,
             page: ft.Page,
             colour: str = ft.colors.with_opacity(0, "#FFFFFF"),
+            resize_fps: float | None = DEFAULT_RESIZE_FPS,
     ) -> Self:
         """
         Puts an item on the page that expands to fill the page.
+        Page resizes are applied at most resize_fps times per second (None for no limit),
+        dropping intermediate sizes.
         Returns the item.
         """
         root_item = QItem(expand=True, colour=colour)
-        root_item._add_to_page(page)
+        root_item._add_to_page(page, resize_fps)
         root_item.inited = True
         return root_item
 
@@ -37,7 +37,11 @@ class QText(QItem):
 
     def _on_resized(self) -> None:
         if self._size_rel_height is not None:
-            self._text.size = self.height * self._size_rel_height
+            size = self.height * self._size_rel_height
         elif self._size_rel_width is not None:
-            self._text.size = self.width * self._size_rel_width
+            size = self.width * self._size_rel_width
+        else:
+            size = self._text.size
+        if self._text.size != size:
+            self._text.size = size
         super()._on_resized()
\ No newline at end of file
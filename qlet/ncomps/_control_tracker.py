@@ -0,0 +1,40 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import flet as ft
+
+
+if TYPE_CHECKING:
+    from .q_root_item import QRootItem
+
+
+class _ControlTracker:
+    """
+    Records the flet controls mutated by the handlers of an item, so that the
+    root item can send only them to the page (see ``QRootItem.flush()``).
+
+    Subclasses set ``_frame_chain``: the controls of the item that contain its
+    frame, outermost first. Updating one of them also updates the children.
+    """
+    _frame_chain: tuple[ft.Control, ...] = ()
+
+    # None while the item has nothing to send, or is not under a root item
+    _dirty_controls: set[ft.Control] | None = None
+
+    def _touch(self, control: ft.Control) -> None:
+        """ marks control as mutated since the last flush """
+        dirty = self._dirty_controls
+        if dirty is None:
+            root = self._tracking_root()
+            if root is None:
+                # not on a page yet, the control is sent when its ancestor is
+                return
+            dirty = self._dirty_controls = set()
+            root._dirty_items.append(self)
+        dirty.add(control)
+
+    def _tracking_root(self) -> QRootItem | None:
+        item = self
+        while item.parent is not None:
+            item = item.parent
+        return item if hasattr(item, "_dirty_items") else None
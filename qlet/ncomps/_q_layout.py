@@ -0,0 +1,42 @@
+from __future__ import annotations
+from typing import Any
+
+from .core.item import Item
+from .q_item import QItem
+
+
+class _QLayout(QItem):
+    """
+    Base of the containers that place their children themselves.
+
+    The children are placed once they have been computed, so their own sizes
+    are known, by ``_layout_children()`` in a single pass. If any child was
+    moved or resized, the children are computed once more to propagate the new
+    geometry to their offsprings.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        self._laying_out = False
+        super().__init__(*args, **kwargs)
+
+    def _layout_children(self) -> bool:
+        """ :returns: if any child was moved or resized """
+        raise NotImplementedError
+
+    @staticmethod
+    def _place(child: Item, name: str, value: Any) -> bool:
+        """ sets a property of child only if its value changes, :returns: if it changed """
+        if getattr(child, name) == value:
+            return False
+        setattr(child, name, value)
+        return True
+
+    def _on_children_computed(self) -> None:
+        super()._on_children_computed()
+        if self._laying_out:
+            return
+        if self._layout_children():
+            self._laying_out = True
+            try:
+                self._recompute_children()
+            finally:
+                self._laying_out = False
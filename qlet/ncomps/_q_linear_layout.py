@@ -0,0 +1,136 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from .core.item import Item
+from ._typing_shortcut import number, optional_number
+from .q_item import QItem
+from ._q_layout import _QLayout
+
+
+@dataclass(slots=True)
+class _LinearLayoutParams:
+    stretch: number = 0
+    min_size: optional_number = None
+    max_size: optional_number = None
+
+    def bound(self, size: number) -> number:
+        if self.max_size is not None and size > self.max_size:
+            size = self.max_size
+        if self.min_size is not None and size < self.min_size:
+            size = self.min_size
+        return size
+
+
+_DEFAULT_PARAMS = _LinearLayoutParams()
+
+
+class _QLinearLayoutDefaultVals(_QLayout.DEFAULT_VALUES):
+    default_spacing = 0
+
+
+class _QLinearLayout(_QLayout):
+    """
+    Base of the containers placing their children one after another along an
+    axis, by a single pass over their sizes instead of each child depending on
+    the previous one.
+
+    Children with a stretch factor share the space left by the others in
+    proportion to their factors (bounded by their min and max sizes), and their
+    size along the axis is written by the container. The others keep their own
+    size. Children are only written to when their offset or size changes.
+    """
+    DEFAULT_VALUES = _QLinearLayoutDefaultVals
+
+    # names of the properties along the main axis
+    _POSITION: str
+    _SIZE: str
+    _PADDING_START: str
+    _PADDING_END: str
+
+    @_QLayout.cached_classproperty
+    def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
+        return super()._RESERVED_PROPERTY_NAMES | {
+            "spacing",
+        }
+
+    def __init__(
+            self,
+            id: str | None,
+            children: Item | Sequence[Item],
+            spacing: number | Callable,
+            **kwargs
+    ) -> None:
+        self._layout_params: dict[Item, _LinearLayoutParams] = {}
+
+        super().__init__(id, children, **kwargs)
+
+        self.spacing: number = spacing
+
+    def add_child(
+            self,
+            new_child: QItem,
+            stretch: number = 0,
+            min_size: optional_number = None,
+            max_size: optional_number = None,
+    ) -> None:
+        """
+        :param stretch: share of the free space given to the child, its size is
+                        left to the child if 0.
+        :param min_size: lower bound of the size given to a stretched child.
+        :param max_size: upper bound of the size given to a stretched child.
+        """
+        super().add_child(new_child)
+        if stretch or min_size is not None or max_size is not None:
+            self._layout_params[new_child] = _LinearLayoutParams(stretch, min_size, max_size)
+
+    def remove_child(self, removed_child: QItem) -> None:
+        super().remove_child(removed_child)
+        self._layout_params.pop(removed_child, None)
+
+    def _layout_children(self) -> bool:
+        children = [child for child in self._children if child.visible]
+        if not children:
+            return False
+        sizes: dict[Item, number] = {}
+        stretched: list[tuple[Item, _LinearLayoutParams]] = []
+        free = (
+            getattr(self, self._SIZE)
+            - getattr(self, self._PADDING_START) - getattr(self, self._PADDING_END)
+            - self.spacing * (len(children) - 1)
+        )
+        for child in children:
+            params = self._layout_params.get(child, _DEFAULT_PARAMS)
+            if params.stretch > 0:
+                stretched.append((child, params))
+            else:
+                sizes[child] = getattr(child, self._SIZE)
+                free -= sizes[child]
+
+        # sizes bounded by min/max are settled first, the rest share what remains
+        while stretched:
+            unit = max(free, 0) / sum(params.stretch for _, params in stretched)
+            bounded = [
+                (child, params.bound(unit * params.stretch))
+                for child, params in stretched
+                if params.bound(unit * params.stretch) != unit * params.stretch
+            ]
+            if not bounded:
+                for child, params in stretched:
+                    sizes[child] = unit * params.stretch
+                break
+            for child, size in bounded:
+                sizes[child] = size
+                free -= size
+            settled = {child for child, _ in bounded}
+            stretched = [(child, params) for child, params in stretched if child not in settled]
+
+        changed = False
+        offset = 0
+        for child in children:
+            size = sizes[child]
+            changed |= self._place(child, self._POSITION, offset)
+            if child in self._layout_params:
+                changed |= self._place(child, self._SIZE, size)
+            offset += size + self.spacing
+        return changed
@@ -0,0 +1,178 @@
+from __future__ import annotations
+from typing import Callable, Sequence
+
+import flet as ft
+
+from .core.item import Item
+from ._typing_shortcut import number
+from .q_item import QItem
+
+
+class _QVirtualViewDefaultVals(QItem.DEFAULT_VALUES):
+    default_scroll_offset = 0
+    default_overscan = 2
+    default_clip_behaviour = ft.ClipBehavior.HARD_EDGE
+
+
+class _QVirtualView(QItem):
+    """
+    Base of the views that only materialize the children inside their viewport.
+
+    Subclasses decide which indices are visible and where each index is placed.
+    This class creates, recycles and places the children accordingly, once the
+    view itself has been computed, so the number of children (and flet
+    controls) is bounded by the viewport rather than by the number of rows.
+    """
+    DEFAULT_VALUES = _QVirtualViewDefaultVals
+    # a prototype would need a delegate, and share its materialized rows with its clones
+    SPEC_PROTOTYPE = False
+
+    @QItem.cached_classproperty
+    def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
+        return super()._RESERVED_PROPERTY_NAMES | {
+            "overscan",
+            "scroll_offset",
+        }
+
+    def __init__(
+            self,
+            id: str | None,
+            children: Item | Sequence[Item],
+            delegate: Callable[[int], QItem] | None,
+            bind: Callable[[QItem, int], None] | None,
+            scroll_offset: number | Callable,
+            overscan: int | Callable,
+            **kwargs
+    ) -> None:
+        assert delegate is not None, f"{self.__class__.__name__} requires a delegate"
+        self._delegate = delegate
+        self._bind = bind
+        self._materialized: dict[int, QItem] = {}
+        self._spare: list[QItem] = []
+        self._layout_outdated = True
+
+        super().__init__(id, children, **kwargs)
+
+        self.scroll_offset: number = scroll_offset
+        self.overscan: int = overscan
+
+    @property
+    def viewport_width(self) -> number:
+        return max(self.width - self.padding_left - self.padding_right, 0)
+
+    @property
+    def viewport_height(self) -> number:
+        return max(self.height - self.padding_top - self.padding_bottom, 0)
+
+    @property
+    def content_height(self) -> number:
+        """ total height of all the rows, estimated for rows not measured yet """
+        raise NotImplementedError
+
+    @property
+    def max_scroll_offset(self) -> number:
+        return max(self.content_height - self.viewport_height, 0)
+
+    @property
+    def materialized_indices(self) -> list[int]:
+        return sorted(self._materialized)
+
+    def scroll_by(self, delta: number) -> None:
+        self.scroll_offset = min(max(self.scroll_offset + delta, 0), self.max_scroll_offset)
+
+    def scroll_to(self, index: int) -> None:
+        """ scrolls so the row of index is at the top of the viewport (as far as possible) """
+        self.scroll_offset = min(max(self._index_top(index), 0), self.max_scroll_offset)
+
+    def reload(self) -> None:
+        """
+        Rebinds (or recreates without ``bind``) all materialized children on the
+        next compute, e.g. after the underlying data changed.
+        """
+        for item in self._materialized.values():
+            self._recycle(item)
+        self._materialized.clear()
+        self._outdate_layout()
+
+    def _index_top(self, index: int) -> number:
+        raise NotImplementedError
+
+    def _visible_indices(self) -> range:
+        """ :returns: the indices to materialize, overscan included """
+        raise NotImplementedError
+
+    def _placement(self, index: int) -> tuple[number, number, number, number]:
+        """ :returns: x, y, width and height of the child of index """
+        raise NotImplementedError
+
+    def _clamped_scroll_offset(self) -> number:
+        return min(max(self.scroll_offset, 0), self.max_scroll_offset)
+
+    def _outdate_layout(self) -> None:
+        self._layout_outdated = True
+
+    def _on_scroll_offset_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_overscan_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_width_change(self) -> None:
+        super()._on_width_change()
+        self._outdate_layout()
+
+    def _on_height_change(self) -> None:
+        super()._on_height_change()
+        self._outdate_layout()
+
+    def _on_padding_left_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_padding_top_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_padding_right_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_padding_bottom_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_computed(self) -> None:
+        super()._on_computed()
+        if self._layout_outdated:
+            self._layout_outdated = False
+            self._layout()
+
+    def _layout(self) -> None:
+        visible = self._visible_indices()
+        for index in [i for i in self._materialized if i not in visible]:
+            self._recycle(self._materialized.pop(index))
+        for index in visible:
+            item = self._materialized.get(index)
+            if item is None:
+                item = self._materialize(index)
+                self._materialized[index] = item
+            x, y, width, height = self._placement(index)
+            item.x = x
+            item.y = y
+            item.width = width
+            item.height = height
+        for item in self._spare:
+            item.visible = False
+
+    def _materialize(self, index: int) -> QItem:
+        if self._spare:
+            item = self._spare.pop()
+            item.visible = True
+            self._bind(item, index)
+            return item
+        item = self._delegate(index)
+        self.add_child(item)
+        return item
+
+    def _recycle(self, item: QItem) -> None:
+        """ keeps item for another index if it can be rebound, otherwise releases it to its pool """
+        if self._bind is not None:
+            self._spare.append(item)
+        else:
+            item.release()
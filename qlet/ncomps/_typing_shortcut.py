@@ -1,4 +1,8 @@
+from .core.colour import QColour
+
+
 __all__ = [
+    "colour",
     "number",
     "optional_number",
 ]
@@ -6,3 +10,4 @@ __all__ = [
 
 number = int | float
 optional_number = int | float | None
+colour = str | QColour
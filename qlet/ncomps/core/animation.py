@@ -0,0 +1,326 @@
+"""
+Animations of numeric item properties.
+
+An ``Animator`` drives all the running animations of a tree with one clock:
+each frame evaluates every animation in a single pass, writes the values that
+changed and commits them once (for a ``QRootItem``: one compute and one flush),
+so a frame only recomputes the dependents of the animated properties.
+"""
+from __future__ import annotations
+import bisect
+import math
+import threading
+import time
+from typing import Any, Callable, Iterable, Mapping, TYPE_CHECKING
+
+from .resize_coalescer import _daemon_timer, _Timer
+
+
+if TYPE_CHECKING:
+    from .item import Item
+
+
+__all__ = [
+    "Animator", "Animation", "Tween", "Keyframes", "Spring",
+    "Easing", "linear", "ease_in", "ease_out", "ease_in_out",
+    "DEFAULT_ANIMATION_FPS",
+]
+
+
+DEFAULT_ANIMATION_FPS = 60
+
+Easing = Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in(t: float) -> float:
+    return t * t * t
+
+
+def ease_out(t: float) -> float:
+    t = 1 - t
+    return 1 - t * t * t
+
+
+def ease_in_out(t: float) -> float:
+    if t < 0.5:
+        return 4 * t * t * t
+    t = 2 - 2 * t
+    return 1 - t * t * t / 2
+
+
+class Animation:
+    """ an animation of a single property, created by an Animator """
+    __slots__ = ("item", "name", "on_done", "_finished")
+
+    def __init__(self, item: Item, name: str, on_done: Callable[[], Any] | None) -> None:
+        self.item = item
+        self.name = name
+        self.on_done = on_done
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """ whether the animation completed or was cancelled """
+        return self._finished
+
+    def _value(self, now: float) -> tuple[float, bool]:
+        """ :returns: the value at now, and whether the animation is over """
+        raise NotImplementedError
+
+
+class Keyframes(Animation):
+    """
+    Goes through values at offsets (0 to 1) of the duration, easing each
+    segment with the easing of the keyframe it ends at.
+    """
+    __slots__ = ("_start", "_duration", "_offsets", "_values", "_easings")
+
+    def __init__(
+            self, item: Item, name: str, frames: Iterable[tuple[float, float, Easing]],
+            start: float, duration: float, on_done: Callable[[], Any] | None = None,
+    ) -> None:
+        super().__init__(item, name, on_done)
+        frames = sorted(frames, key=lambda frame: frame[0])
+        assert frames and frames[0][0] == 0 and frames[-1][0] == 1, "keyframes must span offsets 0 to 1"
+        self._start = start
+        self._duration = duration
+        self._offsets = [offset for offset, _, _ in frames]
+        self._values = [value for _, value, _ in frames]
+        self._easings = [easing for _, _, easing in frames]
+
+    def _value(self, now: float) -> tuple[float, bool]:
+        if self._duration <= 0:
+            progress = 1.0 if now >= self._start else 0.0
+        else:
+            progress = min(max((now - self._start) / self._duration, 0.0), 1.0)
+        if progress >= 1:
+            return self._values[-1], True
+        end = bisect.bisect_right(self._offsets, progress)
+        begin = end - 1
+        span = self._offsets[end] - self._offsets[begin]
+        eased = self._easings[end]((progress - self._offsets[begin]) / span)
+        return self._values[begin] + (self._values[end] - self._values[begin]) * eased, False
+
+
+class Tween(Keyframes):
+    """ goes from one value to another over a duration """
+    __slots__ = ()
+
+    def __init__(
+            self, item: Item, name: str, start_value: float, end_value: float,
+            start: float, duration: float, easing: Easing = ease_in_out,
+            on_done: Callable[[], Any] | None = None,
+    ) -> None:
+        super().__init__(
+            item, name, ((0, start_value, linear), (1, end_value, easing)), start, duration, on_done,
+        )
+
+
+class Spring(Animation):
+    """ a damped spring pulling the value to a target, until it settles """
+    __slots__ = ("target", "_stiffness", "_damping", "_mass", "_precision", "_position", "_velocity", "_time")
+
+    # integration step in seconds, frames longer than that are integrated in several steps
+    STEP = 1 / 240
+
+    def __init__(
+            self, item: Item, name: str, start_value: float, target: float, start: float,
+            stiffness: float = 170, damping: float = 26, mass: float = 1, velocity: float = 0,
+            precision: float = 0.01, on_done: Callable[[], Any] | None = None,
+    ) -> None:
+        super().__init__(item, name, on_done)
+        assert stiffness > 0 and mass > 0 and damping >= 0
+        self.target = target
+        self._stiffness = stiffness
+        self._damping = damping
+        self._mass = mass
+        self._precision = precision
+        self._position = start_value
+        self._velocity = velocity
+        self._time = start
+
+    def _value(self, now: float) -> tuple[float, bool]:
+        steps = math.ceil((now - self._time) / self.STEP) if now > self._time else 0
+        if steps:
+            dt = (now - self._time) / steps
+            position, velocity = self._position, self._velocity
+            for _ in range(steps):
+                force = -self._stiffness * (position - self.target) - self._damping * velocity
+                velocity += force / self._mass * dt
+                position += velocity * dt
+            self._position, self._velocity, self._time = position, velocity, now
+        if abs(self._position - self.target) < self._precision and abs(self._velocity) < self._precision:
+            return self.target, True
+        return self._position, False
+
+
+class Animator:
+    """
+    Runs animations of item properties on a single clock. While animations
+    are running, a timer calls step() ``fps`` times per second.
+    An animation of a property replaces the one already running on it.
+    """
+
+    def __init__(
+            self,
+            commit: Callable[[], Any],
+            run: Callable[[Callable[[], Any]], Any] = lambda step: step(),
+            fps: float = DEFAULT_ANIMATION_FPS,
+            clock: Callable[[], float] = time.monotonic,
+            timer: Callable[[float, Callable[[], None]], _Timer] = _daemon_timer,
+    ) -> None:
+        """
+        :param commit: called once per frame after the values are written, e.g. compute and flush.
+        :param run: runs a frame where the tree may be written, e.g. ``coordinator.call``.
+        :param fps: frames per second.
+        :param clock: monotonic time in seconds.
+        :param timer: creates a timer calling its callback once after a delay in seconds.
+        """
+        assert fps > 0, f"Invalid fps: {fps}"
+        self._commit = commit
+        self._run = run
+        self._interval = 1 / fps
+        self._clock = clock
+        self._timer_factory = timer
+        self._lock = threading.Lock()
+        self._animations: dict[tuple[int, str], Animation] = {}
+        self._timer: _Timer | None = None
+        self._frames = 0
+
+    @property
+    def running(self) -> int:
+        """ number of running animations """
+        return len(self._animations)
+
+    @property
+    def frames(self) -> int:
+        """ number of frames stepped """
+        return self._frames
+
+    def tween(
+            self, item: Item, name: str, to: float, duration: float, easing: Easing = ease_in_out,
+            start_value: float | None = None, delay: float = 0, on_done: Callable[[], Any] | None = None,
+    ) -> Tween:
+        """
+        Animates item.<name> to the value to over duration seconds.
+
+        :param start_value: the current value of the property if None.
+        """
+        start_value = getattr(item, name) if start_value is None else start_value
+        return self.__add(Tween(item, name, start_value, to, self._clock() + delay, duration, easing, on_done))
+
+    def keyframes(
+            self, item: Item, name: str, frames: Mapping[float, float | tuple[float, Easing]],
+            duration: float, delay: float = 0, on_done: Callable[[], Any] | None = None,
+    ) -> Keyframes:
+        """
+        Animates item.<name> through values at offsets of the duration, e.g.
+        ``{0: 0, 0.3: (100, ease_out), 1: 50}``. Segments without an easing are linear.
+        """
+        normalised = [
+            (offset, *(value if isinstance(value, tuple) else (value, linear)))
+            for offset, value in frames.items()
+        ]
+        return self.__add(Keyframes(item, name, normalised, self._clock() + delay, duration, on_done))
+
+    def spring(
+            self, item: Item, name: str, to: float, stiffness: float = 170, damping: float = 26,
+            mass: float = 1, velocity: float | None = None, on_done: Callable[[], Any] | None = None,
+    ) -> Spring:
+        """
+        Pulls item.<name> to the value to with a damped spring. A spring
+        replacing another spring keeps its velocity unless one is given.
+        """
+        running = self._animations.get((id(item), name))
+        if velocity is None:
+            velocity = running._velocity if isinstance(running, Spring) else 0
+        start_value = running._position if isinstance(running, Spring) else getattr(item, name)
+        return self.__add(Spring(
+            item, name, start_value, to, self._clock(), stiffness, damping, mass, velocity, on_done=on_done,
+        ))
+
+    def cancel(self, item: Item, name: str | None = None) -> None:
+        """ stops the animations of a property of item, or of all its properties, where they are """
+        with self._lock:
+            keys = [
+                key for key, animation in self._animations.items()
+                if animation.item is item and (name is None or key[1] == name)
+            ]
+            for key in keys:
+                self._animations.pop(key)._finished = True
+
+    def step(self, now: float | None = None) -> bool:
+        """
+        Writes the values of all animations at now (the clock if None), then
+        commits them once.
+
+        :returns: whether animations are still running.
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            animations = list(self._animations.values())
+        # a single pass over all the animations, before any write
+        values = [animation._value(now) for animation in animations]
+        finished: list[Animation] = []
+        for animation, (value, done) in zip(animations, values):
+            if getattr(animation.item, animation.name) != value:
+                setattr(animation.item, animation.name, value)
+            if done:
+                finished.append(animation)
+        with self._lock:
+            for animation in finished:
+                key = (id(animation.item), animation.name)
+                if self._animations.get(key) is animation:
+                    del self._animations[key]
+                animation._finished = True
+            running = bool(self._animations)
+        self._frames += 1
+        self._commit()
+        for animation in finished:
+            if animation.on_done is not None:
+                animation.on_done()
+        return running
+
+    def stop(self) -> None:
+        """ cancels all the animations and the timer """
+        with self._lock:
+            for animation in self._animations.values():
+                animation._finished = True
+            self._animations.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def __add(self, animation: Animation) -> Animation:
+        with self._lock:
+            replaced = self._animations.get((id(animation.item), animation.name))
+            if replaced is not None:
+                replaced._finished = True
+            self._animations[(id(animation.item), animation.name)] = animation
+            if self._timer is None:
+                self.__schedule(0)
+        return animation
+
+    def __schedule(self, delay: float) -> None:
+        """ starts the timer of the next frame, the lock must be held """
+        self._timer = self._timer_factory(delay, self.__on_timer)
+        self._timer.start()
+
+    def __on_timer(self) -> None:
+        started = self._clock()
+        try:
+            self._run(self.step)
+        except BaseException:
+            with self._lock:
+                self._timer = None
+            raise
+        with self._lock:
+            if not self._animations or self._timer is None:
+                # done, or stopped meanwhile
+                self._timer = None
+                return
+            self.__schedule(max(self._interval - (self._clock() - started), 0))
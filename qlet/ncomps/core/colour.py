@@ -1,48 +1,159 @@
-def rgb_val(colour: str, alpha_front: bool = True) -> tuple[int, int, int]:
-    if colour.startswith("#"):
-        colour = colour[1:]
-    if len(colour) == 8:
+from __future__ import annotations
+from functools import lru_cache
+
+
+# bound of the caches from colour strings to parsed colours
+COLOUR_CACHE_SIZE = 1024
+
+
+class QColour:
+    """
+    A colour packed into an int as 0xAARRGGBB (the layout of flet colour
+    strings), with its brightness and flet string computed once.
+
+    Colours are interned: parsing the same string, or packing the same value,
+    returns the same object without re-parsing it.
+    """
+    __slots__ = ("_value", "_brightness", "_hex")
+
+    def __init__(self, value: int) -> None:
+        assert 0 <= value <= 0xFFFFFFFF, f"Invalid colour: {value:#x}"
+        self._value = value
+        self._brightness = 0.299 * ((value >> 16) & 0xFF) + 0.587 * ((value >> 8) & 0xFF) + 0.114 * (value & 0xFF)
+        self._hex = f"#{value:08X}"
+
+    @staticmethod
+    def of(value: int) -> QColour:
+        """ :returns: the interned colour of a packed 0xAARRGGBB value """
+        return _intern(value)
+
+    @staticmethod
+    def rgba(r: int, g: int, b: int, a: int = 255) -> QColour:
+        return _intern((a << 24) | (r << 16) | (g << 8) | b)
+
+    @staticmethod
+    def parse(colour: str | QColour, alpha_front: bool = True) -> QColour:
+        """
+        :param colour: "#RRGGBB" or "#AARRGGBB" ("#RRGGBBAA" if not alpha_front).
+        """
+        if isinstance(colour, QColour):
+            return colour
         if alpha_front:
-            colour = colour[2:]
+            return _parse_flet(colour)
+        return _parse(colour, alpha_front)
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @property
+    def a(self) -> int:
+        return (self._value >> 24) & 0xFF
+
+    @property
+    def r(self) -> int:
+        return (self._value >> 16) & 0xFF
+
+    @property
+    def g(self) -> int:
+        return (self._value >> 8) & 0xFF
+
+    @property
+    def b(self) -> int:
+        return self._value & 0xFF
+
+    @property
+    def rgb(self) -> tuple[int, int, int]:
+        return self.r, self.g, self.b
+
+    @property
+    def brightness(self) -> float:
+        return self._brightness
+
+    @property
+    def hex(self) -> str:
+        """ the flet colour string of self, "#AARRGGBB" """
+        return self._hex
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, QColour) and other._value == self._value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+    def __repr__(self) -> str:
+        return f"QColour({self._hex})"
+
+
+@lru_cache(maxsize=COLOUR_CACHE_SIZE)
+def _intern(value: int) -> QColour:
+    return QColour(value)
+
+
+@lru_cache(maxsize=COLOUR_CACHE_SIZE)
+def _parse(colour: str, alpha_front: bool) -> QColour:
+    digits = colour[1:] if colour.startswith("#") else colour
+    if len(digits) == 8:
+        if alpha_front:
+            alpha, digits = digits[:2], digits[2:]
         else:
-            colour = colour[:6]
-    if len(colour) == 6:
-        return tuple(int(colour[i:i + 2], 16) for i in (0, 2, 4))
-    raise ValueError(f"Invalid colour: {colour}")
+            alpha, digits = digits[6:], digits[:6]
+    else:
+        alpha = "FF"
+    if len(digits) != 6:
+        raise ValueError(f"Invalid colour: {digits}")
+    try:
+        return _intern(int(alpha + digits, 16))
+    except ValueError:
+        raise ValueError(f"Invalid colour: {digits}") from None
+
+
+@lru_cache(maxsize=COLOUR_CACHE_SIZE)
+def _parse_flet(colour: str) -> QColour:
+    """ single argument parse, which the cache looks up faster """
+    return _parse(colour, True)
+
+
+def to_flet_colour(colour: str | QColour | None) -> str | None:
+    """ :returns: colour as accepted by flet controls """
+    if isinstance(colour, QColour):
+        return colour._hex
+    return colour
+
+
+def rgb_val(colour: str | QColour, alpha_front: bool = True) -> tuple[int, int, int]:
+    return QColour.parse(colour, alpha_front).rgb
 
 
-def alpha_val(colour: str) -> int:
-    if colour.startswith("#"):
-        colour = colour[1:]
-    if len(colour) == 8:
-        return int(colour[:2], 16)
-    return 255
+def alpha_val(colour: str | QColour) -> int:
+    return QColour.parse(colour).a
 
 
-def brightness(colour: str) -> float:
-    r, g, b = rgb_val(colour)
-    return 0.299 * r + 0.587 * g + 0.114 * b
+def brightness(colour: str | QColour) -> float:
+    if isinstance(colour, QColour):
+        return colour._brightness
+    return _parse_flet(colour)._brightness
 
 
-def contrast(colour1: str, colour2: str) -> float:
+def contrast(colour1: str | QColour, colour2: str | QColour) -> float:
     return abs(brightness(colour1) - brightness(colour2))
 
 
-def is_dark(colour: str) -> bool:
+def is_dark(colour: str | QColour) -> bool:
     return brightness(colour) < 128
 
 
-def is_light(colour: str) -> bool:
+def is_light(colour: str | QColour) -> bool:
     return brightness(colour) >= 128
 
 
-def is_contrast(colour1: str, colour2: str) -> bool:
+def is_contrast(colour1: str | QColour, colour2: str | QColour) -> bool:
     return contrast(colour1, colour2) >= 128
 
 
-def is_similar(colour1: str, colour2: str) -> bool:
+def is_similar(colour1: str | QColour, colour2: str | QColour) -> bool:
     return contrast(colour1, colour2) < 32
 
 
-def contrast_bw(colour: str) -> str:
+def contrast_bw(colour: str | QColour) -> str:
     return "#FFFFFF" if is_dark(colour) else "#000000"
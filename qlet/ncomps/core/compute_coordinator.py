@@ -0,0 +1,174 @@
+"""
+Serialized computes of an item tree.
+
+Flet runs event handlers on worker threads, so a resize and a data push may
+write properties and compute the same tree at the same time. A
+``ComputeCoordinator`` lets one thread at a time touch the tree: writes and
+compute requests arriving while the tree is busy are queued, and run by the
+busy thread before it releases the tree. Compute requests fold into a single
+follow-up pass, however many arrive.
+"""
+from __future__ import annotations
+import threading
+from collections import deque
+from typing import Any, Callable, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import asyncio
+    from .item import Item
+
+
+__all__ = ["ComputeCoordinator"]
+
+
+class ComputeCoordinator:
+    def __init__(self, compute: Callable[[], None]) -> None:
+        """
+        :param compute: a compute pass of the tree, e.g. ``root.compute``.
+        """
+        self._compute = compute
+        self._lock = threading.Lock()
+        self._busy = False
+        self._owner: int | None = None
+        self._queue: deque[Callable[[], Any]] = deque()
+        self._compute_requested = False
+        self._passes = 0
+        # async computes waiting for the tree, first come first served: (loop, future, thread)
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future, int]] = deque()
+
+    @property
+    def passes(self) -> int:
+        """ number of compute passes run """
+        return self._passes
+
+    @property
+    def busy(self) -> bool:
+        return self._busy
+
+    def set(self, item: Item, name: str, value: Any) -> None:
+        """ sets a property of an item of the tree, see call() """
+        self.call(setattr, item, name, value)
+
+    def call(self, function: Callable, *args: Any, **kwargs: Any) -> None:
+        """
+        Calls function now if the tree is free (or busy on this thread),
+        otherwise queues it to be called by the busy thread before its next pass.
+        """
+        def op() -> None:
+            function(*args, **kwargs)
+        with self._lock:
+            if self._busy:
+                if self._owner != threading.get_ident():
+                    self._queue.append(op)
+                    return
+                reentrant = True
+            else:
+                self._busy = True
+                self._owner = threading.get_ident()
+                reentrant = False
+        if reentrant:
+            op()
+        else:
+            self._drain(op)
+
+    def request_compute(self) -> bool:
+        """
+        Computes the tree now if it is free, otherwise requests a pass from the
+        busy thread. Requests made during a pass all fold into one more pass.
+
+        :returns: whether the pass ran on this thread.
+        """
+        with self._lock:
+            if self._busy:
+                self._compute_requested = True
+                return False
+            self._busy = True
+            self._owner = threading.get_ident()
+        self._drain(self._run_pass)
+        return True
+
+    def acquire(self) -> bool:
+        """
+        Marks the tree busy on this thread for work spanning several calls,
+        e.g. an async compute: calls from other threads are queued, and
+        compute requests folded into one pass, until release().
+
+        :returns: False if the tree is already busy.
+        """
+        with self._lock:
+            if self._busy:
+                return False
+            self._busy = True
+            self._owner = threading.get_ident()
+        return True
+
+    async def acquire_async(self) -> None:
+        """ same as acquire(), but waits for the tree to be released if it is busy """
+        # asyncio is only imported by async computes, it is slow to import
+        import asyncio
+        with self._lock:
+            if not self._busy:
+                self._busy = True
+                self._owner = threading.get_ident()
+                return
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future(), threading.get_ident())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except BaseException:
+            with self._lock:
+                handed = waiter not in self._waiters
+                if not handed:
+                    self._waiters.remove(waiter)
+            if handed:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """ runs the calls and the pass requested since acquire(), then frees the tree """
+        self._drain(_nothing)
+
+    def _run_pass(self) -> None:
+        self._passes += 1
+        self._compute()
+
+    def _drain(self, op: Callable[[], Any]) -> None:
+        """ runs op, then the queued writes and requested passes, then frees the tree """
+        try:
+            while True:
+                op()
+                with self._lock:
+                    if self._queue:
+                        op = self._queue.popleft()
+                    elif self._compute_requested:
+                        self._compute_requested = False
+                        op = self._run_pass
+                    else:
+                        self._free()
+                        return
+        except BaseException:
+            # the queue is kept for the next thread
+            with self._lock:
+                self._free()
+            raise
+
+    def _free(self) -> None:
+        """ hands the tree to the first waiting acquire_async(), or frees it, with the lock held """
+        if self._waiters:
+            loop, waiter, owner = self._waiters.popleft()
+            self._owner = owner
+            loop.call_soon_threadsafe(_wake, waiter)
+        else:
+            self._busy = False
+            self._owner = None
+
+
+def _nothing() -> None:
+    pass
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,56 @@
+"""
+Budgets and statistics of ``Item.compute_async()``, which splits a compute
+into slices so that the asyncio event loop is not blocked for its whole length.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from time import perf_counter
+
+
+__all__ = ["ComputeSlices"]
+
+
+@dataclass(slots=True)
+class ComputeSlices:
+    """ durations (in seconds) of the slices of a compute, and the properties evaluated """
+    durations: list[float] = field(default_factory=list)
+    evaluations: int = 0
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations)
+
+    @property
+    def longest(self) -> float:
+        return max(self.durations, default=0.0)
+
+
+class _SliceBudget:
+    """ the work a slice may do before yielding to the event loop """
+    __slots__ = ("_max_evaluations", "_max_seconds", "_started", "_evaluations", "total_evaluations")
+
+    def __init__(self, max_evaluations: int | None, max_ms: float | None) -> None:
+        assert max_evaluations is None or max_evaluations > 0
+        self._max_evaluations = max_evaluations
+        self._max_seconds = None if max_ms is None else max_ms / 1000
+        self._started = perf_counter()
+        self._evaluations = 0
+        self.total_evaluations = 0
+
+    def start(self) -> float:
+        """ starts a new slice, returns its start time """
+        self._started = perf_counter()
+        self._evaluations = 0
+        return self._started
+
+    def spend(self) -> bool:
+        """ counts a property evaluation, returns whether the slice is used up """
+        self._evaluations += 1
+        self.total_evaluations += 1
+        return self.exhausted()
+
+    def exhausted(self) -> bool:
+        return (
+            self._max_evaluations is not None and self._evaluations >= self._max_evaluations
+            or self._max_seconds is not None and perf_counter() - self._started >= self._max_seconds
+        )
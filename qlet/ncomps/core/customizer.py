@@ -1,13 +1,27 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
 from warnings import warn
 
 from .item import Item, _PARENT, _SELF
+from .prototype import Prototype
 
 class ItemCustomizer(ABC):
+    # if True, item() is called once to build a prototype, and each call clones it
+    # then sets the keyword arguments as properties of the clone
+    PROTOTYPE = False
+
+    _prototype: Prototype | None = None
+
     @abstractmethod
     def item(self, **kwargs) -> Item:
         pass
 
+    def prototype(self) -> Prototype:
+        """ the prototype built by item() without arguments, see PROTOTYPE """
+        if self._prototype is None:
+            self._prototype = Prototype(self.item())
+        return self._prototype
+
     def __call__(
             self,
             id: str | None = None,
@@ -16,7 +30,13 @@ class ItemCustomizer(ABC):
         if "adopt_id" in kwargs:
             warn("adopt_id should not be passed as a keyword argument.")
             del kwargs["adopt_id"]
-        item = self.item(**kwargs)
+        if self.PROTOTYPE:
+            item = self.prototype().clone()
+            for key, value in kwargs.items():
+                assert key in type(item)._RESERVED_PROPERTY_NAMES or key.endswith("_"), f"{key} is not a property"
+                setattr(item, key, value)
+        else:
+            item = self.item(**kwargs)
         assert item._adopt_id is None, "Item should not have been adopted yet."
         if id is not None:
             assert id not in {_PARENT, _SELF}
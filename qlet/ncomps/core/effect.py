@@ -0,0 +1,70 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+__all__ = ["effect"]
+
+
+_PARENT_PREFIX = "parent."
+
+# names of the parent properties any effect depends on, so that a property
+# change only looks for effects of the children if some effect may need it
+_PARENT_INPUTS: set[str] = set()
+
+
+@dataclass(frozen=True, slots=True)
+class _EffectDeclaration:
+    inputs: tuple[str, ...]
+    parent_inputs: tuple[str, ...]
+    when: Callable[[Any], bool] | None
+
+
+def effect(*inputs: str, when: Callable[[Any], bool] | None = None) -> Callable:
+    """
+    Declares a method of an item as an effect of some of its properties (or of
+    its parent's properties, as ``"parent.<name>"``).
+
+    An effect runs at most once per compute, after the properties of its item
+    are computed and before ``_on_computed()``, and only if at least one of its
+    inputs changed since it last ran. Every effect runs once after the item is
+    created and after it gets a new parent.
+
+    :param when: if given, the effect is skipped (and no longer pending) while
+                 ``when(item)`` is False.
+
+    Usage::
+
+        @effect("width", "parent.width")
+        def _apply_width(self) -> None:
+            ...
+    """
+    self_inputs = tuple(name for name in inputs if not name.startswith(_PARENT_PREFIX))
+    parent_inputs = tuple(name[len(_PARENT_PREFIX):] for name in inputs if name.startswith(_PARENT_PREFIX))
+
+    def decorator(method: Callable) -> Callable:
+        method._effect = _EffectDeclaration(self_inputs, parent_inputs, when)
+        _PARENT_INPUTS.update(parent_inputs)
+        return method
+
+    return decorator
+
+
+def _collect_effects(cls: type) -> dict[str, _EffectDeclaration]:
+    """ :returns: the effects of cls by method name, base classes first """
+    effects: dict[str, _EffectDeclaration] = {}
+    for klass in reversed(cls.__mro__):
+        for name, attribute in vars(klass).items():
+            declaration = getattr(attribute, "_effect", None)
+            if isinstance(declaration, _EffectDeclaration):
+                effects[name] = declaration
+    return effects
+
+
+def _index_effects(effects: dict[str, _EffectDeclaration], parent: bool) -> dict[str, tuple[str, ...]]:
+    """ :returns: the names of the effects by (parent) input """
+    index: dict[str, list[str]] = {}
+    for name, declaration in effects.items():
+        for input in (declaration.parent_inputs if parent else declaration.inputs):
+            index.setdefault(input, []).append(name)
+    return {input: tuple(names) for input, names in index.items()}
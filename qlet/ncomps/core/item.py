@@ -2,14 +2,22 @@ from __future__ import annotations
 from collections import deque
 from inspect import isfunction, ismethod
 from itertools import repeat
-from typing import Any, Callable, Iterable, Sequence
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, TYPE_CHECKING
+from weakref import ref
 
 from typing_extensions import Self
 
 from .cached_classproperty import cached_classproperty
+from .compute_slices import ComputeSlices, _SliceBudget
+from .effect import _PARENT_INPUTS, _EffectDeclaration, _collect_effects, _index_effects
 from .null_value import _NullValue
+from .pool import ItemPool
 
 
+if TYPE_CHECKING:
+    import asyncio
+
 __all__ = ["Item"]
 
 
@@ -21,6 +29,18 @@ _PARENT = "parent"
 _SELF = "self"
 
 _NULL = _NullValue()
+_DONE = object()
+
+# the property writes buffered for each tree whose compute_async() is suspended, by id of the root
+_SUSPENDED_COMPUTES: dict[int, list[tuple[Item, str, Any]]] = {}
+
+
+def _constant(value: Any) -> Callable[[ItemHandle], Any]:
+    """ wraps a constant value as a property definition """
+    return lambda _: value
+
+
+_CONSTANT_CODE = _constant(None).__code__
 
 
 class CircleException(Exception):
@@ -31,11 +51,51 @@ class CircleException(Exception):
 class Item:
     cached_classproperty = cached_classproperty
 
+    # if False, SpecLoader runs the constructor for each item instead of cloning a prototype of the class
+    SPEC_PROTOTYPE = True
+
     @cached_classproperty
     def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
         """ override to reserve keywords for properties. """
         return set()
 
+    @cached_classproperty
+    def _SHARED_DEFAULTS(cls) -> dict[str, Any]:
+        """
+        override to share constant defaults of properties between all instances:
+        writing a default (or an equal value of its type) creates no property,
+        until the property is written another value or required by another property.
+        Handlers do not run for shared defaults.
+        """
+        return {}
+
+    @cached_classproperty
+    def _SHARED_DEFAULT_RULES(cls) -> dict[str, Callable[[ItemHandle], Any]]:
+        return {name: _constant(value) for name, value in cls._SHARED_DEFAULTS.items()}
+
+    @cached_classproperty
+    def _EFFECTS(cls) -> dict[str, _EffectDeclaration]:
+        """ effects declared with ``@effect`` by this class and its bases, in declaration order """
+        return _collect_effects(cls)
+
+    @cached_classproperty
+    def _EFFECTS_BY_INPUT(cls) -> dict[str, tuple[str, ...]]:
+        return _index_effects(cls._EFFECTS, parent=False)
+
+    @cached_classproperty
+    def _EFFECTS_BY_PARENT_INPUT(cls) -> dict[str, tuple[str, ...]]:
+        return _index_effects(cls._EFFECTS, parent=True)
+
+    @cached_classproperty
+    def _POOL(cls) -> ItemPool:
+        """ the pool of released items of exactly this class """
+        return ItemPool(cls)
+
+    # True while a pooled item is being re-initialised, so subclasses can keep their flet controls
+    _reusing = False
+    # set while compute_async() is running on this item, until it finishes
+    _async_compute: asyncio.Event | None = None
+
     def __init__(
             self,
             id: str | None = None,
@@ -52,24 +112,18 @@ class Item:
         - constants do not end with '_'
         - variables end with '_'
         """
-        if id is None:
-            id = ""
-            displayed_name = f"{self.__class__.__name__}_{_id(self)}"
-        else:
-            displayed_name = id
-        assert id not in {_PARENT, _SELF}
-        assert not id.startswith('_'), f"id cannot start with '_': {id}"
-        assert not id.endswith('_'), f"id cannot end with '_': {id}"
-        assert not bool(id) or id.isidentifier(), f"id is not a valid identifier: {id}"
-
-        self._id = id
-        self._displayed_id = displayed_name
+        self._set_id(id)
         self._root = root
         self._adopt_id: str | None = None
         self._children: list[Item] = []
-        self._parent: Item | None = None
+        self._parent: ref[Item] | None = None
+        self._pending_effects: set[str] = set(type(self)._EFFECTS)
 
-        self._properties: dict[str, _ItemProperty] = {}
+        if not self._reusing:
+            self._properties: dict[str, _ItemProperty] = {}
+        else:
+            for key in [k for k in self._properties if k not in type(self)._RESERVED_PROPERTY_NAMES]:
+                self._properties.pop(key).unlink_outside(set())
 
         self._pedigree: _Pedigree = _Pedigree(self, {}, {})
         self._pedigree_up_to_date = root
@@ -82,6 +136,26 @@ class Item:
         for child in children:
             self.add_child(child)
 
+    def _set_id(self, id: str | None) -> None:
+        """ sets the id of an item not in a tree yet """
+        if id is None:
+            id = ""
+            displayed_name = f"{self.__class__.__name__}_{_id(self)}"
+        else:
+            displayed_name = id
+        assert id not in {_PARENT, _SELF}
+        assert not id.startswith('_'), f"id cannot start with '_': {id}"
+        assert not id.endswith('_'), f"id cannot end with '_': {id}"
+        assert not bool(id) or id.isidentifier(), f"id is not a valid identifier: {id}"
+
+        self._id = id
+        self._displayed_id = displayed_name
+
+    def _set_properties(self, properties: Mapping[str, Any]) -> None:
+        """ sets many properties at once, like as many setattr() calls """
+        for key, value in properties.items():
+            self.__set_key_val(key, value)
+
     @property
     def id(self) -> str:
         return self._id
@@ -98,7 +172,9 @@ class Item:
 
     @property
     def parent(self) -> Item | None:
-        return self._parent
+        if self._parent is None:
+            return None
+        return self._parent()
 
     def __add_property(self, key: str, value: Any) -> None:
         """ adds a new property to self """
@@ -108,7 +184,7 @@ class Item:
             assert key[-1] == '_', f"Self-defined values must end with '_': \"{key}\""
             assert key not in self._properties, "_add_property() is only responsible for new properties"
         if not isfunction(value):
-            self._properties[key] = _ItemProperty(key, value, lambda _: value, True)
+            self._properties[key] = _ItemProperty(key, value, _constant(value), True)
             self.__on_property_value_update(key)
         else:
             self._properties[key] = _ItemProperty(key, _NULL, value, False)
@@ -126,11 +202,32 @@ class Item:
             property.set_new_f_value(value)
 
     def __set_key_val(self, key: str, value: Any) -> None:
-        if key not in self._properties:
+        if _SUSPENDED_COMPUTES:
+            root = self
+            while root._parent is not None:
+                root = root._parent()
+            writes = _SUSPENDED_COMPUTES.get(_id(root))
+            if writes is not None:
+                # applied once the pass is over, see compute_async()
+                writes.append((self, key, value))
+                return
+        if key in self._properties:
+            self.__update_property(key, value)
+            return
+        default = type(self)._SHARED_DEFAULTS.get(key, _NULL)
+        if default is _NULL:
             self.__add_property(key, value)
-        else:
+        elif value is not default and (type(value) is not type(default) or value != default):
+            self.__materialise(key)
             self.__update_property(key, value)
 
+    def __materialise(self, key: str) -> _ItemProperty:
+        """ creates the property of a shared default """
+        property = self._properties[key] = _ItemProperty(
+            key, type(self)._SHARED_DEFAULTS[key], type(self)._SHARED_DEFAULT_RULES[key], True,
+        )
+        return property
+
     def __set_kwargs(self, **kwargs) -> None:
         for key, value in kwargs.items():
             self.__set_key_val(key, value)
@@ -152,11 +249,50 @@ class Item:
         )
         if not is_user_defined:
             return super().__getattribute__(name)
-        assert name in self._properties
-        return self._properties[name].value
+        property = self._properties.get(name)
+        if property is None:
+            defaults = type(self)._SHARED_DEFAULTS
+            assert name in defaults
+            return defaults[name]
+        return property.value
 
     def _get_property(self, name: str) -> _ItemProperty:
-        return self._properties[name]
+        property = self._properties.get(name)
+        if property is None:
+            property = self.__materialise(name)
+        return property
+
+    @classmethod
+    def pool(cls) -> ItemPool:
+        return cls._POOL
+
+    @classmethod
+    def acquire(cls, **kwargs) -> Self:
+        """
+        Same as constructing the item with kwargs, but reuses a released item of
+        this class if there is one.
+        """
+        return cls._POOL.acquire(**kwargs)
+
+    def release(self) -> None:
+        """
+        Removes self from its parent, removes its children and hands it to the
+        pool of its class. Self should not be used after release.
+        """
+        assert not self._root, "Root items cannot be released."
+        if self.parent is not None:
+            self.parent.remove_child(self)
+        for child in list(self._children):
+            self.remove_child(child)
+        type(self)._POOL.release(self)
+
+    def _reinit(self, **kwargs) -> None:
+        """ re-runs the constructor on a released item, keeping existing properties """
+        self._reusing = True
+        try:
+            self.__init__(**kwargs)
+        finally:
+            self._reusing = False
 
     def add_child(self, new_child: Item) -> None:
         for child in self._children:
@@ -165,8 +301,10 @@ class Item:
         new_child.__set_parent(self)
 
     def __set_parent(self, parent: Item) -> None:
-        assert self._parent is None, "An item can only have one parent in their life."
-        self._parent = parent
+        assert self._parent is None, "An item can only have one parent at a time."
+        self._parent = ref(parent)
+        for effects in type(self)._EFFECTS_BY_PARENT_INPUT.values():
+            self._pending_effects.update(effects)
 
     def set_parent(self, parent: Item) -> None:
         parent.add_child(self)
@@ -176,13 +314,42 @@ class Item:
             child.__outdate_pedigree()
         self._children.remove(removed_child)
         removed_child.__remove_parent()
+        removed_child.__detach()
 
     def __remove_parent(self) -> None:
         assert self._parent is not None, "Parent must be present to be removed"
         self._parent = None
 
     def remove_parent(self) -> None:
-        self._parent.remove_child(self)
+        self.parent.remove_child(self)
+
+    def _offsprings(self) -> Iterator[Item]:
+        """ iterates over self and all offsprings, parents before children """
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(reversed(item._children))
+
+    def __detach(self) -> None:
+        """
+        Unlinks every dependency edge crossing the boundary of the subtree rooted
+        at self, and drops the pedigrees referencing the old ancestors and peers.
+        Properties that lost a requirement are outdated and re-evaluated once the
+        subtree is attached again.
+        """
+        subtree = list(self._offsprings())
+        inside: set[_ItemProperty] = {
+            property
+            for item in subtree
+            for property in item._properties.values()
+        }
+        for item in subtree:
+            for property in item._properties.values():
+                property.unlink_outside(inside)
+            item._pedigree = _Pedigree(item, {}, {})
+            item._last_pedigree = item._pedigree
+            item._pedigree_up_to_date = False
 
     def add_children(self, new_children: Iterable[Item]) -> None:
         for child in new_children:
@@ -204,12 +371,34 @@ class Item:
             on_handler = getattr(self, on_handler_name)
             assert ismethod(on_handler), f"attribute {on_handler_name} of {self.__class__.__name__} is supposed to be property update handler (a method)"
             on_handler()
+        effects = type(self)._EFFECTS_BY_INPUT.get(property_name)
+        if effects is not None:
+            self._pending_effects.update(effects)
+        if property_name in _PARENT_INPUTS:
+            for child in self._children:
+                effects = type(child)._EFFECTS_BY_PARENT_INPUT.get(property_name)
+                if effects is not None:
+                    child._pending_effects.update(effects)
         self.on_property_value_update(property_name)
 
     def on_property_value_update(self, property_name: str) -> None:
         # TODO: planning to expose a way to make property directly a ft control
         ...
 
+    def __run_effects(self) -> None:
+        """ runs the pending effects in declaration order """
+        if not self._pending_effects:
+            return
+        pending = self._pending_effects
+        self._pending_effects = set()
+        for name, declaration in type(self)._EFFECTS.items():
+            if name in pending and (declaration.when is None or declaration.when(self)):
+                getattr(self, name)()
+
+    def __on_computed(self) -> None:
+        self.__run_effects()
+        self._on_computed()
+
     def _on_computed(self) -> None:
         return None
 
@@ -250,18 +439,21 @@ class Item:
         for child in self._children:
             child.__compute_new_requirements()
 
-    def __compute_properties(self, queue: deque[tuple[Item, _ItemProperty]]) -> None:
-        """ Updates queued properties according to the current definitions """
-        last_queue_len = len(queue)
-        loop_count = last_queue_len + 1
+    def __compute_properties(self, queue: _PropertyQueue, budget: _SliceBudget | None = None) -> bool:
+        """
+        Updates queued properties according to the current definitions.
+
+        :returns: False if the budget ran out before the queue did, the queue
+            can then be passed again to carry on.
+        """
         while queue:
-            loop_count -= 1
-            if loop_count == 0:
-                if last_queue_len == len(queue):
+            queue.loop_count -= 1
+            if queue.loop_count == 0:
+                if queue.last_len == len(queue):
                     ss = ', '.join(f'{item.displayed_id}.{property.name}' for item, property in queue)
                     raise CircleException(f"Dependency circle detected in properties: {ss}")
-                last_queue_len = len(queue)
-                loop_count = last_queue_len + 1
+                queue.last_len = len(queue)
+                queue.loop_count = queue.last_len + 1
             item, property = queue.popleft()
             assert not property.up_to_date or all(
                 req.up_to_date
@@ -280,33 +472,174 @@ class Item:
                     queue.append((item, property))
                 elif old_value != property.value:
                     item.__on_property_value_update(property.name)
+                if budget is not None and budget.spend() and queue:
+                    return False
+        return True
 
     def __compute_self_properties(self) -> None:
         """ This method assumes all requirements are up-to-date. """
         queued_properties: set[tuple[Item, _ItemProperty]] = set(zip(repeat(self), self._properties.values()))
-        queue: deque[tuple[Item, _ItemProperty]] = deque(list(queued_properties))
-        self.__compute_properties(queue)
-        self._on_computed()
+        self.__compute_properties(_PropertyQueue(queued_properties))
+        self.__on_computed()
 
     def __compute_children_properties(self) -> None:
         """ This method assumes all requirements are up-to-date. """
+        if not all(child._pedigree_up_to_date for child in self._children):
+            # children added while computing (e.g. in _on_computed())
+            self.__compute_pedigrees()
+            self.__compute_new_requirements()
         queued_properties: set[tuple[Item, _ItemProperty]] = set()
         for child in self._children:
             for property in child._properties.values():
                 queued_properties.add((child, property))
-        queue: deque[tuple[Item, _ItemProperty]] = deque(list(queued_properties))
-        self.__compute_properties(queue)
+        self.__compute_properties(_PropertyQueue(queued_properties))
         for child in self._children:
-            child._on_computed()
+            child.__on_computed()
             child.__compute_children_properties()
         self._on_children_computed()
 
+    def __compute_children_slices(
+            self, budget: _SliceBudget, defer: Callable[[Item], bool] | None = None,
+            deferred: deque[Iterator[None]] | None = None,
+    ) -> Iterator[None]:
+        """
+        Same as __compute_children_properties(), but yields whenever the budget
+        runs out. The offsprings of the children for which defer(child) is true
+        are computed later, by the steps appended to deferred.
+        """
+        if not all(child._pedigree_up_to_date for child in self._children):
+            self.__compute_pedigrees()
+            self.__compute_new_requirements()
+        queued_properties: set[tuple[Item, _ItemProperty]] = set()
+        for child in self._children:
+            for property in child._properties.values():
+                queued_properties.add((child, property))
+        queue = _PropertyQueue(queued_properties)
+        while not self.__compute_properties(queue, budget):
+            yield
+        later: list[Item] = []
+        for child in self._children:
+            if budget.exhausted():
+                yield
+            child.__on_computed()
+            if defer is not None and defer(child):
+                later.append(child)
+            else:
+                yield from child.__compute_children_slices(budget, defer, deferred)
+        if later:
+            deferred.append(self.__compute_deferred_slices(budget, later))
+        else:
+            self._on_children_computed()
+
+    def __compute_deferred_slices(self, budget: _SliceBudget, children: list[Item]) -> Iterator[None]:
+        """ computes the offsprings of the deferred children, then finishes this item """
+        for child in children:
+            if child.parent is not self:
+                # removed meanwhile
+                continue
+            if budget.exhausted():
+                yield
+            yield from child.__compute_children_slices(budget)
+        self._on_children_computed()
+
+    def _recompute_children(self) -> None:
+        """
+        Computes the offsprings again. Meant for containers whose
+        ``_on_children_computed()`` wrote properties of their children.
+        """
+        self.__compute_children_properties()
+
     def compute(self) -> None:
+        if self._async_compute is not None:
+            raise RuntimeError(f"{self.displayed_id} is being computed by compute_async()")
         self.__compute_pedigrees()
         self.__compute_new_requirements()
         self.__compute_self_properties()
         self.__compute_children_properties()
 
+    def __compute_slices(self, budget: _SliceBudget, defer: Callable[[Item], bool] | None) -> Iterator[None]:
+        self.__compute_pedigrees()
+        self.__compute_new_requirements()
+        queue = _PropertyQueue(zip(repeat(self), self._properties.values()))
+        while not self.__compute_properties(queue, budget):
+            yield
+        self.__on_computed()
+        deferred: deque[Iterator[None]] = deque()
+        yield from self.__compute_children_slices(budget, defer, deferred)
+        while deferred:
+            yield from deferred.popleft()
+
+    async def compute_async(
+            self, max_evaluations: int | None = 1000, max_ms: float | None = 10,
+            defer: Callable[[Item], bool] | None = None, on_slice: Callable[[], Any] | None = None,
+    ) -> ComputeSlices:
+        """
+        Does the same work as compute(), but in slices, handing control back to
+        the event loop after every max_evaluations property evaluations or
+        max_ms milliseconds, whichever comes first.
+
+        Slices only end between two property evaluations (or two items' effects),
+        never inside a handler or an effect, and the effects of an item still run
+        once all its properties are up to date. Computes started meanwhile wait
+        for this one (compute() raises instead).
+
+        Property writes made by other tasks while the compute is suspended are
+        buffered (reads return the values before them), then applied once the
+        pass is over and computed by another pass, until no write is left.
+        Handlers thus only see the inputs the pass started with.
+
+        :param defer: items for which defer(item) is true (once their own
+                      properties are computed) have their offsprings computed
+                      after everything else, and their parents'
+                      ``_on_children_computed()`` is delayed until then.
+        :param on_slice: called after each slice, e.g. to send it to the page.
+        :returns: the duration of each slice
+        """
+        # asyncio is only imported by async computes, it is slow to import
+        import asyncio
+        while self._async_compute is not None:
+            await self._async_compute.wait()
+        done = self._async_compute = asyncio.Event()
+        budget = _SliceBudget(max_evaluations, max_ms)
+        slices = ComputeSlices()
+        steps = self.__compute_slices(budget, defer)
+        writes: list[tuple[Item, str, Any]] = []
+        try:
+            while True:
+                started = budget.start()
+                finished = next(steps, _DONE) is _DONE
+                if finished and writes:
+                    # the writes made while suspended, computed by one more pass
+                    for item, key, value in writes:
+                        item.__set_key_val(key, value)
+                    writes.clear()
+                    steps = self.__compute_slices(budget, defer)
+                    finished = False
+                slices.durations.append(perf_counter() - started)
+                if on_slice is not None:
+                    on_slice()
+                if finished:
+                    break
+                _SUSPENDED_COMPUTES[_id(self)] = writes
+                try:
+                    await asyncio.sleep(0)
+                finally:
+                    del _SUSPENDED_COMPUTES[_id(self)]
+        finally:
+            steps.close()
+            self._async_compute = None
+            done.set()
+        slices.evaluations = budget.total_evaluations
+        return slices
+
+
+class _PropertyQueue(deque):
+    """ properties waiting to be computed, with the state of the dependency circle check """
+    def __init__(self, properties: Iterable[tuple[Item, _ItemProperty]]) -> None:
+        super().__init__(properties)
+        self.last_len = len(self)
+        self.loop_count = self.last_len + 1
+
 
 class _ItemProperty:
     """
@@ -353,7 +686,7 @@ class _ItemProperty:
         if self.up_to_date and value != self.value:
             self.notify_update()
         self._value = value
-        self._f_value = lambda _: value
+        self._f_value = _constant(value)
         self._up_to_date = True
 
     def set_new_f_value(self, f_value: Callable) -> None:
@@ -392,9 +725,46 @@ class _ItemProperty:
     def remove_requirements(self) -> None:
         self._requirements.clear()
 
-    def remove_as_requirement(self, item_name: str, property_name: str) -> None:
+    def forget_requirement(self, property: _ItemProperty) -> None:
+        """ removes all requirement entries referring to property """
+        keys = [key for key, p in self._requirements.items() if p is property]
+        for key in keys:
+            del self._requirements[key]
+
+    def remove_as_requirement(self) -> None:
+        """ removes self from the requirements of all its dependents """
         for dependent in self._dependents:
-            dependent.remove_requirement(self)
+            dependent.forget_requirement(self)
+        self._dependents.clear()
+
+    def outdate(self) -> None:
+        """ marks self as requiring an update, and notifies dependents if it was up-to-date """
+        was_up_to_date = self.up_to_date
+        self._up_to_date = False
+        if was_up_to_date:
+            self.notify_update()
+
+    def unlink_outside(self, inside: set[_ItemProperty]) -> None:
+        """
+        Removes all edges between self and properties that are not in ``inside``.
+        Both self (if it lost a requirement) and the outside dependents are outdated.
+        """
+        outside_requirements = [
+            key for key, property in self._requirements.items()
+            if property not in inside
+        ]
+        for key in outside_requirements:
+            self._requirements.pop(key).remove_dependent(self)
+        outside_dependents = [
+            property for property in self._dependents
+            if property not in inside
+        ]
+        for dependent in outside_dependents:
+            self._dependents.remove(dependent)
+            dependent.forget_requirement(self)
+            dependent.outdate()
+        if outside_requirements:
+            self.outdate()
 
     def compute_new_requirements(self, pedigree: _Pedigree) -> None:
         """ reset requirements according to pedigree, and notify update if necessary """
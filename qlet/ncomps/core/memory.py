@@ -0,0 +1,223 @@
+"""
+Memory accounting for item trees.
+
+``memory_report()`` walks a tree and attributes every object reachable from the
+items to one of the categories below, so that the footprint of a component can
+be broken down and compared between classes. Objects shared between items
+(e.g. pedigree dicts shared by peers, class level default rules) are counted
+once, by the first item that reaches them.
+
+``allocated_bytes_per_item()`` measures the same thing from the allocator's
+point of view with ``tracemalloc``, which also captures memory the walk cannot
+see (e.g. allocator overhead).
+"""
+from __future__ import annotations
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from enum import Enum
+from types import FunctionType
+from typing import Any, Callable, Iterable
+
+from .item import Item, ItemHandle, _CONSTANT_CODE, _PropertyHandle
+
+
+__all__ = [
+    "MemoryUsage",
+    "ClassMemory",
+    "MemoryReport",
+    "memory_report",
+    "allocated_bytes_per_item",
+]
+
+
+# built-in function alias
+_id = id
+
+
+ITEMS = "items"
+PROPERTIES = "properties"
+CLOSURES = "closures"
+RULES = "rules"
+FLET_CONTROLS = "flet_controls"
+PEDIGREES = "pedigrees"
+HANDLES = "handles"
+
+CATEGORIES = (ITEMS, PROPERTIES, CLOSURES, RULES, FLET_CONTROLS, PEDIGREES, HANDLES)
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+
+
+@dataclass(slots=True)
+class MemoryUsage:
+    count: int = 0
+    bytes: int = 0
+
+
+@dataclass(slots=True)
+class ClassMemory:
+    instances: int = 0
+    bytes: int = 0
+
+    @property
+    def average(self) -> float:
+        return self.bytes / self.instances if self.instances else 0.0
+
+
+@dataclass(slots=True)
+class MemoryReport:
+    items: int = 0
+    categories: dict[str, MemoryUsage] = field(
+        default_factory=lambda: {category: MemoryUsage() for category in CATEGORIES}
+    )
+    classes: dict[str, ClassMemory] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(usage.bytes for usage in self.categories.values())
+
+    @property
+    def bytes_per_item(self) -> float:
+        return self.total_bytes / self.items if self.items else 0.0
+
+    def format(self) -> str:
+        lines = [f"{self.items} items, {self.total_bytes} bytes ({self.bytes_per_item:.0f} bytes/item)"]
+        for category, usage in self.categories.items():
+            lines.append(f"  {category:<14}{usage.count:>10} objects{usage.bytes:>12} bytes")
+        for name, klass in sorted(self.classes.items()):
+            lines.append(f"  {name:<14}{klass.instances:>10} items  {klass.average:>12.0f} bytes/item")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def _is_flet(obj: Any) -> bool:
+    module = type(obj).__module__
+    return module.startswith("flet") and not type(obj).__name__ == "Page"
+
+
+class _Accountant:
+    def __init__(self, report: MemoryReport) -> None:
+        self._report = report
+        self._seen: set[int] = set()
+
+    def _claim(self, obj: Any) -> int:
+        """ :returns: the size of obj if it has not been counted yet, else 0 """
+        if _id(obj) in self._seen:
+            return 0
+        self._seen.add(_id(obj))
+        return sys.getsizeof(obj)
+
+    def _add(self, category: str, objects: Iterable[Any]) -> int:
+        usage = self._report.categories[category]
+        total = 0
+        for obj in objects:
+            size = self._claim(obj)
+            if size:
+                usage.count += 1
+                total += size
+        usage.bytes += total
+        return total
+
+    def _walk(self, roots: Iterable[Any], follow: Callable[[Any], bool]) -> list[Any]:
+        """ collects the unclaimed objects reachable from roots through objects accepted by follow """
+        found: list[Any] = []
+        visited: set[int] = set()
+        stack = [obj for obj in roots if follow(obj)]
+        while stack:
+            obj = stack.pop()
+            if _id(obj) in visited or _id(obj) in self._seen:
+                continue
+            visited.add(_id(obj))
+            found.append(obj)
+            stack.extend(o for o in gc.get_referents(obj) if follow(o))
+        return found
+
+    def account(self, item: Item) -> int:
+        """ :returns: bytes attributed to item """
+        total = 0
+        # children first so their flet controls are not claimed by the parent's frame
+        for child in item._children:
+            self.account(child)
+
+        total += self._add(ITEMS, (
+            item, item.__dict__, item._children, item._properties, item._displayed_id,
+        ))
+
+        for property in item._properties.values():
+            total += self._add(PROPERTIES, (
+                property, property.__dict__, property._requirements, property._dependents,
+                *property._requirements.keys(),
+            ))
+            f_value = property._f_value
+            if isinstance(f_value, FunctionType) and f_value.__code__ is _CONSTANT_CODE:
+                total += self._add(CLOSURES, (f_value, f_value.__closure__, *f_value.__closure__))
+                if not isinstance(property.value, (Item, Enum)):
+                    total += self._add(PROPERTIES, (property.value,))
+            elif isinstance(f_value, FunctionType):
+                total += self._add(RULES, (f_value,))
+
+        pedigrees = [item._pedigree, item._last_pedigree]
+        total += self._add(PEDIGREES, (
+            obj
+            for pedigree in pedigrees
+            for obj in (pedigree, pedigree.__dict__, pedigree._ancestors, pedigree._peers, pedigree._self_alias)
+        ))
+
+        attributes = [
+            value for key, value in item.__dict__.items()
+            if key not in {"_properties", "_children", "_pedigree", "_last_pedigree"}
+        ]
+        total += self._add(HANDLES, (
+            value for value in attributes
+            if isinstance(value, (ItemHandle, _PropertyHandle))
+        ))
+        total += self._add(FLET_CONTROLS, self._walk(
+            (value for value in attributes if _is_flet(value)),
+            lambda o: (
+                _is_flet(o) and not isinstance(o, Enum)
+                or isinstance(o, _CONTAINERS)
+                or isinstance(o, (str, int, float)) and not isinstance(o, (bool, Enum))
+            ),
+        ))
+
+        klass = self._report.classes.setdefault(type(item).__name__, ClassMemory())
+        klass.instances += 1
+        klass.bytes += total
+        self._report.items += 1
+        return total
+
+
+def memory_report(root: Item) -> MemoryReport:
+    """
+    :returns: the memory footprint of ``root`` and all its offsprings, broken down
+              by category and by item class.
+    """
+    report = MemoryReport()
+    _Accountant(report).account(root)
+    return report
+
+
+def allocated_bytes_per_item(factory: Callable[[], Item], n: int = 100) -> float:
+    """
+    :param factory: creates one item (or one tree, which then counts as one item).
+    :param n: number of items to create.
+    :returns: average number of bytes still allocated per created item, measured by tracemalloc.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    gc.collect()
+    if not was_tracing:
+        tracemalloc.start()
+    items: list[Item] = []
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        items = [factory() for _ in range(n)]
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        del items
+        if not was_tracing:
+            tracemalloc.stop()
+    return (after - before) / n
@@ -0,0 +1,85 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .item import Item
+
+
+__all__ = ["ItemPool", "PoolStats"]
+
+
+@dataclass(slots=True)
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    releases: int = 0
+    discards: int = 0
+
+    @property
+    def acquires(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """ ratio of acquires served by a recycled item """
+        return self.hits / self.acquires if self.acquires else 0.0
+
+
+class ItemPool:
+    """
+    Keeps released items of a single class so they can be acquired again
+    without rebuilding them (in particular without rebuilding their flet controls).
+    """
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, cls: type[Item], max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._cls = cls
+        self._max_size = max_size
+        self._free: list[Item] = []
+        self._stats = PoolStats()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        assert max_size >= 0, f"max_size cannot be negative: {max_size}"
+        self._max_size = max_size
+        del self._free[max_size:]
+
+    @property
+    def stats(self) -> PoolStats:
+        return self._stats
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, **kwargs: Any) -> Item:
+        """
+        :returns: a recycled item reset to the defaults of its class, with kwargs
+                  applied the same way the constructor would, or a new item if
+                  the pool is empty.
+        """
+        if self._free:
+            self._stats.hits += 1
+            item = self._free.pop()
+            item._reinit(**kwargs)
+            return item
+        self._stats.misses += 1
+        return self._cls(**kwargs)
+
+    def release(self, item: Item) -> None:
+        """ keeps item for a later acquire, unless the pool is full """
+        assert type(item) is self._cls, f"{type(item).__name__} cannot be released to the pool of {self._cls.__name__}"
+        assert item.parent is None and not item._children, "Only detached items can be pooled."
+        self._stats.releases += 1
+        if len(self._free) >= self._max_size:
+            self._stats.discards += 1
+            return
+        self._free.append(item)
+
+    def clear(self) -> None:
+        self._free.clear()
@@ -0,0 +1,248 @@
+"""
+Cloning of prototype items.
+
+Building an item runs its constructors: the property table is filled from
+keyword arguments one by one, and QItems build their flet controls. A
+``Prototype`` builds the item once, then stamps out copies of its object graph
+(the item, its properties and offsprings, and every object they own, flet
+controls included) while sharing what cannot change: property definitions,
+functions, classes, strings, numbers, enums, ...
+
+The graph is walked once, into a plan that copies the attribute dict of each
+object in one go and only patches the references to other copied objects.
+"""
+from __future__ import annotations
+from enum import Enum
+from functools import partial
+from itertools import repeat
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import Any, Generic, TypeVar
+from weakref import ref, ReferenceType
+
+from .item import Item
+from .null_value import _NullValue
+
+
+__all__ = ["Prototype", "share_type"]
+
+
+_I = TypeVar("_I", bound=Item)
+
+# instances of these types are shared by the clones
+_SHARED_TYPES: set[type] = {
+    type(None), bool, int, float, complex, str, bytes, type, range, frozenset,
+    FunctionType, BuiltinFunctionType, _NullValue,
+}
+
+
+def share_type(cls: type) -> type:
+    """ marks instances of cls as immutable, so clones share them (usable as a class decorator) """
+    _SHARED_TYPES.add(cls)
+    return cls
+
+
+def _is_shared(value: Any) -> bool:
+    return type(value) in _SHARED_TYPES or isinstance(value, Enum)
+
+
+# kinds of copies, created in this order
+_OBJECT = 0  # object with an attribute dict
+_SLOTTED = 1  # object with slots only
+_COPY = 2  # list, dict or set
+_SHARED = 3  # an object outside of the prototype
+_REF = 4  # weak reference
+_DERIVED = 5  # tuple, method or partial, built from the copies it refers to
+
+_TUPLE, _METHOD, _PARTIAL = range(3)
+
+
+class Prototype(Generic[_I]):
+    """ an item built once, and copied by clone() """
+
+    def __init__(self, item: _I) -> None:
+        """
+        :param item: the prototype, without a parent and never added to a page.
+                     It should not be modified afterwards.
+        """
+        assert item.parent is None, "Only items without a parent can be prototypes."
+        self._item = item
+        self._index: dict[int, int] = {}
+        # the walk records (kind, template) of each copy, and patches by walk index
+        self._nodes: list[tuple[int, Any]] = []
+        self._patches: list[tuple[int, Any, int]] = []
+        self._set_patches: list[tuple[int, int]] = []
+        self._slot_patches: list[tuple[int, str, int]] = []
+        self._derived: list[tuple[int, int, Any]] = []
+        self._anonymous_items: list[int] = []
+        weak_refs: list[tuple[int, ReferenceType]] = []
+        self._visit(item, weak_refs)
+        for index, weak_ref in weak_refs:
+            referent = weak_ref()
+            target = None if referent is None else self._index.get(id(referent))
+            if target is None:
+                # refers to an object outside of the prototype, kept as is
+                self._nodes[index] = (_SHARED, weak_ref)
+            else:
+                self._nodes[index] = (_REF, target)
+        self._compile()
+        del self._index
+
+    @property
+    def item(self) -> _I:
+        return self._item
+
+    def clone(self) -> _I:
+        """ :returns: a copy of the prototype and its offsprings, ready to be added to a tree """
+        set_attribute = object.__setattr__
+        new = object.__new__
+        states = [state.copy() for state in self._states]
+        objects = [new(cls) for cls in self._classes]
+        for _ in map(set_attribute, objects, repeat("__dict__"), states):
+            pass
+        copied = [template.copy() for template in self._copy_templates]
+        copies = objects + [new(cls) for cls in self._slotted_classes] + copied + self._shared
+        copies += [ref(copies[target]) for target in self._refs]
+        copies.extend(repeat(None, self._derived_count))
+        for index, kind, parts in self._derived:
+            if kind == _TUPLE:
+                values = list(parts[0])
+                for position, source in parts[1]:
+                    values[position] = copies[source]
+                copies[index] = tuple(values)
+            elif kind == _METHOD:
+                copies[index] = MethodType(parts[0], copies[parts[1]])
+            else:
+                function, args, keywords = parts
+                copies[index] = partial(copies[function], *copies[args], **copies[keywords])
+        containers = states + [None] * len(self._slotted_classes) + copied
+        for target, key, source in self._patches:
+            containers[target][key] = copies[source]
+        for target, source in self._set_patches:
+            copies[target].add(copies[source])
+        for target, slot, value, source in self._slot_values:
+            set_attribute(copies[target], slot, value if source is None else copies[source])
+        for index in self._anonymous_items:
+            item = copies[index]
+            item._displayed_id = f"{type(item).__name__}_{id(item)}"
+        return copies[0]
+
+    def _compile(self) -> None:
+        """ orders the copies by kind, so that clone() creates each kind in one go """
+        order = sorted(range(len(self._nodes)), key=lambda index: self._nodes[index][0])
+        final = [0] * len(order)
+        for position, index in enumerate(order):
+            final[index] = position
+        by_kind: dict[int, list[Any]] = {kind: [] for kind in range(_DERIVED + 1)}
+        for index in order:
+            kind, template = self._nodes[index]
+            by_kind[kind].append(template)
+        assert final[0] == 0, "the prototype is the first copy"
+        self._classes = [cls for cls, _ in by_kind[_OBJECT]]
+        self._states = [state for _, state in by_kind[_OBJECT]]
+        self._slotted_classes = by_kind[_SLOTTED]
+        self._copy_templates = by_kind[_COPY]
+        self._shared = by_kind[_SHARED]
+        self._refs = [final[target] for target in by_kind[_REF]]
+        self._derived_count = len(by_kind[_DERIVED])
+        self._patches = [(final[target], key, final[source]) for target, key, source in self._patches]
+        self._set_patches = [(final[target], final[source]) for target, source in self._set_patches]
+        self._slot_values = [
+            (final[target], slot, value, None if source is None else final[source])
+            for target, slot, value, source in self._slot_patches
+        ]
+        derived = []
+        for index, kind, parts in self._derived:
+            if kind == _TUPLE:
+                parts = (parts[0], [(position, final[source]) for position, source in parts[1]])
+            elif kind == _METHOD:
+                parts = (parts[0], final[parts[1]])
+            else:
+                parts = tuple(final[part] for part in parts)
+            derived.append((final[index], kind, parts))
+        self._derived = derived
+        self._anonymous_items = [final[index] for index in self._anonymous_items]
+        del self._nodes, self._slot_patches
+
+    def _add_node(self, obj: Any, kind: int, template: Any) -> int:
+        index = len(self._nodes)
+        self._index[id(obj)] = index
+        self._nodes.append((kind, template))
+        return index
+
+    def _visit(self, obj: Any, weak_refs: list[tuple[int, ReferenceType]]) -> int | None:
+        """ :returns: the walk index of the copy of obj, None if obj is shared """
+        if _is_shared(obj):
+            return None
+        index = self._index.get(id(obj))
+        if index is not None:
+            return index
+        cls = type(obj)
+        if cls is list or cls is dict:
+            index = self._add_node(obj, _COPY, cls(obj))
+            for key, value in (enumerate(obj) if cls is list else obj.items()):
+                assert _is_shared(key), f"Cannot clone a dict with {type(key).__name__} keys"
+                source = self._visit(value, weak_refs)
+                if source is not None:
+                    self._patches.append((index, key, source))
+        elif cls is set:
+            index = self._add_node(obj, _COPY, {value for value in obj if _is_shared(value)})
+            for value in obj:
+                source = self._visit(value, weak_refs)
+                if source is not None:
+                    self._set_patches.append((index, source))
+        elif cls is tuple:
+            index = self._add_node(obj, _DERIVED, None)
+            sources = [self._visit(value, weak_refs) for value in obj]
+            if all(source is None for source in sources):
+                self._nodes[index] = (_SHARED, obj)
+            else:
+                patches = [(position, source) for position, source in enumerate(sources) if source is not None]
+                self._derived.append((index, _TUPLE, (obj, patches)))
+        elif cls is ReferenceType:
+            # resolved once everything it may refer to is visited
+            index = self._add_node(obj, _REF, None)
+            weak_refs.append((index, obj))
+        elif cls is MethodType:
+            target = self._visit(obj.__self__, weak_refs)
+            if target is None:
+                return None
+            index = self._add_node(obj, _DERIVED, None)
+            self._derived.append((index, _METHOD, (obj.__func__, target)))
+        elif cls is partial:
+            parts = tuple(self._visit_part(part, weak_refs) for part in (obj.func, obj.args, obj.keywords))
+            index = self._add_node(obj, _DERIVED, None)
+            self._derived.append((index, _PARTIAL, parts))
+        else:
+            index = self._visit_object(obj, weak_refs)
+        return index
+
+    def _visit_part(self, obj: Any, weak_refs: list[tuple[int, ReferenceType]]) -> int:
+        """ like _visit(), but shared objects get a copy (themselves) too """
+        index = self._visit(obj, weak_refs)
+        if index is None:
+            index = len(self._nodes)
+            self._nodes.append((_SHARED, obj))
+        return index
+
+    def _visit_object(self, obj: Any, weak_refs: list[tuple[int, ReferenceType]]) -> int:
+        cls = type(obj)
+        state = getattr(obj, "__dict__", None)
+        if state is not None:
+            index = self._add_node(obj, _OBJECT, (cls, dict(state)))
+        else:
+            index = self._add_node(obj, _SLOTTED, cls)
+        if isinstance(obj, Item) and not obj.id:
+            self._anonymous_items.append(index)
+        if state is not None:
+            for key, value in state.items():
+                source = self._visit(value, weak_refs)
+                if source is not None:
+                    self._patches.append((index, key, source))
+        for klass in cls.__mro__:
+            names = klass.__dict__.get("__slots__", ())
+            for slot in (names,) if isinstance(names, str) else names:
+                if slot in ("__weakref__", "__dict__") or not hasattr(obj, slot):
+                    continue
+                value = object.__getattribute__(obj, slot)
+                self._slot_patches.append((index, slot, value, self._visit(value, weak_refs)))
+        return index
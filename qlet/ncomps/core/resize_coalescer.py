@@ -0,0 +1,135 @@
+"""
+Coalescing of page resize events.
+
+Dragging a window edge fires dozens of resize events per second, each one
+recomputing the whole tree. ``ResizeCoalescer`` applies the latest size only:
+sizes arriving while one is applied, or within the frame interval of the last
+one, replace each other, and a trailing timer applies the final size.
+"""
+from __future__ import annotations
+import threading
+import time
+from typing import Callable, Protocol
+
+
+__all__ = ["ResizeCoalescer", "DEFAULT_RESIZE_FPS"]
+
+
+DEFAULT_RESIZE_FPS = 30
+
+
+class _Timer(Protocol):
+    def start(self) -> None: ...
+    def cancel(self) -> None: ...
+
+
+def _daemon_timer(delay: float, callback: Callable[[], None]) -> _Timer:
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    return timer
+
+
+class ResizeCoalescer:
+    """
+    Applies submitted sizes at most ``max_fps`` times per second, always ending
+    with the last submitted size. Sizes equal to the last applied one are skipped.
+    """
+
+    def __init__(
+            self,
+            apply: Callable[[float, float], None],
+            max_fps: float | None = DEFAULT_RESIZE_FPS,
+            clock: Callable[[], float] = time.monotonic,
+            timer: Callable[[float, Callable[[], None]], _Timer] = _daemon_timer,
+    ) -> None:
+        """
+        :param apply: called with (width, height) of the sizes to apply.
+        :param max_fps: maximum number of sizes applied per second, None for no limit.
+        :param clock: monotonic time in seconds.
+        :param timer: creates a timer calling its callback once after a delay in seconds.
+        """
+        assert max_fps is None or max_fps > 0, f"Invalid max_fps: {max_fps}"
+        self._apply = apply
+        self._interval = 0 if max_fps is None else 1 / max_fps
+        self._clock = clock
+        self._timer_factory = timer
+        self._lock = threading.Lock()
+        self._pending: tuple[float, float] | None = None
+        self._applied: tuple[float, float] | None = None
+        self._last_applied_at = -float("inf")
+        self._applying = False
+        self._timer: _Timer | None = None
+
+    @property
+    def pending(self) -> tuple[float, float] | None:
+        """ the size waiting to be applied, if any """
+        return self._pending
+
+    def submit(self, width: float, height: float) -> None:
+        """
+        Applies the size now if the frame interval allows it, otherwise after
+        the interval unless another size replaces it.
+        """
+        with self._lock:
+            self._pending = (width, height)
+            if self._applying or self._timer is not None:
+                return
+            self._applying = True
+        self._drain()
+
+    def flush(self) -> None:
+        """ applies the pending size now, ignoring the frame interval """
+        with self._lock:
+            self._cancel_timer()
+            if self._applying:
+                return
+            self._last_applied_at = -float("inf")
+            self._applying = True
+        self._drain()
+
+    def cancel(self) -> None:
+        """ drops the pending size """
+        with self._lock:
+            self._cancel_timer()
+            self._pending = None
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._timer is None or self._applying:
+                # cancelled, or a running apply picks the pending size up
+                self._timer = None
+                return
+            self._timer = None
+            self._applying = True
+        self._drain()
+
+    def _drain(self) -> None:
+        """ applies pending sizes until there is none or the interval is not over """
+        while True:
+            with self._lock:
+                size = self._pending
+                if size is None or size == self._applied:
+                    self._pending = None
+                    self._applying = False
+                    return
+                wait = self._last_applied_at + self._interval - self._clock()
+                if wait > 0:
+                    self._applying = False
+                    self._timer = self._timer_factory(wait, self._on_timer)
+                    self._timer.start()
+                    return
+                self._pending = None
+                self._last_applied_at = self._clock()
+            try:
+                self._apply(*size)
+            except BaseException:
+                with self._lock:
+                    self._applying = False
+                raise
+            with self._lock:
+                self._applied = size
@@ -0,0 +1,211 @@
+"""
+A uniform grid over rectangles, answering which rectangles are at a point,
+intersect a region, or are the nearest to a point without scanning all of them.
+
+Each rectangle is listed in the cells it overlaps, so queries only look at
+the cells they cover. Rectangles spanning too many cells (e.g. full page
+backgrounds) are kept apart and checked by every query.
+"""
+from __future__ import annotations
+import math
+from typing import Generic, Hashable, Iterator, TypeVar
+
+
+__all__ = ["SpatialIndex", "DEFAULT_CELL_SIZE"]
+
+
+DEFAULT_CELL_SIZE = 128
+
+_K = TypeVar("_K", bound=Hashable)
+
+# (left, top, right, bottom)
+_Rect = tuple[float, float, float, float]
+
+
+class SpatialIndex(Generic[_K]):
+    """ rectangles by key, in a uniform grid of square cells """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE, max_cells: int = 64) -> None:
+        """
+        :param cell_size: side of the cells, about the size of the typical rectangle.
+        :param max_cells: rectangles overlapping more cells are checked by every query instead.
+        """
+        assert cell_size > 0, f"Invalid cell size: {cell_size}"
+        self._cell_size = cell_size
+        self._max_cells = max_cells
+        self._rects: dict[_K, _Rect] = {}
+        self._cells: dict[tuple[int, int], set[_K]] = {}
+        self._large: set[_K] = set()
+        # bounds of the cells ever used, limiting nearest() searches
+        self._bounds: list[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rects
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._rects)
+
+    def rect(self, key: _K) -> tuple[float, float, float, float]:
+        """ :returns: x, y, width and height of key """
+        left, top, right, bottom = self._rects[key]
+        return left, top, right - left, bottom - top
+
+    def insert(self, key: _K, x: float, y: float, width: float, height: float) -> None:
+        """ adds key, or moves it if it is already in the index """
+        rect = (x, y, x + max(width, 0), y + max(height, 0))
+        old = self._rects.get(key)
+        if old is not None:
+            if old == rect:
+                return
+            if self._span(old) == self._span(rect):
+                self._rects[key] = rect
+                return
+            self.remove(key)
+        self._rects[key] = rect
+        x0, y0, x1, y1 = span = self._span(rect)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self._max_cells:
+            self._large.add(key)
+            return
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cell = cells[(cx, cy)] = set()
+                cell.add(key)
+        bounds = self._bounds
+        if bounds is None:
+            self._bounds = list(span)
+        else:
+            bounds[0], bounds[1] = min(bounds[0], x0), min(bounds[1], y0)
+            bounds[2], bounds[3] = max(bounds[2], x1), max(bounds[3], y1)
+
+    def remove(self, key: _K) -> None:
+        """ removes key if it is in the index """
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        if key in self._large:
+            self._large.discard(key)
+            return
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells[(cx, cy)]
+                cell.discard(key)
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def clear(self) -> None:
+        self._rects.clear()
+        self._cells.clear()
+        self._large.clear()
+        self._bounds = None
+
+    def at(self, x: float, y: float) -> list[_K]:
+        """ :returns: the keys of the rectangles containing the point (edges included) """
+        rects = self._rects
+        size = self._cell_size
+        found = []
+        for keys in (self._cells.get((math.floor(x / size), math.floor(y / size)), ()), self._large):
+            for key in keys:
+                left, top, right, bottom = rects[key]
+                if left <= x <= right and top <= y <= bottom:
+                    found.append(key)
+        return found
+
+    def intersecting(self, x: float, y: float, width: float, height: float) -> list[_K]:
+        """ :returns: the keys of the rectangles intersecting the region (edges included) """
+        right, bottom = x + width, y + height
+        x0, y0, x1, y1 = self._span((x, y, right, bottom))
+        rects = self._rects
+        cells = self._cells
+        candidates = set(self._large)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # larger than the indexed area, cheaper to go through the used cells
+            for (cx, cy), keys in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    candidates.update(keys)
+        else:
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    keys = cells.get((cx, cy))
+                    if keys is not None:
+                        candidates.update(keys)
+        found = []
+        for key in candidates:
+            left, top, r, b = rects[key]
+            if left <= right and x <= r and top <= bottom and y <= b:
+                found.append(key)
+        return found
+
+    def nearest(self, x: float, y: float, max_distance: float = math.inf) -> _K | None:
+        """
+        :returns: the key of the rectangle nearest to the point (0 inside it),
+            None if there is none within max_distance.
+        """
+        best, best_distance = None, max_distance
+        rects = self._rects
+        for key in self._large:
+            distance = _distance(rects[key], x, y)
+            if distance < best_distance or distance == best_distance and best is None:
+                best, best_distance = key, distance
+        if self._bounds is None:
+            return best
+        size = self._cell_size
+        cx, cy = math.floor(x / size), math.floor(y / size)
+        bounds = self._bounds
+        bx0, by0, bx1, by1 = bounds
+        first_ring = max(bx0 - cx, cx - bx1, by0 - cy, cy - by1, 0)
+        last_ring = max(abs(cx - bx0), abs(cx - bx1), abs(cy - by0), abs(cy - by1))
+        cells = self._cells
+        for ring in range(first_ring, last_ring + 1):
+            # every cell of this ring is at least that far from the point
+            if (ring - 1) * size > best_distance:
+                break
+            for cell in _ring(cx, cy, ring, bounds):
+                keys = cells.get(cell)
+                if keys is None:
+                    continue
+                for key in keys:
+                    distance = _distance(rects[key], x, y)
+                    if distance < best_distance or distance == best_distance and best is None:
+                        best, best_distance = key, distance
+        return best
+
+    def _span(self, rect: _Rect) -> tuple[int, int, int, int]:
+        """ :returns: the first and last cells overlapped by rect on each axis """
+        size = self._cell_size
+        return (
+            math.floor(rect[0] / size), math.floor(rect[1] / size),
+            math.floor(rect[2] / size), math.floor(rect[3] / size),
+        )
+
+
+def _distance(rect: _Rect, x: float, y: float) -> float:
+    left, top, right, bottom = rect
+    dx = left - x if x < left else x - right if x > right else 0
+    dy = top - y if y < top else y - bottom if y > bottom else 0
+    return math.hypot(dx, dy)
+
+
+def _ring(cx: int, cy: int, ring: int, bounds: list[int]) -> Iterator[tuple[int, int]]:
+    """ the cells within bounds at chebyshev distance ring of (cx, cy) """
+    bx0, by0, bx1, by1 = bounds
+    if ring == 0:
+        yield cx, cy
+        return
+    x0, x1 = max(cx - ring, bx0), min(cx + ring, bx1)
+    for y in (cy - ring, cy + ring):
+        if by0 <= y <= by1:
+            for x in range(x0, x1 + 1):
+                yield x, y
+    y0, y1 = max(cy - ring + 1, by0), min(cy + ring - 1, by1)
+    for x in (cx - ring, cx + ring):
+        if bx0 <= x <= bx1:
+            for y in range(y0, y1 + 1):
+                yield x, y
@@ -0,0 +1,190 @@
+"""
+Building item trees from declarative specs.
+
+A spec is a dict (e.g. loaded from JSON) describing an item and its children::
+
+    {
+        "type": "QRect", "id": "card", "bgcolour": "#202020",
+        "width": "=parent.width / 3", "height": 40,
+        "children": [
+            {"type": "QText", "text": "hello", "width": "=parent.width", "placement": {}},
+        ],
+    }
+
+``type``, ``id``, ``children`` and ``placement`` (keyword arguments of the
+parent's ``add_child()``, e.g. the cell of a ``QGrid``) are reserved, every other
+key is a property. A string starting with ``=`` is a rule: an expression where
+names are those of the handle of the item (``parent``, ``self``, peers by id,
+its own properties), e.g. ``"=max(parent.width - 20, 0)"``.
+
+Rules are compiled once per source text. Items are cloned from a prototype
+built once per type, then their properties are set in bulk, so building a tree
+runs no constructor.
+"""
+from __future__ import annotations
+import ast
+import json
+from functools import lru_cache
+from importlib import import_module
+from inspect import signature
+from typing import Any, Callable, Mapping
+
+from .item import Item, ItemHandle
+from .prototype import Prototype
+
+
+__all__ = ["SpecLoader", "SpecError", "compile_rule", "load_spec", "DEFAULT_SPEC_TYPES"]
+
+
+# types known by name, imported on first use
+DEFAULT_SPEC_TYPES: dict[str, str] = {
+    "Item": "qlet.ncomps.core.item:Item",
+    "QItem": "qlet.ncomps.q_item:QItem",
+    "QRect": "qlet.ncomps.q_rect:QRect",
+    "QText": "qlet.ncomps.q_text:QText",
+    "QRow": "qlet.ncomps.q_row:QRow",
+    "QColumn": "qlet.ncomps.q_column:QColumn",
+    "QGrid": "qlet.ncomps.q_grid:QGrid",
+}
+
+# functions callable by rules
+RULE_FUNCTIONS: dict[str, Callable] = {
+    "min": min, "max": max, "abs": abs, "round": round, "int": int, "float": float, "str": str,
+}
+
+_RESERVED_KEYS = {"type", "id", "children", "placement"}
+
+_HANDLE = "d"
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.Constant, ast.Name, ast.Load, ast.Attribute, ast.Call,
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Tuple, ast.List, ast.Subscript,
+    ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+)
+
+
+class SpecError(ValueError):
+    """ an invalid spec or rule """
+
+
+class _ToHandle(ast.NodeTransformer):
+    """ reads the names of a rule from the handle, except the functions called """
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if not isinstance(node.func, ast.Name) or node.func.id not in RULE_FUNCTIONS or node.keywords:
+            raise SpecError(f"Only {', '.join(RULE_FUNCTIONS)} can be called in rules")
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return ast.copy_location(
+            ast.Attribute(value=ast.Name(id=_HANDLE, ctx=ast.Load()), attr=node.id, ctx=ast.Load()), node,
+        )
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        if node.attr.startswith("_"):
+            raise SpecError(f"Rules cannot access private attributes: {node.attr}")
+        return self.generic_visit(node)
+
+
+@lru_cache(maxsize=4096)
+def compile_rule(source: str) -> Callable[[ItemHandle], Any]:
+    """
+    :param source: an expression, e.g. ``parent.width / 3``
+    :returns: the rule, the same function for the same source
+    """
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise SpecError(f"Invalid rule {source!r}: {e.msg}") from None
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise SpecError(f"{type(node).__name__} is not allowed in rules: {source!r}")
+    body = _ToHandle().visit(tree).body
+    rule = ast.Expression(ast.Lambda(
+        args=ast.arguments(
+            posonlyargs=[], args=[ast.arg(arg=_HANDLE)], kwonlyargs=[], kw_defaults=[], defaults=[],
+        ),
+        body=body,
+    ))
+    ast.fix_missing_locations(rule)
+    return eval(compile(rule, f"<rule {source}>", "eval"), {"__builtins__": {}, **RULE_FUNCTIONS})
+
+
+class SpecLoader:
+    """ builds item trees from specs """
+
+    def __init__(self, types: Mapping[str, type[Item] | str] | None = None, prototypes: bool = True) -> None:
+        """
+        :param types: item types by name, as classes or ``"module:Class"``, added to DEFAULT_SPEC_TYPES.
+        :param prototypes: clone a prototype of each type instead of running its constructor.
+                           Types that require constructor arguments, or whose SPEC_PROTOTYPE is False,
+                           always run their constructor.
+        """
+        self._types: dict[str, type[Item] | str] = {**DEFAULT_SPEC_TYPES, **(types or {})}
+        self._use_prototypes = prototypes
+        self._prototypes: dict[type[Item], Prototype | None] = {}
+
+    def load(self, spec: Mapping[str, Any]) -> Item:
+        """ :returns: the item of spec, with its offsprings, ready to be added to a tree """
+        try:
+            cls = self._type(spec["type"])
+        except KeyError:
+            raise SpecError(f"Spec without a type: {spec!r}") from None
+        properties = {key: _value(value) for key, value in spec.items() if key not in _RESERVED_KEYS}
+        prototype = self._prototype(cls)
+        if prototype is None:
+            item = cls(id=spec.get("id"), **properties)
+        else:
+            item = prototype.clone()
+            if "id" in spec:
+                item._set_id(spec["id"])
+            item._set_properties(properties)
+        for child in spec.get("children", ()):
+            item.add_child(self.load(child), **child.get("placement", {}))
+        return item
+
+    def load_json(self, text: str) -> Item:
+        return self.load(json.loads(text))
+
+    def _type(self, name: str) -> type[Item]:
+        cls = self._types.get(name)
+        if cls is None:
+            raise SpecError(f"Unknown item type: {name}")
+        if isinstance(cls, str):
+            module, _, class_name = cls.partition(":")
+            cls = self._types[name] = getattr(import_module(module), class_name)
+        return cls
+
+    def _prototype(self, cls: type[Item]) -> Prototype | None:
+        if not self._use_prototypes:
+            return None
+        if cls not in self._prototypes:
+            self._prototypes[cls] = Prototype(cls()) if cls.SPEC_PROTOTYPE and _buildable(cls) else None
+        return self._prototypes[cls]
+
+
+def _buildable(cls: type[Item]) -> bool:
+    """ :returns: whether cls can be called without arguments """
+    try:
+        signature(cls).bind()
+    except TypeError:
+        return False
+    return True
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, str) and value.startswith("="):
+        return compile_rule(value[1:])
+    return value
+
+
+_DEFAULT_LOADER: SpecLoader | None = None
+
+
+def load_spec(spec: Mapping[str, Any]) -> Item:
+    """ builds the item of spec with a loader of the default types """
+    global _DEFAULT_LOADER
+    if _DEFAULT_LOADER is None:
+        _DEFAULT_LOADER = SpecLoader()
+    return _DEFAULT_LOADER.load(spec)
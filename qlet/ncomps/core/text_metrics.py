@@ -0,0 +1,187 @@
+"""
+Server side text measurement.
+
+The size of a text is estimated from per character advances (in em, i.e. as a
+fraction of the font size), so items can be sized to their text without asking
+the client. ``FontMetrics.approximate()`` is tuned for flet's default sans-serif
+font; ``FontMetrics.from_font_file()`` reads the advances of an actual font.
+
+Measurements are cached by (text, size, italic, wrap width).
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Callable, Mapping, NamedTuple
+
+
+__all__ = [
+    "TextExtent",
+    "FontMetrics",
+    "font_metrics",
+    "set_font_metrics",
+    "measure_text",
+    "fit_text_size",
+]
+
+
+class TextExtent(NamedTuple):
+    width: float
+    height: float
+    line_count: int
+
+
+# tolerance of width comparisons, so a text wrapped at its own width stays on one line
+_EPSILON = 1e-6
+
+_NARROW = set(" !'()*,-./:;I[]`fijlrt|")
+_WIDE = set("%@MWmw")
+
+
+def _approximate_advance(char: str) -> float:
+    if char in _NARROW:
+        return 0.3
+    if char in _WIDE:
+        return 0.85
+    if "⺀" <= char <= "ￜ":  # CJK and full width forms
+        return 1.0
+    if char.isupper():
+        return 0.65
+    if char.isdigit():
+        return 0.56
+    return 0.52
+
+
+class FontMetrics:
+    """
+    Advances and line height of a font, in em. All measurements of a metrics
+    object go through a bounded cache.
+    """
+    CACHE_SIZE = 4096
+
+    def __init__(
+            self,
+            advances: Mapping[str, float] | Callable[[str], float],
+            line_height: float = 1.17,
+            italic_overhang: float = 0.1,
+            cache_size: int = CACHE_SIZE,
+    ) -> None:
+        """
+        :param advances: advance of each character, or a function returning it.
+        :param line_height: distance between two baselines.
+        :param italic_overhang: extra width of an italic line, due to the slant of its last character.
+        """
+        if isinstance(advances, Mapping):
+            table = dict(advances)
+            fallback = table.get("x", 0.5)
+            self._advance = lambda char: table.get(char, fallback)
+        else:
+            self._advance = advances
+        self._line_height = line_height
+        self._italic_overhang = italic_overhang
+        self.measure = lru_cache(maxsize=cache_size)(self._measure)
+        self.fit = lru_cache(maxsize=cache_size)(self._fit)
+
+    @classmethod
+    def approximate(cls) -> FontMetrics:
+        return cls(lru_cache(maxsize=None)(_approximate_advance))
+
+    @classmethod
+    def from_font_file(cls, path: str) -> FontMetrics:
+        """ reads the metrics of a TrueType/OpenType font, requires ``fonttools`` """
+        try:
+            from fontTools.ttLib import TTFont
+        except ImportError as e:
+            raise ImportError("FontMetrics.from_font_file() requires fonttools: pip install fonttools") from e
+        font = TTFont(path, lazy=True)
+        units_per_em = font["head"].unitsPerEm
+        hhea = font["hhea"]
+        glyph_map = font.getBestCmap()
+        hmtx = font["hmtx"]
+        advances = {
+            chr(code): hmtx[glyph][0] / units_per_em
+            for code, glyph in glyph_map.items()
+        }
+        line_height = (hhea.ascent - hhea.descent + hhea.lineGap) / units_per_em
+        return cls(advances, line_height=line_height)
+
+    def line_width(self, text: str, size: float) -> float:
+        advance = self._advance
+        return sum(advance(char) for char in text) * size
+
+    def _wrap(self, paragraph: str, size: float, wrap_width: float) -> list[float]:
+        """ :returns: the width of each line of paragraph once wrapped at word boundaries """
+        space = self.line_width(" ", size)
+        lines: list[float] = []
+        current = None
+        for word in paragraph.split(" "):
+            width = self.line_width(word, size)
+            if current is not None and current + space + width <= wrap_width + _EPSILON:
+                current += space + width
+                continue
+            if current is not None:
+                lines.append(current)
+            # words longer than a line are broken anywhere
+            while width > wrap_width + _EPSILON and len(word) > 1:
+                cut = 1
+                while cut < len(word) and self.line_width(word[:cut + 1], size) <= wrap_width + _EPSILON:
+                    cut += 1
+                lines.append(self.line_width(word[:cut], size))
+                word = word[cut:]
+                width = self.line_width(word, size)
+            current = width
+        lines.append(current or 0)
+        return lines
+
+    def _measure(self, text: str, size: float, italic: bool = False, wrap_width: float | None = None) -> TextExtent:
+        line_widths: list[float] = []
+        for paragraph in text.split("\n"):
+            if wrap_width is None:
+                line_widths.append(self.line_width(paragraph, size))
+            else:
+                line_widths.extend(self._wrap(paragraph, size, wrap_width))
+        width = max(line_widths)
+        if italic and width > 0:
+            width += self._italic_overhang * size
+        return TextExtent(width, len(line_widths) * self._line_height * size, len(line_widths))
+
+    def _fit(
+            self, text: str, width: float, height: float, italic: bool = False, wrap: bool = True,
+            min_size: int = 1, max_size: int | None = None,
+    ) -> int:
+        """
+        :returns: the largest integer size (at least min_size) at which text fits
+                  in a width x height box, by binary search.
+        """
+        low = min_size
+        high = int(height / self._line_height) if max_size is None else max_size
+        while low < high:
+            size = (low + high + 1) // 2
+            extent = self.measure(text, size, italic, width if wrap else None)
+            if extent.width <= width + _EPSILON and extent.height <= height + _EPSILON:
+                low = size
+            else:
+                high = size - 1
+        return low
+
+
+_font_metrics = FontMetrics.approximate()
+
+
+def font_metrics() -> FontMetrics:
+    return _font_metrics
+
+
+def set_font_metrics(metrics: FontMetrics) -> None:
+    """ sets the metrics used to measure all texts """
+    global _font_metrics
+    _font_metrics = metrics
+
+
+def measure_text(text: str, size: float, italic: bool = False, wrap_width: float | None = None) -> TextExtent:
+    return _font_metrics.measure(text, size, italic, wrap_width)
+
+
+def fit_text_size(
+        text: str, width: float, height: float, italic: bool = False, wrap: bool = True,
+        min_size: int = 1, max_size: int | None = None,
+) -> int:
+    return _font_metrics.fit(text, width, height, italic, wrap, min_size, max_size)
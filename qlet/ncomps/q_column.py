@@ -0,0 +1,151 @@
+from __future__ import annotations
+from typing import Callable, Sequence
+
+import flet as ft
+
+from .core.item import Item, ItemHandle
+from ._typing_shortcut import number, optional_number
+from ._q_linear_layout import _QLinearLayout
+
+
+__all__ = ["QColumn"]
+
+
+class QColumnDefaultVals(_QLinearLayout.DEFAULT_VALUES):
+    pass
+
+
+DEFAULT_VALUES = QColumnDefaultVals
+
+
+class QColumn(_QLinearLayout):
+    """
+    Places its children from top to bottom, ``spacing`` apart.
+    Use ``add_child(child, stretch=1)`` to give a child the free space.
+    """
+    DEFAULT_VALUES = QColumnDefaultVals
+
+    _POSITION = "y"
+    _SIZE = "height"
+    _PADDING_START = "padding_top"
+    _PADDING_END = "padding_bottom"
+
+    def __init__(
+            self,
+            id: str | None = None,
+            children: Item | Sequence[Item] = (),
+
+            # layout
+            spacing: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_spacing,
+
+            # from super: QItem
+            width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_width,
+            height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_height,
+            implicit_width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_width,
+            implicit_height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_height,
+            x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_x,
+            y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_y,
+            z: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_z,
+            expand: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_expand,
+            anchor_left: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_left,
+            anchor_top: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_top,
+            anchor_right: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_right,
+            anchor_bottom: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_bottom,
+            align_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_x,
+            align_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_y,
+            align_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_x,
+            align_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_y,
+            padding: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding,
+            padding_left: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_left,
+            padding_top: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_top,
+            padding_right: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_right,
+            padding_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_bottom,
+            visible: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_visible,
+            opacity: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_opacity,
+            rotate_angle: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_angle,
+            rotate_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_x,
+            rotate_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_y,
+            scale: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale,
+            scale_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_x,
+            scale_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_y,
+            scale_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_x,
+            scale_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_y,
+            border_radius: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_radius,
+            clip_behaviour: ft.ClipBehavior | Callable[[ItemHandle], ft.ClipBehavior] = DEFAULT_VALUES.default_clip_behaviour,
+
+            **kwargs
+    ) -> None:
+        """
+        :param id: The id of the item, used to reference the item by its peers or offspring.
+        :param children: The children of the item, which are items that are contained within the item.
+
+        :param spacing: The space between two consecutive children.
+
+        :param width: The width of the item.
+        :param height: The height of the item.
+        :param implicit_width: The width of the item if width is not defined by any means.
+        :param implicit_height: The height of the item if height is not defined by any means.
+        :param x: The x coordinate of the item.
+        :param y: The y coordinate of the item.
+        :param anchor_left: The global x coordinate of the left side of the item.
+        :param anchor_top: The global y coordinate of the top side of the item.
+        :param anchor_right: The global x coordinate of the right side of the item.
+        :param anchor_bottom: The global y coordinate of the bottom side of the item.
+        :param align_centre_x: The centre of alignment of the item on the x axis. -1 to 1 from left to right.
+        :param align_centre_y: The centre of alignment of the item on the y axis. -1 to 1 from top to bottom.
+        :param align_x: The alignment of the item in its parent. -1 to 1 from left to right.
+        :param align_y: The alignment of the item in its parent. -1 to 1 from top to bottom.
+        :param padding: The padding for all child items.
+        :param padding_left: The padding for the left side of the item.
+        :param padding_top: The padding for the top side of the item.
+        :param padding_right: The padding for the right side of the item.
+        :param padding_bottom: The padding for the bottom side of the item.
+        :param visible: Whether the item is visible.
+        :param opacity: The opacity of the item (affects children opacity).
+        :param rotate_angle: The angle of rotation of the item.
+        :param rotate_centre_x: The centre of rotation of the item on the x axis. -1 to 1 from left to right.
+        :param rotate_centre_y: The centre of rotation of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale: The scale of the item.
+        :param scale_centre_x: The centre of scaling of the item on the x axis. -1 to 1 from left to right.
+        :param scale_centre_y: The centre of scaling of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale_x: The scale of the item on the x axis.
+        :param scale_y: The scale of the item on the y axis.
+        :param border_radius: The border radius of the item.
+        :param clip_behaviour: The clip behaviour of the item.
+        """
+        super().__init__(
+            id, children, spacing,
+            width=width, height=height, implicit_width=implicit_width, implicit_height=implicit_height,
+            x=x, y=y, z=z, expand=expand, anchor_left=anchor_left, anchor_top=anchor_top,
+            anchor_right=anchor_right, anchor_bottom=anchor_bottom, align_centre_x=align_centre_x,
+            align_centre_y=align_centre_y, align_x=align_x, align_y=align_y, padding=padding,
+            padding_left=padding_left, padding_top=padding_top, padding_right=padding_right,
+            padding_bottom=padding_bottom, visible=visible, opacity=opacity, rotate_angle=rotate_angle,
+            rotate_centre_x=rotate_centre_x, rotate_centre_y=rotate_centre_y, scale=scale,
+            scale_centre_x=scale_centre_x, scale_centre_y=scale_centre_y, scale_x=scale_x, scale_y=scale_y,
+            border_radius=border_radius, clip_behaviour=clip_behaviour,
+            **kwargs,
+        )
+
+
+if __name__ == "__main__":
+    from .q_root_item import QRootItem
+    from .q_rect import QRect
+
+    def main(page: ft.Page):
+        page.padding = 0
+        root_item = QRootItem.auto_init_page(page=page)
+        container = QColumn(
+            width=lambda d: d.parent.width,
+            height=lambda d: d.parent.height,
+            spacing=10,
+            padding=10,
+        )
+        root_item.add_child(container)
+        container.add_child(QRect(height=100, width=100, bgcolour="#FF0000"))
+        container.add_child(QRect(width=100, bgcolour="#00FF00"), stretch=1)
+        container.add_child(QRect(width=100, bgcolour="#0000FF"), stretch=2, max_size=200)
+        root_item.compute()
+        page.update()
+
+    ft.app(target=main)
@@ -0,0 +1,327 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import flet as ft
+
+from .core.item import Item, ItemHandle
+from ._typing_shortcut import number, optional_number
+from ._q_layout import _QLayout
+from .q_item import QItem
+
+
+__all__ = ["QGrid", "GridTrack"]
+
+
+AUTO = "auto"
+FIXED = "fixed"
+FRACTION = "fr"
+
+
+@dataclass(frozen=True, slots=True)
+class GridTrack:
+    """
+    Definition of a row or a column of a ``QGrid``:
+    - ``GridTrack.fixed(100)`` or ``100``: exactly 100 high (wide)
+    - ``GridTrack.fraction(2)`` or ``"2fr"``: a share of the space left by the other tracks
+    - ``GridTrack.auto()`` or ``"auto"``: as large as the largest implicit size of its cells
+    """
+    kind: str
+    value: number = 0
+
+    @classmethod
+    def fixed(cls, size: number) -> GridTrack:
+        return cls(FIXED, size)
+
+    @classmethod
+    def fraction(cls, share: number = 1) -> GridTrack:
+        return cls(FRACTION, share)
+
+    @classmethod
+    def auto(cls) -> GridTrack:
+        return cls(AUTO)
+
+    @classmethod
+    def parse(cls, track: GridTrack | number | str) -> GridTrack:
+        if isinstance(track, GridTrack):
+            return track
+        if isinstance(track, (int, float)):
+            return cls.fixed(track)
+        track = track.strip()
+        if track == AUTO:
+            return cls.auto()
+        if track.endswith(FRACTION):
+            return cls.fraction(float(track[:-len(FRACTION)] or 1))
+        return cls.fixed(float(track))
+
+
+@dataclass(slots=True)
+class _GridCell:
+    row: int
+    column: int
+    row_span: int
+    column_span: int
+
+
+def _track_offsets(
+        tracks: Sequence[GridTrack],
+        available: number,
+        spacing: number,
+        implicit_sizes: dict[int, number],
+) -> list[number]:
+    """
+    :param implicit_sizes: largest implicit size of the cells spanning a single track, by track.
+    :returns: the offset of every track, followed by the end of the last track.
+    """
+    sizes = []
+    free = available - spacing * (len(tracks) - 1)
+    fractions = 0
+    for index, track in enumerate(tracks):
+        if track.kind == FIXED:
+            size = track.value
+        elif track.kind == AUTO:
+            size = implicit_sizes.get(index, 0)
+        else:
+            size = 0
+            fractions += track.value
+        sizes.append(size)
+        free -= size
+    if fractions > 0:
+        unit = max(free, 0) / fractions
+        for index, track in enumerate(tracks):
+            if track.kind == FRACTION:
+                sizes[index] = unit * track.value
+    offsets = [0]
+    for size in sizes:
+        offsets.append(offsets[-1] + size + spacing)
+    offsets[-1] -= spacing
+    return offsets
+
+
+class QGridDefaultVals(_QLayout.DEFAULT_VALUES):
+    default_row_tracks = (GridTrack.fraction(),)
+    default_column_tracks = (GridTrack.fraction(),)
+    default_row_spacing = 0
+    default_column_spacing = 0
+
+
+DEFAULT_VALUES = QGridDefaultVals
+
+
+class QGrid(_QLayout):
+    """
+    Places its children in the cells of a grid defined by row and column tracks
+    (see ``GridTrack``). The offsets of all tracks are computed in one pass, and
+    the geometry of every child is written directly from them, so no child
+    depends on its peers. Children fill their cells: ``add_child(child, row=1,
+    column=0, column_span=2)``.
+    """
+    DEFAULT_VALUES = QGridDefaultVals
+
+    @_QLayout.cached_classproperty
+    def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
+        return super()._RESERVED_PROPERTY_NAMES | {
+            "column_spacing", "column_tracks",
+            "row_spacing", "row_tracks",
+        }
+
+    def __init__(
+            self,
+            id: str | None = None,
+            children: Item | Sequence[Item] = (),
+
+            # layout
+            row_tracks: Sequence[GridTrack | number | str] | Callable[[ItemHandle], Sequence[GridTrack | number | str]] = DEFAULT_VALUES.default_row_tracks,
+            column_tracks: Sequence[GridTrack | number | str] | Callable[[ItemHandle], Sequence[GridTrack | number | str]] = DEFAULT_VALUES.default_column_tracks,
+            row_spacing: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_row_spacing,
+            column_spacing: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_column_spacing,
+
+            # from super: QItem
+            width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_width,
+            height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_height,
+            implicit_width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_width,
+            implicit_height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_height,
+            x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_x,
+            y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_y,
+            z: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_z,
+            expand: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_expand,
+            anchor_left: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_left,
+            anchor_top: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_top,
+            anchor_right: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_right,
+            anchor_bottom: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_bottom,
+            align_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_x,
+            align_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_y,
+            align_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_x,
+            align_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_y,
+            padding: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding,
+            padding_left: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_left,
+            padding_top: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_top,
+            padding_right: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_right,
+            padding_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_bottom,
+            visible: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_visible,
+            opacity: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_opacity,
+            rotate_angle: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_angle,
+            rotate_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_x,
+            rotate_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_y,
+            scale: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale,
+            scale_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_x,
+            scale_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_y,
+            scale_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_x,
+            scale_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_y,
+            border_radius: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_radius,
+            clip_behaviour: ft.ClipBehavior | Callable[[ItemHandle], ft.ClipBehavior] = DEFAULT_VALUES.default_clip_behaviour,
+
+            **kwargs
+    ) -> None:
+        """
+        :param id: The id of the item, used to reference the item by its peers or offspring.
+        :param children: The children of the item, placed in the first cell unless added with ``add_child()``.
+
+        :param row_tracks: The rows of the grid, from top to bottom.
+        :param column_tracks: The columns of the grid, from left to right.
+        :param row_spacing: The space between two consecutive rows.
+        :param column_spacing: The space between two consecutive columns.
+
+        :param width: The width of the item.
+        :param height: The height of the item.
+        :param implicit_width: The width of the item if width is not defined by any means.
+        :param implicit_height: The height of the item if height is not defined by any means.
+        :param x: The x coordinate of the item.
+        :param y: The y coordinate of the item.
+        :param anchor_left: The global x coordinate of the left side of the item.
+        :param anchor_top: The global y coordinate of the top side of the item.
+        :param anchor_right: The global x coordinate of the right side of the item.
+        :param anchor_bottom: The global y coordinate of the bottom side of the item.
+        :param align_centre_x: The centre of alignment of the item on the x axis. -1 to 1 from left to right.
+        :param align_centre_y: The centre of alignment of the item on the y axis. -1 to 1 from top to bottom.
+        :param align_x: The alignment of the item in its parent. -1 to 1 from left to right.
+        :param align_y: The alignment of the item in its parent. -1 to 1 from top to bottom.
+        :param padding: The padding for all child items.
+        :param padding_left: The padding for the left side of the item.
+        :param padding_top: The padding for the top side of the item.
+        :param padding_right: The padding for the right side of the item.
+        :param padding_bottom: The padding for the bottom side of the item.
+        :param visible: Whether the item is visible.
+        :param opacity: The opacity of the item (affects children opacity).
+        :param rotate_angle: The angle of rotation of the item.
+        :param rotate_centre_x: The centre of rotation of the item on the x axis. -1 to 1 from left to right.
+        :param rotate_centre_y: The centre of rotation of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale: The scale of the item.
+        :param scale_centre_x: The centre of scaling of the item on the x axis. -1 to 1 from left to right.
+        :param scale_centre_y: The centre of scaling of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale_x: The scale of the item on the x axis.
+        :param scale_y: The scale of the item on the y axis.
+        :param border_radius: The border radius of the item.
+        :param clip_behaviour: The clip behaviour of the item.
+        """
+        self._cells: dict[Item, _GridCell] = {}
+        self._rows: tuple[GridTrack, ...] = ()
+        self._columns: tuple[GridTrack, ...] = ()
+
+        super().__init__(
+            id, children,
+            width=width, height=height, implicit_width=implicit_width, implicit_height=implicit_height,
+            x=x, y=y, z=z, expand=expand, anchor_left=anchor_left, anchor_top=anchor_top,
+            anchor_right=anchor_right, anchor_bottom=anchor_bottom, align_centre_x=align_centre_x,
+            align_centre_y=align_centre_y, align_x=align_x, align_y=align_y, padding=padding,
+            padding_left=padding_left, padding_top=padding_top, padding_right=padding_right,
+            padding_bottom=padding_bottom, visible=visible, opacity=opacity, rotate_angle=rotate_angle,
+            rotate_centre_x=rotate_centre_x, rotate_centre_y=rotate_centre_y, scale=scale,
+            scale_centre_x=scale_centre_x, scale_centre_y=scale_centre_y, scale_x=scale_x, scale_y=scale_y,
+            border_radius=border_radius, clip_behaviour=clip_behaviour,
+            **kwargs,
+        )
+
+        self.row_tracks: Sequence[GridTrack] = row_tracks
+        self.column_tracks: Sequence[GridTrack] = column_tracks
+        self.row_spacing: number = row_spacing
+        self.column_spacing: number = column_spacing
+
+    def add_child(
+            self,
+            new_child: QItem,
+            row: int = 0,
+            column: int = 0,
+            row_span: int = 1,
+            column_span: int = 1,
+    ) -> None:
+        assert row_span >= 1 and column_span >= 1, f"spans must be positive: {row_span}, {column_span}"
+        super().add_child(new_child)
+        self._cells[new_child] = _GridCell(row, column, row_span, column_span)
+
+    def remove_child(self, removed_child: QItem) -> None:
+        super().remove_child(removed_child)
+        del self._cells[removed_child]
+
+    def _on_row_tracks_change(self) -> None:
+        self._rows = tuple(GridTrack.parse(track) for track in self.row_tracks)
+
+    def _on_column_tracks_change(self) -> None:
+        self._columns = tuple(GridTrack.parse(track) for track in self.column_tracks)
+
+    def _layout_children(self) -> bool:
+        rows, columns = self._rows, self._columns
+        cells = [
+            (child, self._cells[child])
+            for child in self._children
+            if child.visible
+        ]
+        for child, cell in cells:
+            assert cell.row + cell.row_span <= len(rows) and cell.column + cell.column_span <= len(columns), \
+                f"{child.displayed_id} is out of the {len(rows)}x{len(columns)} tracks of {self.displayed_id}"
+
+        implicit_heights: dict[int, number] = {}
+        implicit_widths: dict[int, number] = {}
+        for child, cell in cells:
+            if cell.row_span == 1 and rows[cell.row].kind == AUTO:
+                implicit_heights[cell.row] = max(implicit_heights.get(cell.row, 0), child.implicit_height)
+            if cell.column_span == 1 and columns[cell.column].kind == AUTO:
+                implicit_widths[cell.column] = max(implicit_widths.get(cell.column, 0), child.implicit_width)
+
+        row_spacing, column_spacing = self.row_spacing, self.column_spacing
+        y_offsets = _track_offsets(
+            rows, self.height - self.padding_top - self.padding_bottom, row_spacing, implicit_heights,
+        )
+        x_offsets = _track_offsets(
+            columns, self.width - self.padding_left - self.padding_right, column_spacing, implicit_widths,
+        )
+
+        changed = False
+        for child, cell in cells:
+            row_end, column_end = cell.row + cell.row_span, cell.column + cell.column_span
+            x, y = x_offsets[cell.column], y_offsets[cell.row]
+            width = x_offsets[column_end] - x - (column_spacing if column_end < len(columns) else 0)
+            height = y_offsets[row_end] - y - (row_spacing if row_end < len(rows) else 0)
+            changed |= self._place(child, "x", x)
+            changed |= self._place(child, "y", y)
+            changed |= self._place(child, "width", width)
+            changed |= self._place(child, "height", height)
+        return changed
+
+
+if __name__ == "__main__":
+    from .q_root_item import QRootItem
+    from .q_rect import QRect
+
+    def main(page: ft.Page):
+        page.padding = 0
+        root_item = QRootItem.auto_init_page(page=page)
+        grid = QGrid(
+            width=lambda d: d.parent.width,
+            height=lambda d: d.parent.height,
+            row_tracks=[60, "1fr", "auto"],
+            column_tracks=[200, "1fr", "2fr"],
+            row_spacing=4,
+            column_spacing=4,
+        )
+        root_item.add_child(grid)
+        grid.add_child(QRect(bgcolour="#FF0000"), row=0, column=0, column_span=3)
+        grid.add_child(QRect(bgcolour="#00FF00"), row=1, column=0, row_span=2)
+        grid.add_child(QRect(bgcolour="#0000FF"), row=1, column=1)
+        grid.add_child(QRect(bgcolour="#FFFF00"), row=1, column=2)
+        grid.add_child(QRect(bgcolour="#00FFFF", implicit_height=40), row=2, column=1)
+        grid.add_child(QRect(bgcolour="#FF00FF"), row=2, column=2)
+        root_item.compute()
+        page.update()
+
+    ft.app(target=main)
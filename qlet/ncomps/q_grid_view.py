@@ -0,0 +1,231 @@
+from __future__ import annotations
+from math import ceil
+from typing import Callable, Sequence
+
+import flet as ft
+
+from .core.item import Item, ItemHandle
+from ._typing_shortcut import number, optional_number
+from ._q_virtual_view import _QVirtualView
+from .q_item import QItem
+
+
+__all__ = ["QGridView"]
+
+
+class QGridViewDefaultVals(_QVirtualView.DEFAULT_VALUES):
+    default_item_count = 0
+    default_cell_width = 100
+    default_cell_height = 100
+    default_column_count = None
+
+
+DEFAULT_VALUES = QGridViewDefaultVals
+
+
+class QGridView(_QVirtualView):
+    """
+    A vertically scrolling grid of equally sized cells that only materializes
+    the rows of cells inside its viewport (plus ``overscan`` rows on each side).
+    Cells are created by ``delegate(index)`` and recycled like in ``QListView``.
+    """
+    DEFAULT_VALUES = QGridViewDefaultVals
+
+    @_QVirtualView.cached_classproperty
+    def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
+        return super()._RESERVED_PROPERTY_NAMES | {
+            "cell_height", "cell_width", "column_count",
+            "item_count",
+        }
+
+    def __init__(
+            self,
+            id: str | None = None,
+            children: Item | Sequence[Item] = (),
+            delegate: Callable[[int], QItem] | None = None,
+            bind: Callable[[QItem, int], None] | None = None,
+
+            # cells
+            item_count: int | Callable[[ItemHandle], int] = DEFAULT_VALUES.default_item_count,
+            cell_width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_cell_width,
+            cell_height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_cell_height,
+            column_count: int | None | Callable[[ItemHandle], int | None] = DEFAULT_VALUES.default_column_count,
+            scroll_offset: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scroll_offset,
+            overscan: int | Callable[[ItemHandle], int] = DEFAULT_VALUES.default_overscan,
+
+            # from super: QItem
+            width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_width,
+            height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_height,
+            implicit_width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_width,
+            implicit_height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_height,
+            x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_x,
+            y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_y,
+            z: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_z,
+            expand: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_expand,
+            anchor_left: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_left,
+            anchor_top: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_top,
+            anchor_right: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_right,
+            anchor_bottom: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_bottom,
+            align_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_x,
+            align_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_y,
+            align_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_x,
+            align_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_y,
+            padding: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding,
+            padding_left: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_left,
+            padding_top: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_top,
+            padding_right: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_right,
+            padding_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_bottom,
+            visible: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_visible,
+            opacity: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_opacity,
+            rotate_angle: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_angle,
+            rotate_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_x,
+            rotate_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_y,
+            scale: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale,
+            scale_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_x,
+            scale_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_y,
+            scale_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_x,
+            scale_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_y,
+            border_radius: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_radius,
+            clip_behaviour: ft.ClipBehavior | Callable[[ItemHandle], ft.ClipBehavior] = DEFAULT_VALUES.default_clip_behaviour,
+
+            **kwargs
+    ) -> None:
+        """
+        :param id: The id of the item, used to reference the item by its peers or offspring.
+        :param children: Static children, not managed by the view.
+        :param delegate: Creates the cell of an index.
+        :param bind: Updates an existing cell to show another index.
+
+        :param item_count: The number of cells.
+        :param cell_width: The width of every cell.
+        :param cell_height: The height of every cell.
+        :param column_count: The number of columns, as many as fit in the viewport if None.
+        :param scroll_offset: The offset of the viewport from the top of the first row of cells.
+        :param overscan: The number of rows of cells materialized beyond each side of the viewport.
+
+        :param width: The width of the item.
+        :param height: The height of the item.
+        :param implicit_width: The width of the item if width is not defined by any means.
+        :param implicit_height: The height of the item if height is not defined by any means.
+        :param x: The x coordinate of the item.
+        :param y: The y coordinate of the item.
+        :param anchor_left: The global x coordinate of the left side of the item.
+        :param anchor_top: The global y coordinate of the top side of the item.
+        :param anchor_right: The global x coordinate of the right side of the item.
+        :param anchor_bottom: The global y coordinate of the bottom side of the item.
+        :param align_centre_x: The centre of alignment of the item on the x axis. -1 to 1 from left to right.
+        :param align_centre_y: The centre of alignment of the item on the y axis. -1 to 1 from top to bottom.
+        :param align_x: The alignment of the item in its parent. -1 to 1 from left to right.
+        :param align_y: The alignment of the item in its parent. -1 to 1 from top to bottom.
+        :param padding: The padding for all child items.
+        :param padding_left: The padding for the left side of the item.
+        :param padding_top: The padding for the top side of the item.
+        :param padding_right: The padding for the right side of the item.
+        :param padding_bottom: The padding for the bottom side of the item.
+        :param visible: Whether the item is visible.
+        :param opacity: The opacity of the item (affects children opacity).
+        :param rotate_angle: The angle of rotation of the item.
+        :param rotate_centre_x: The centre of rotation of the item on the x axis. -1 to 1 from left to right.
+        :param rotate_centre_y: The centre of rotation of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale: The scale of the item.
+        :param scale_centre_x: The centre of scaling of the item on the x axis. -1 to 1 from left to right.
+        :param scale_centre_y: The centre of scaling of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale_x: The scale of the item on the x axis.
+        :param scale_y: The scale of the item on the y axis.
+        :param border_radius: The border radius of the item.
+        :param clip_behaviour: The clip behaviour of the item.
+        """
+        super().__init__(
+            id, children, delegate, bind, scroll_offset, overscan,
+            width=width, height=height, implicit_width=implicit_width, implicit_height=implicit_height,
+            x=x, y=y, z=z, expand=expand, anchor_left=anchor_left, anchor_top=anchor_top,
+            anchor_right=anchor_right, anchor_bottom=anchor_bottom, align_centre_x=align_centre_x,
+            align_centre_y=align_centre_y, align_x=align_x, align_y=align_y, padding=padding,
+            padding_left=padding_left, padding_top=padding_top, padding_right=padding_right,
+            padding_bottom=padding_bottom, visible=visible, opacity=opacity, rotate_angle=rotate_angle,
+            rotate_centre_x=rotate_centre_x, rotate_centre_y=rotate_centre_y, scale=scale,
+            scale_centre_x=scale_centre_x, scale_centre_y=scale_centre_y, scale_x=scale_x, scale_y=scale_y,
+            border_radius=border_radius, clip_behaviour=clip_behaviour,
+            **kwargs,
+        )
+
+        self.item_count: int = item_count
+        self.cell_width: number = cell_width
+        self.cell_height: number = cell_height
+        self.column_count: int | None = column_count
+
+    @property
+    def columns(self) -> int:
+        if self.column_count is not None:
+            return max(self.column_count, 1)
+        if self.cell_width <= 0:
+            return 1
+        return max(int(self.viewport_width // self.cell_width), 1)
+
+    @property
+    def content_height(self) -> number:
+        return ceil(self.item_count / self.columns) * self.cell_height
+
+    def _on_item_count_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_cell_width_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_cell_height_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_column_count_change(self) -> None:
+        self._outdate_layout()
+
+    def _index_top(self, index: int) -> number:
+        return index // self.columns * self.cell_height
+
+    def _visible_indices(self) -> range:
+        count = self.item_count
+        viewport_height = self.viewport_height
+        if count <= 0 or viewport_height <= 0 or self.cell_height <= 0:
+            return range(0)
+        columns = self.columns
+        offset = self._clamped_scroll_offset()
+        first_row = int(offset // self.cell_height) - self.overscan
+        last_row = int((offset + viewport_height) // self.cell_height) + self.overscan
+        return range(max(first_row, 0) * columns, min((last_row + 1) * columns, count))
+
+    def _placement(self, index: int) -> tuple[number, number, number, number]:
+        row, column = divmod(index, self.columns)
+        return (
+            column * self.cell_width,
+            row * self.cell_height - self._clamped_scroll_offset(),
+            self.cell_width,
+            self.cell_height,
+        )
+
+
+if __name__ == "__main__":
+    from .q_root_item import QRootItem
+    from .q_text import QText
+
+    def main(page: ft.Page):
+        page.padding = 0
+        root_item = QRootItem.auto_init_page(page=page)
+        grid_view = QGridView(
+            width=lambda d: d.parent.width,
+            height=lambda d: d.parent.height,
+            item_count=100_000,
+            cell_width=120,
+            cell_height=80,
+            delegate=lambda index: QText(text=f"cell {index}", bgcolour="#333333", inset=2),
+            bind=lambda item, index: setattr(item, "text", f"cell {index}"),
+        )
+        root_item.add_child(grid_view)
+
+        def on_keyboard(e: ft.KeyboardEvent):
+            grid_view.scroll_by({"Arrow Down": 80, "Arrow Up": -80, "Page Down": 800, "Page Up": -800}.get(e.key, 0))
+            root_item.compute()
+            page.update()
+
+        page.on_keyboard_event = on_keyboard
+        page.update()
+
+    ft.app(target=main)
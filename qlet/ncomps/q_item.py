@@ -1,15 +1,40 @@
 from __future__ import annotations
-import random
-from typing import Callable, Sequence
+import math
+from typing import Any, Callable, Literal, Sequence, TYPE_CHECKING
+from weakref import ref
 
 import flet as ft
 
+from .core.effect import effect
 from .core.item import Item, ItemHandle
 from .core.colour import is_light
+from ._control_tracker import _ControlTracker
 from ._typing_shortcut import number, optional_number
 
 
-__all__ = ["QItem"]
+if TYPE_CHECKING:
+    from .q_root_item import QRootItem
+
+
+__all__ = ["QItem", "RenderMode"]
+
+
+# "wrapped" places items by alignment in nested wrapper controls,
+# "absolute" places the same content and background wrappers at left/top in a stack per item,
+# "lean" places each item as a single positioned container in its parent's stack
+RenderMode = Literal["wrapped", "absolute", "lean"]
+
+
+def _wrapped(item: QItem) -> bool:
+    return item.RENDER_MODE == "wrapped"
+
+
+def _absolute(item: QItem) -> bool:
+    return item.RENDER_MODE == "absolute"
+
+
+def _lean(item: QItem) -> bool:
+    return item.RENDER_MODE == "lean"
 
 
 class QItemDefaultVals:
@@ -110,25 +135,27 @@ class QItemDefaultVals:
     default_right = lambda d: d.global_x + d.width
     default_bottom = lambda d: d.global_y + d.height
 
-    @staticmethod
-    def default_READY_align_x(d: ItemHandle) -> number:
-        d.x, d.width, d.parent.width
-        d.padding_left, d.padding_right
-        return random.random()
-
-    @staticmethod
-    def default_READY_align_y(d: ItemHandle) -> number:
-        d.y, d.height, d.parent.height
-        d.padding_top, d.padding_bottom
-        return random.random()
-
 
 DEFAULT_VALUES = QItemDefaultVals
 
 
-class QItem(Item):
+class QItem(Item, _ControlTracker):
     DEFAULT_VALUES = QItemDefaultVals
 
+    # the flet control tree of the items of the class, set on a subclass to change it
+    RENDER_MODE: RenderMode = "wrapped"
+
+    # whether the controls of the children may not be ordered by z any more
+    _z_order_outdated = False
+
+    # the root whose spatial index lists the item, geometry changes are only tracked under such a root
+    _indexed_by: QRootItem | None = None
+    # the root whose spatial index waits for the geometry of the item
+    _geometry_queued: QRootItem | None = None
+
+    # whether the root culling off-screen items hides this one
+    _culled = False
+
     @Item.cached_classproperty
     def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
         return super()._RESERVED_PROPERTY_NAMES | {
@@ -143,7 +170,6 @@ class QItem(Item):
             "left",
             "opacity",
             "padding", "padding_bottom", "padding_left", "padding_right", "padding_top",
-            "READY_align_x", "READY_align_y", "READY_border_horizontal", "READY_border_vertical",
             "right", "rotate_angle", "rotate_centre_x", "rotate_centre_y",
             "scale", "scale_centre_x", "scale_centre_y", "scale_x", "scale_y",
             "top",
@@ -154,6 +180,25 @@ class QItem(Item):
             "z",
         }
 
+    @Item.cached_classproperty
+    def _SHARED_DEFAULTS(cls) -> dict[str, Any]:
+        # only the QItem defaults leave the flet controls as they are, a default overridden by a
+        # subclass (e.g. the clip of the virtual views) is a property of each item, applied by its handler
+        shared = {}
+        for name in (
+            "implicit_width", "implicit_height", "z", "expand",
+            "anchor_left", "anchor_top", "anchor_right", "anchor_bottom",
+            "align_centre_x", "align_centre_y", "align_x", "align_y",
+            "padding", "visible", "opacity",
+            "rotate_angle", "rotate_centre_x", "rotate_centre_y",
+            "scale", "scale_centre_x", "scale_centre_y", "scale_x", "scale_y",
+            "border_radius", "clip_behaviour",
+        ):
+            default = getattr(cls.DEFAULT_VALUES, f"default_{name}")
+            if default is getattr(QItemDefaultVals, f"default_{name}") and not callable(default):
+                shared[name] = default
+        return super()._SHARED_DEFAULTS | shared
+
     def __init__(
             self,
             id: str | None = None,
@@ -233,10 +278,11 @@ class QItem(Item):
         :param border_radius: The border radius of the item.
         :param clip_behaviour: The clip behaviour of the item.
         """
-        self._frame = ft.Stack()
-        self._root_component: ft.Stack
-        self._content_container: ft.Container
-        self._init_flet()
+        if not self._reusing:
+            self._frame = ft.Stack()
+            self._root_component: ft.Stack
+            self._content_container: ft.Container
+            self._init_flet()
 
         super().__init__(
             id, False, children,
@@ -285,10 +331,13 @@ class QItem(Item):
         self.right: number = QItemDefaultVals.default_right
         self.bottom: number = QItemDefaultVals.default_bottom
 
-        self.READY_align_x: number = QItemDefaultVals.default_READY_align_x
-        self.READY_align_y: number = QItemDefaultVals.default_READY_align_y
-
     def _init_flet(self) -> None:
+        if self.RENDER_MODE == "lean":
+            self._init_lean_flet()
+            return
+        if self.RENDER_MODE == "absolute":
+            self._init_absolute_flet()
+            return
         self._content_container = ft.Container(
             content=self._frame,
             rotate=ft.Rotate(0, ft.Alignment(0, 0)),
@@ -310,15 +359,70 @@ class QItem(Item):
                 self._l1_content_tr_pointer,
             ],
         )
-        object.__setattr__(self._root_component, "q_data", self)
+        object.__setattr__(self._root_component, "q_data", ref(self))
+        self._frame_chain = (
+            self._root_component,
+            self._l1_content_tr_pointer,
+            self._l1_content_conainter,
+            self._l2_content_tr_pointer,
+            self._content_container,
+            self._frame,
+        )
+
+    def _init_absolute_flet(self) -> None:
+        """ a stack positioned at the item's box, with the content positioned inside its padding """
+        self._content_container = ft.Container(
+            content=self._frame,
+            rotate=ft.Rotate(0, ft.Alignment(0, 0)),
+            scale=ft.Scale(alignment=ft.Alignment(0, 0)),
+        )
+        self._l1_content_tr_pointer = ft.TransparentPointer(
+            content=self._content_container,
+        )
+        self._root_component = ft.Stack(
+            controls=[
+                self._l1_content_tr_pointer,
+            ],
+            clip_behavior=ft.ClipBehavior.NONE,
+        )
+        object.__setattr__(self._root_component, "q_data", ref(self))
+        self._frame_chain = (
+            self._root_component,
+            self._l1_content_tr_pointer,
+            self._content_container,
+            self._frame,
+        )
+
+    def _init_lean_flet(self) -> None:
+        """ a single container, positioned in the stack of the parent, around the frame """
+        self._content_container = ft.Container(
+            content=self._frame,
+            rotate=ft.Rotate(0, ft.Alignment(0, 0)),
+            scale=ft.Scale(alignment=ft.Alignment(0, 0)),
+        )
+        self._root_component = self._content_container
+        object.__setattr__(self._root_component, "q_data", ref(self))
+        self._frame_chain = (self._root_component, self._frame)
 
     def _on_width_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] width: {self.width}")
-        pass
+        self._geometry_changed()
 
     def _on_height_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] height: {self.height}")
-        pass
+        self._geometry_changed()
+
+    def _on_global_x_change(self) -> None:
+        self._geometry_changed()
+
+    def _on_global_y_change(self) -> None:
+        self._geometry_changed()
+
+    def _geometry_changed(self) -> None:
+        """ queues the item for the spatial index of its root, if the root keeps one """
+        root = self._indexed_by
+        if root is not None and self._geometry_queued is None:
+            root._queue_geometry((self,))
 
     def _on_x_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] x: {self.x}")
@@ -328,58 +432,86 @@ class QItem(Item):
         # print(f"{self.__class__.__name__}[{self.displayed_id}] y: {self.y}")
         pass
 
+    def _on_z_change(self) -> None:
+        parent = self.parent
+        if parent is not None:
+            parent._z_order_outdated = True
+
     def _on_visible_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] visible: {self.visible}")
-        self._root_component.visible = self.visible
+        self._root_component.visible = self.visible and not self._culled
+        self._touch(self._root_component)
+
+    def _set_culled(self, culled: bool) -> None:
+        """ hides the item from flet while it is off-screen, see QRootItem.cull """
+        if culled == self._culled:
+            return
+        self._culled = culled
+        self._root_component.visible = self.visible and not culled
+        self._touch(self._root_component)
 
     def _on_opacity_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] opacity: {self.opacity}")
         self._root_component.opacity = self.opacity
+        self._touch(self._root_component)
         # self._content_container.opacity = self.opacity
 
     def _on_rotate_angle_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] rotate_angle: {self.rotate_angle}")
         self._content_container.rotate.angle = self.rotate_angle
+        self._touch(self._content_container)
 
     def _on_rotate_centre_x_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] rotate_centre_x: {self.rotate_centre_x}")
         self._content_container.rotate.alignment.x = self.rotate_centre_x
+        self._touch(self._content_container)
 
     def _on_rotate_centre_y_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] rotate_centre_y: {self.rotate_centre_y}")
         self._content_container.rotate.alignment.y = self.rotate_centre_y
+        self._touch(self._content_container)
 
     def _on_scale_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale: {self.scale}")
         self._content_container.scale.scale = self.scale
+        self._touch(self._content_container)
 
     def _on_scale_centre_x_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_centre_x: {self.scale_centre_x}")
         self._content_container.scale.alignment.x = self.scale_centre_x
+        self._touch(self._content_container)
 
     def _on_scale_centre_y_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_centre_y: {self.scale_centre_y}")
         self._content_container.scale.alignment.y = self.scale_centre_y
+        self._touch(self._content_container)
 
     def _on_scale_x_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_x: {self.scale_x}")
         self._content_container.scale.scale_x = self.scale_x
+        self._touch(self._content_container)
 
     def _on_scale_y_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_y: {self.scale_y}")
         self._content_container.scale.scale_y = self.scale_y
+        self._touch(self._content_container)
 
     def _on_border_radius_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] border_radius: {self.border_radius}")
         self._content_container.border_radius = self.border_radius
+        self._touch(self._content_container)
 
     def _on_clip_behaviour_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] clip_behaviour: {self.clip_behaviour}")
         self._content_container.clip_behavior = self.clip_behaviour
+        self._touch(self._content_container)
 
-    def _on_READY_align_x_change(self) -> None:
+    @effect("x", "width", "padding_left", "padding_right", "parent.width", "parent.padding_left", "parent.padding_right",
+            when=_wrapped)
+    def _apply_align_x(self) -> None:
         width = self.width - self.padding_left - self.padding_right
         self._l2_content_tr_pointer.width = width
+        self._touch(self._l2_content_tr_pointer)
         self._l1_content_conainter.padding.left = -width / 2
         self._l1_content_conainter.padding.right = -width / 2
 
@@ -387,10 +519,14 @@ class QItem(Item):
         parent_width = self.parent.width - self.parent.padding_left - self.parent.padding_right
         align_x = (original_centre_x / parent_width) * 2 - 1
         self._l1_content_conainter.alignment.x = align_x
-    
-    def _on_READY_align_y_change(self) -> None:
+        self._touch(self._l1_content_conainter)
+
+    @effect("y", "height", "padding_top", "padding_bottom", "parent.height", "parent.padding_top", "parent.padding_bottom",
+            when=_wrapped)
+    def _apply_align_y(self) -> None:
         height = self.height - self.padding_top - self.padding_bottom
         self._l2_content_tr_pointer.height = height
+        self._touch(self._l2_content_tr_pointer)
         self._l1_content_conainter.padding.top = -height / 2
         self._l1_content_conainter.padding.bottom = -height / 2
 
@@ -398,13 +534,67 @@ class QItem(Item):
         parent_height = self.parent.height - self.parent.padding_top - self.parent.padding_bottom
         align_y = (original_centre_y / parent_height) * 2 - 1
         self._l1_content_conainter.alignment.y = align_y
+        self._touch(self._l1_content_conainter)
+
+    @effect("x", "width", "padding_left", "padding_right", when=_absolute)
+    def _apply_absolute_x(self) -> None:
+        self._root_component.left = self.x
+        self._root_component.width = self.width
+        self._touch(self._root_component)
+        self._l1_content_tr_pointer.left = self.padding_left
+        self._l1_content_tr_pointer.width = self.width - self.padding_left - self.padding_right
+        self._touch(self._l1_content_tr_pointer)
+
+    @effect("y", "height", "padding_top", "padding_bottom", when=_absolute)
+    def _apply_absolute_y(self) -> None:
+        self._root_component.top = self.y
+        self._root_component.height = self.height
+        self._touch(self._root_component)
+        self._l1_content_tr_pointer.top = self.padding_top
+        self._l1_content_tr_pointer.height = self.height - self.padding_top - self.padding_bottom
+        self._touch(self._l1_content_tr_pointer)
+
+    @effect("x", "width", "padding_left", "padding_right", when=_lean)
+    def _apply_lean_x(self) -> None:
+        self._root_component.left = self.x + self.padding_left
+        self._root_component.width = self.width - self.padding_left - self.padding_right
+        self._touch(self._root_component)
+
+    @effect("y", "height", "padding_top", "padding_bottom", when=_lean)
+    def _apply_lean_y(self) -> None:
+        self._root_component.top = self.y + self.padding_top
+        self._root_component.height = self.height - self.padding_top - self.padding_bottom
+        self._touch(self._root_component)
 
     def _on_children_computed(self) -> None:
         super()._on_children_computed()
+        if not self._z_order_outdated:
+            return
+        self._z_order_outdated = False
         def safe_z(control: ft.Control) -> number:
-            return control.q_data.z if hasattr(control, "q_data") else 0
-        self._frame.controls.sort(key=safe_z)
+            return control.q_data().z if hasattr(control, "q_data") else -math.inf
+        controls = self._frame.controls
+        ordered = sorted(controls, key=safe_z)
+        if ordered != controls:
+            controls[:] = ordered
+            self._touch(self._frame)
 
     def add_child(self, new_child: QItem) -> None:
         super().add_child(new_child)
         self._frame.controls.append(new_child._root_component)
+        self._touch(self._frame)
+        self._z_order_outdated = True
+        root = self._tracking_root()
+        if root is not None:
+            root._queue_geometry(new_child._offsprings())
+
+    def remove_child(self, removed_child: QItem) -> None:
+        super().remove_child(removed_child)
+        self._frame.controls.remove(removed_child._root_component)
+        self._touch(self._frame)
+        root = self._tracking_root()
+        if root is not None:
+            root._queue_geometry(removed_child._offsprings(), indexed=False)
+            if root._cull:
+                for item in removed_child._offsprings():
+                    item._set_culled(False)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+from bisect import bisect_right
+from typing import Callable, Sequence
+
+import flet as ft
+
+from .core.item import Item, ItemHandle
+from ._typing_shortcut import number, optional_number
+from ._q_virtual_view import _QVirtualView
+from .q_item import QItem
+
+
+__all__ = ["QListView"]
+
+
+class QListViewDefaultVals(_QVirtualView.DEFAULT_VALUES):
+    default_row_count = 0
+    default_row_height = 40
+
+
+DEFAULT_VALUES = QListViewDefaultVals
+
+
+class QListView(_QVirtualView):
+    """
+    A vertical list that only materializes the rows inside its viewport (plus
+    ``overscan`` rows on each side). Rows are created by ``delegate(index)``.
+
+    With ``bind(item, index)``, rows scrolled out are rebound to the rows
+    scrolled in instead of being rebuilt. Without it, they are released to the
+    pool of their class, so a delegate using ``acquire()`` still avoids
+    rebuilding flet controls.
+    """
+    DEFAULT_VALUES = QListViewDefaultVals
+
+    @_QVirtualView.cached_classproperty
+    def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
+        return super()._RESERVED_PROPERTY_NAMES | {
+            "row_count", "row_height",
+        }
+
+    def __init__(
+            self,
+            id: str | None = None,
+            children: Item | Sequence[Item] = (),
+            delegate: Callable[[int], QItem] | None = None,
+            bind: Callable[[QItem, int], None] | None = None,
+            row_height_of: Callable[[int], number] | None = None,
+
+            # rows
+            row_count: int | Callable[[ItemHandle], int] = DEFAULT_VALUES.default_row_count,
+            row_height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_row_height,
+            scroll_offset: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scroll_offset,
+            overscan: int | Callable[[ItemHandle], int] = DEFAULT_VALUES.default_overscan,
+
+            # from super: QItem
+            width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_width,
+            height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_height,
+            implicit_width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_width,
+            implicit_height: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_implicit_height,
+            x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_x,
+            y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_y,
+            z: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_z,
+            expand: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_expand,
+            anchor_left: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_left,
+            anchor_top: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_top,
+            anchor_right: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_right,
+            anchor_bottom: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_anchor_bottom,
+            align_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_x,
+            align_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_align_centre_y,
+            align_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_x,
+            align_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_align_y,
+            padding: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding,
+            padding_left: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_left,
+            padding_top: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_top,
+            padding_right: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_right,
+            padding_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_padding_bottom,
+            visible: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_visible,
+            opacity: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_opacity,
+            rotate_angle: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_angle,
+            rotate_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_x,
+            rotate_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_rotate_centre_y,
+            scale: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale,
+            scale_centre_x: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_x,
+            scale_centre_y: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_scale_centre_y,
+            scale_x: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_x,
+            scale_y: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_scale_y,
+            border_radius: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_radius,
+            clip_behaviour: ft.ClipBehavior | Callable[[ItemHandle], ft.ClipBehavior] = DEFAULT_VALUES.default_clip_behaviour,
+
+            **kwargs
+    ) -> None:
+        """
+        :param id: The id of the item, used to reference the item by its peers or offspring.
+        :param children: Static children, not managed by the view.
+        :param delegate: Creates the row of an index.
+        :param bind: Updates an existing row to show another index.
+        :param row_height_of: Height of the row of an index, if rows are not all ``row_height`` high.
+
+        :param row_count: The number of rows.
+        :param row_height: The height of every row, or the estimated height of rows not measured yet if ``row_height_of`` is given.
+        :param scroll_offset: The offset of the viewport from the top of the first row.
+        :param overscan: The number of rows materialized beyond each side of the viewport.
+
+        :param width: The width of the item.
+        :param height: The height of the item.
+        :param implicit_width: The width of the item if width is not defined by any means.
+        :param implicit_height: The height of the item if height is not defined by any means.
+        :param x: The x coordinate of the item.
+        :param y: The y coordinate of the item.
+        :param anchor_left: The global x coordinate of the left side of the item.
+        :param anchor_top: The global y coordinate of the top side of the item.
+        :param anchor_right: The global x coordinate of the right side of the item.
+        :param anchor_bottom: The global y coordinate of the bottom side of the item.
+        :param align_centre_x: The centre of alignment of the item on the x axis. -1 to 1 from left to right.
+        :param align_centre_y: The centre of alignment of the item on the y axis. -1 to 1 from top to bottom.
+        :param align_x: The alignment of the item in its parent. -1 to 1 from left to right.
+        :param align_y: The alignment of the item in its parent. -1 to 1 from top to bottom.
+        :param padding: The padding for all child items.
+        :param padding_left: The padding for the left side of the item.
+        :param padding_top: The padding for the top side of the item.
+        :param padding_right: The padding for the right side of the item.
+        :param padding_bottom: The padding for the bottom side of the item.
+        :param visible: Whether the item is visible.
+        :param opacity: The opacity of the item (affects children opacity).
+        :param rotate_angle: The angle of rotation of the item.
+        :param rotate_centre_x: The centre of rotation of the item on the x axis. -1 to 1 from left to right.
+        :param rotate_centre_y: The centre of rotation of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale: The scale of the item.
+        :param scale_centre_x: The centre of scaling of the item on the x axis. -1 to 1 from left to right.
+        :param scale_centre_y: The centre of scaling of the item on the y axis. -1 to 1 from top to bottom.
+        :param scale_x: The scale of the item on the x axis.
+        :param scale_y: The scale of the item on the y axis.
+        :param border_radius: The border radius of the item.
+        :param clip_behaviour: The clip behaviour of the item.
+        """
+        self._row_height_of = row_height_of
+        self._tops: list[number] = [0]
+
+        super().__init__(
+            id, children, delegate, bind, scroll_offset, overscan,
+            width=width, height=height, implicit_width=implicit_width, implicit_height=implicit_height,
+            x=x, y=y, z=z, expand=expand, anchor_left=anchor_left, anchor_top=anchor_top,
+            anchor_right=anchor_right, anchor_bottom=anchor_bottom, align_centre_x=align_centre_x,
+            align_centre_y=align_centre_y, align_x=align_x, align_y=align_y, padding=padding,
+            padding_left=padding_left, padding_top=padding_top, padding_right=padding_right,
+            padding_bottom=padding_bottom, visible=visible, opacity=opacity, rotate_angle=rotate_angle,
+            rotate_centre_x=rotate_centre_x, rotate_centre_y=rotate_centre_y, scale=scale,
+            scale_centre_x=scale_centre_x, scale_centre_y=scale_centre_y, scale_x=scale_x, scale_y=scale_y,
+            border_radius=border_radius, clip_behaviour=clip_behaviour,
+            **kwargs,
+        )
+
+        self.row_count: int = row_count
+        self.row_height: number = row_height
+
+    @property
+    def content_height(self) -> number:
+        count = self.row_count
+        if self._row_height_of is None:
+            return count * self.row_height
+        measured = len(self._tops) - 1
+        if measured >= count:
+            return self._tops[count]
+        return self._tops[-1] + (count - measured) * self.row_height
+
+    def reload(self) -> None:
+        self._tops = [0]
+        super().reload()
+
+    def _on_row_count_change(self) -> None:
+        self._outdate_layout()
+
+    def _on_row_height_change(self) -> None:
+        self._outdate_layout()
+
+    def _row_height(self, index: int) -> number:
+        if self._row_height_of is None:
+            return self.row_height
+        return self._row_height_of(index)
+
+    def _measure_rows(self, index: int) -> None:
+        """ extends the top of rows (prefix sums of row heights) up to the row of index """
+        tops = self._tops
+        while len(tops) <= index:
+            tops.append(tops[-1] + self._row_height_of(len(tops) - 1))
+
+    def _index_top(self, index: int) -> number:
+        if self._row_height_of is None:
+            return index * self.row_height
+        self._measure_rows(index)
+        return self._tops[index]
+
+    def _row_at(self, offset: number) -> int:
+        """ :returns: the index of the row at offset, clamped to existing rows """
+        count = self.row_count
+        if self._row_height_of is None:
+            index = int(offset // self.row_height) if self.row_height > 0 else 0
+        else:
+            tops = self._tops
+            while tops[-1] <= offset and len(tops) <= count:
+                self._measure_rows(len(tops))
+            index = bisect_right(tops, offset) - 1
+        return min(max(index, 0), count - 1)
+
+    def _visible_indices(self) -> range:
+        count = self.row_count
+        viewport_height = self.viewport_height
+        if count <= 0 or viewport_height <= 0:
+            return range(0)
+        offset = self._clamped_scroll_offset()
+        first = self._row_at(offset)
+        last = self._row_at(offset + viewport_height)
+        return range(max(first - self.overscan, 0), min(last + 1 + self.overscan, count))
+
+    def _placement(self, index: int) -> tuple[number, number, number, number]:
+        return (
+            0,
+            self._index_top(index) - self._clamped_scroll_offset(),
+            self.viewport_width,
+            self._row_height(index),
+        )
+
+
+if __name__ == "__main__":
+    from .q_root_item import QRootItem
+    from .q_text import QText
+
+    def main(page: ft.Page):
+        page.padding = 0
+        root_item = QRootItem.auto_init_page(page=page)
+        list_view = QListView(
+            width=lambda d: d.parent.width,
+            height=lambda d: d.parent.height,
+            row_count=100_000,
+            row_height=40,
+            delegate=lambda index: QText(text=f"row {index}", text_colour="#FFFFFF"),
+            bind=lambda item, index: setattr(item, "text", f"row {index}"),
+        )
+        root_item.add_child(list_view)
+
+        def on_keyboard(e: ft.KeyboardEvent):
+            list_view.scroll_by({"Arrow Down": 40, "Arrow Up": -40, "Page Down": 400, "Page Up": -400}.get(e.key, 0))
+            root_item.compute()
+            page.update()
+
+        page.on_keyboard_event = on_keyboard
+        page.update()
+
+    ft.app(target=main)
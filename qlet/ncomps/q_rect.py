@@ -1,13 +1,13 @@
 from __future__ import annotations
-import random
 from typing import Callable, Sequence
 
 import flet as ft
 
+from .core.effect import effect
 from .core.item import Item, ItemHandle
-from .core.colour import is_light
-from ._typing_shortcut import number, optional_number
-from .q_item import QItem
+from .core.colour import is_light, to_flet_colour
+from ._typing_shortcut import colour, number, optional_number
+from .q_item import QItem, _absolute, _lean, _wrapped
 
 
 __all__ = ["QRect"]
@@ -32,30 +32,6 @@ class QRectDefaultVals(QItem.DEFAULT_VALUES):
     default_border_width_bottom = lambda d: d.border_width
     default_border_colour_bottom = lambda d: d.border_colour
 
-    @staticmethod
-    def default_READY_bg_align_x(d: ItemHandle) -> number:
-        d.x, d.width, d.parent.width
-        d.inset_left, d.inset_right
-        return random.random()
-
-    @staticmethod
-    def default_READY_bg_align_y(d: ItemHandle) -> number:
-        d.y, d.height, d.parent.height
-        d.inset_top, d.inset_bottom
-        return random.random()
-
-    @staticmethod
-    def default_READY_border_horizontal(d: ItemHandle) -> number:
-        d.width
-        d.border_width_left, d.border_width_right, d.border_colour_left, d.border_colour_right
-        return random.random()
-
-    @staticmethod
-    def default_READY_border_vertical(d: ItemHandle) -> number:
-        d.height
-        d.border_width_top, d.border_width_bottom, d.border_colour_top, d.border_colour_bottom
-        return random.random()
-
 
 DEFAULT_VALUES = QRectDefaultVals
 
@@ -70,8 +46,6 @@ class QRect(QItem):
             "border_colour_right", "border_colour_top", "border_width", "border_width_bottom",
             "border_width_left", "border_width_right", "border_width_top",
             "inset", "inset_bottom", "inset_left", "inset_right", "inset_top",
-            "READY_border_horizontal", "READY_border_vertical",
-            "READY_bg_align_x", "READY_bg_align_y",
         }
 
     def __init__(
@@ -87,17 +61,17 @@ class QRect(QItem):
             inset_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_inset_bottom,
 
             # appearance and transformation
-            bgcolour: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_bgcolour,
+            bgcolour: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_bgcolour,
             border_width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width,
-            border_colour: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour,
+            border_colour: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour,
             border_width_left: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_left,
-            border_colour_left: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_left,
+            border_colour_left: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_left,
             border_width_top: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_top,
-            border_colour_top: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_top,
+            border_colour_top: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_top,
             border_width_right: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_right,
-            border_colour_right: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_right,
+            border_colour_right: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_right,
             border_width_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_bottom,
-            border_colour_bottom: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_bottom,
+            border_colour_bottom: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_bottom,
 
             # from super: QItem
             width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_width,
@@ -184,8 +158,9 @@ class QRect(QItem):
         :param border_radius: The border radius of the item.
         :param clip_behaviour: The clip behaviour of the item.
         """
-        self._bg_frame = ft.Stack()
-        self._bg_container: ft.Container
+        if not self._reusing:
+            self._bg_frame = ft.Stack()
+            self._bg_container: ft.Container
 
         super().__init__(
             id, children,
@@ -207,31 +182,38 @@ class QRect(QItem):
         self.inset_right: number = inset_right
         self.inset_bottom: number = inset_bottom
 
-        self.bgcolour: str = bgcolour
+        self.bgcolour: colour = bgcolour
         self.border_width: number = border_width
-        self.border_colour: str = border_colour
+        self.border_colour: colour = border_colour
         self.border_width_left: number = border_width_left
-        self.border_colour_left: str = border_colour_left
+        self.border_colour_left: colour = border_colour_left
         self.border_width_top: number = border_width_top
-        self.border_colour_top: str = border_colour_top
+        self.border_colour_top: colour = border_colour_top
         self.border_width_right: number = border_width_right
-        self.border_colour_right: str = border_colour_right
+        self.border_colour_right: colour = border_colour_right
         self.border_width_bottom: number = border_width_bottom
-        self.border_colour_bottom: str = border_colour_bottom
-
-        self.READY_bg_align_x: number = QRectDefaultVals.default_READY_bg_align_x
-        self.READY_bg_align_y: number = QRectDefaultVals.default_READY_bg_align_y
-        self.READY_border_horizontal: number = QRectDefaultVals.default_READY_border_horizontal
-        self.READY_border_vertical: number = QRectDefaultVals.default_READY_border_vertical
+        self.border_colour_bottom: colour = border_colour_bottom
 
     def _init_flet(self) -> None:
         super()._init_flet()
+        if self.RENDER_MODE == "lean":
+            # the background is the positioned container itself, the frame is inside its padding
+            self._bg_container = self._content_container
+            self._bg_container.border = ft.Border()
+            self._bg_container.padding = ft.Padding(0, 0, 0, 0)
+            return
         self._bg_container = ft.Container(
             content=self._bg_frame,
             border=ft.Border(),
             rotate=ft.Rotate(0, ft.Alignment(0, 0)),
             scale=ft.Scale(alignment=ft.Alignment(0, 0)),
         )
+        if self.RENDER_MODE == "absolute":
+            self._l1_bg_tr_pointer = ft.TransparentPointer(
+                content=self._bg_container,
+            )
+            self._root_component.controls.insert(0, self._l1_bg_tr_pointer)
+            return
         self._l2_bg_tr_pointer = ft.TransparentPointer(
             content=self._bg_container,
         )
@@ -248,62 +230,76 @@ class QRect(QItem):
 
     def _on_bgcolour_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] bgcolour: {self.bgcolour}")
-        self._bg_container.bgcolor = self.bgcolour
+        self._bg_container.bgcolor = to_flet_colour(self.bgcolour)
+        self._touch(self._bg_container)
 
     def _on_rotate_angle_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] rotate_angle: {self.rotate_angle}")
         super()._on_rotate_angle_change()
         self._bg_container.rotate.angle = self.rotate_angle
+        self._touch(self._bg_container)
 
     def _on_rotate_centre_x_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] rotate_centre_x: {self.rotate_centre_x}")
         super()._on_rotate_centre_x_change()
         self._bg_container.rotate.alignment.x = self.rotate_centre_x
+        self._touch(self._bg_container)
 
     def _on_rotate_centre_y_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] rotate_centre_y: {self.rotate_centre_y}")
         super()._on_rotate_centre_y_change()
         self._bg_container.rotate.alignment.y = self.rotate_centre_y
+        self._touch(self._bg_container)
 
     def _on_scale_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale: {self.scale}")
         super()._on_scale_change()
         self._bg_container.scale.scale = self.scale
+        self._touch(self._bg_container)
 
     def _on_scale_centre_x_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_centre_x: {self.scale_centre_x}")
         super()._on_scale_centre_x_change()
         self._bg_container.scale.alignment.x = self.scale_centre_x
+        self._touch(self._bg_container)
 
     def _on_scale_centre_y_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_centre_y: {self.scale_centre_y}")
         super()._on_scale_centre_y_change()
         self._bg_container.scale.alignment.y = self.scale_centre_y
+        self._touch(self._bg_container)
 
     def _on_scale_x_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_x: {self.scale_x}")
         super()._on_scale_x_change()
         self._bg_container.scale.scale_x = self.scale_x
+        self._touch(self._bg_container)
 
     def _on_scale_y_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] scale_y: {self.scale_y}")
         super()._on_scale_y_change()
         self._bg_container.scale.scale_y = self.scale_y
+        self._touch(self._bg_container)
 
     def _on_border_radius_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] border_radius: {self.border_radius}")
         super()._on_border_radius_change()
         self._bg_container.border_radius = self.border_radius
+        self._touch(self._bg_container)
 
     def _on_clip_behaviour_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] clip_behaviour: {self.clip_behaviour}")
         super()._on_clip_behaviour_change()
         self._bg_container.clip_behavior = self.clip_behaviour
+        self._touch(self._bg_container)
 
-    def _on_READY_bg_align_x_change(self) -> None:
-        # print(f"{self.__class__.__name__}[{self.displayed_id}] READY_bg_align_x: {self.x=}, {self.width=}")
+    @effect("x", "width", "inset_left", "inset_right", "parent.width", "parent.padding_left", "parent.padding_right",
+            when=_wrapped)
+    def _apply_bg_align_x(self) -> None:
+        # print(f"{self.__class__.__name__}[{self.displayed_id}] bg_align_x: {self.x=}, {self.width=}")
         width = self.width - self.inset_left - self.inset_right
         self._l2_bg_tr_pointer.width = width
+        self._touch(self._l2_bg_tr_pointer)
         self._l1_bg_conainter.padding.left = -width / 2
         self._l1_bg_conainter.padding.right = -width / 2
 
@@ -311,11 +307,15 @@ class QRect(QItem):
         parent_width = self.parent.width - self.parent.padding_left - self.parent.padding_right
         align_x = (original_centre_x / parent_width) * 2 - 1
         self._l1_bg_conainter.alignment.x = align_x
+        self._touch(self._l1_bg_conainter)
 
-    def _on_READY_bg_align_y_change(self) -> None:
-        # print(f"{self.__class__.__name__}[{self.displayed_id}] READY_bg_align_y: {self.y=}, {self.height=}")
+    @effect("y", "height", "inset_top", "inset_bottom", "parent.height", "parent.padding_top", "parent.padding_bottom",
+            when=_wrapped)
+    def _apply_bg_align_y(self) -> None:
+        # print(f"{self.__class__.__name__}[{self.displayed_id}] bg_align_y: {self.y=}, {self.height=}")
         height = self.height - self.inset_top - self.inset_bottom
         self._l2_bg_tr_pointer.height = height
+        self._touch(self._l2_bg_tr_pointer)
         self._l1_bg_conainter.padding.top = -height / 2
         self._l1_bg_conainter.padding.bottom = -height / 2
 
@@ -323,8 +323,38 @@ class QRect(QItem):
         parent_height = self.parent.height - self.parent.padding_top - self.parent.padding_bottom
         align_y = (original_centre_y / parent_height) * 2 - 1
         self._l1_bg_conainter.alignment.y = align_y
-
-    def _on_READY_border_horizontal_change(self) -> None:
+        self._touch(self._l1_bg_conainter)
+
+    @effect("width", "inset_left", "inset_right", when=_absolute)
+    def _apply_absolute_bg_x(self) -> None:
+        self._l1_bg_tr_pointer.left = self.inset_left
+        self._l1_bg_tr_pointer.width = self.width - self.inset_left - self.inset_right
+        self._touch(self._l1_bg_tr_pointer)
+
+    @effect("height", "inset_top", "inset_bottom", when=_absolute)
+    def _apply_absolute_bg_y(self) -> None:
+        self._l1_bg_tr_pointer.top = self.inset_top
+        self._l1_bg_tr_pointer.height = self.height - self.inset_top - self.inset_bottom
+        self._touch(self._l1_bg_tr_pointer)
+
+    @effect("x", "width", "inset_left", "inset_right", "padding_left", "padding_right", when=_lean)
+    def _apply_lean_x(self) -> None:
+        self._bg_container.left = self.x + self.inset_left
+        self._bg_container.width = self.width - self.inset_left - self.inset_right
+        self._bg_container.padding.left = self.padding_left - self.inset_left
+        self._bg_container.padding.right = self.padding_right - self.inset_right
+        self._touch(self._bg_container)
+
+    @effect("y", "height", "inset_top", "inset_bottom", "padding_top", "padding_bottom", when=_lean)
+    def _apply_lean_y(self) -> None:
+        self._bg_container.top = self.y + self.inset_top
+        self._bg_container.height = self.height - self.inset_top - self.inset_bottom
+        self._bg_container.padding.top = self.padding_top - self.inset_top
+        self._bg_container.padding.bottom = self.padding_bottom - self.inset_bottom
+        self._touch(self._bg_container)
+
+    @effect("width", "border_width_left", "border_width_right", "border_colour_left", "border_colour_right")
+    def _apply_border_horizontal(self) -> None:
         border_width_left = self.border_width_left if self.border_width_left > 0 else 0
         border_width_right = self.border_width_right if self.border_width_right > 0 else 0
         horizontal_total = border_width_left + border_width_right
@@ -336,13 +366,15 @@ class QRect(QItem):
         if border_width_left <= 0:
             self._bg_container.border.left = None
         else:
-            self._bg_container.border.left = ft.BorderSide(border_width_left, self.border_colour_left)
+            self._bg_container.border.left = ft.BorderSide(border_width_left, to_flet_colour(self.border_colour_left))
         if border_width_right <= 0:
             self._bg_container.border.right = None
         else:
-            self._bg_container.border.right = ft.BorderSide(border_width_right, self.border_colour_right)
-    
-    def _on_READY_border_vertical_change(self) -> None:
+            self._bg_container.border.right = ft.BorderSide(border_width_right, to_flet_colour(self.border_colour_right))
+        self._touch(self._bg_container)
+
+    @effect("height", "border_width_top", "border_width_bottom", "border_colour_top", "border_colour_bottom")
+    def _apply_border_vertical(self) -> None:
         border_width_top = self.border_width_top if self.border_width_top > 0 else 0
         border_width_bottom = self.border_width_bottom if self.border_width_bottom > 0 else 0
         vertical_total = border_width_top + border_width_bottom
@@ -352,11 +384,12 @@ class QRect(QItem):
         if border_width_top <= 0:
             self._bg_container.border.top = None
         else:
-            self._bg_container.border.top = ft.BorderSide(border_width_top, self.border_colour_top)
+            self._bg_container.border.top = ft.BorderSide(border_width_top, to_flet_colour(self.border_colour_top))
         if border_width_bottom <= 0:
             self._bg_container.border.bottom = None
         else:
-            self._bg_container.border.bottom = ft.BorderSide(border_width_bottom, self.border_colour_bottom)
+            self._bg_container.border.bottom = ft.BorderSide(border_width_bottom, to_flet_colour(self.border_colour_bottom))
+        self._touch(self._bg_container)
 
 
 if __name__ == "__main__":
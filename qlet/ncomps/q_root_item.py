@@ -1,19 +1,36 @@
 from __future__ import annotations
+import math
 from functools import partial
-from typing import Callable, Sequence, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Sequence, TYPE_CHECKING
 
 import flet as ft
 from flet_core.control_event import ControlEvent
 
+from .core.animation import Animator
+from .core.colour import to_flet_colour
+from .core.compute_coordinator import ComputeCoordinator
+from .core.compute_slices import ComputeSlices
 from .core.item import Item, ItemHandle
-from ._typing_shortcut import number
+from .core.null_value import _NullValue
+from .core.resize_coalescer import DEFAULT_RESIZE_FPS, ResizeCoalescer
+from .core.spatial_index import SpatialIndex
+from ._control_tracker import _ControlTracker
+from ._typing_shortcut import colour, number
+from .q_item import QItem
 
 
 if TYPE_CHECKING:
-    from .q_item import QItem
+    from .q_item import RenderMode
 
 
-class QRootItem(Item):
+class QRootItem(Item, _ControlTracker):
+    RENDER_MODE: RenderMode = "wrapped"
+    # time budget of a slice of compute_progressive(), about a frame at 60 fps
+    DEFAULT_FRAME_MS = 16
+
+    # whether the controls of the children may not be ordered by z any more
+    _z_order_outdated = False
+
     @Item.cached_classproperty
     def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
         return super()._RESERVED_PROPERTY_NAMES | {
@@ -34,18 +51,37 @@ class QRootItem(Item):
             children: Item | Sequence[Item] = (),
             
             wrap: bool | Callable[[ItemHandle], bool] = False,
-            wrap_colour: str | Callable[[ItemHandle], str] = "#FF000000",
+            wrap_colour: colour | Callable[[ItemHandle], colour] = "#FF000000",
+            render_mode: RenderMode | None = None,
+            cull: bool = False,
 
             **kwargs
     ) -> None:
+        """
+        :param render_mode: the flet control tree of the root item itself, RENDER_MODE of the class if None.
+                            The tree of the other items is set by their classes (QItem.RENDER_MODE).
+        :param cull: whether to hide the items entirely outside the root from flet, see cull.
+        """
+        if render_mode is not None:
+            self.RENDER_MODE = render_mode
         self._frame = ft.Stack()
+        # items with controls mutated since the last flush
+        self._dirty_items: list[_ControlTracker] = []
+        # global rectangles of the offsprings, created by the first spatial_index access,
+        # and the items whose geometry changed since it was last updated
+        self._spatial_index: SpatialIndex[QItem] | None = None
+        self._moved_items: list[QItem] = []
 
         super().__init__(
             id, True, children,
             **kwargs,
         )
 
-        self._page: ft.Page
+        self._page: ft.Page | None = None
+        self._cull = False
+        self.cull = cull
+        self._coordinator = ComputeCoordinator(self.__compute_pass)
+        self._animator = Animator(self.__compute_pass, run=self._coordinator.call)
         self._page_padding_l = 10
         self._page_padding_r = 10
         self._page_padding_t = 10
@@ -66,7 +102,7 @@ class QRootItem(Item):
         self.width: number = 10
         self.height: number = 10
         self.wrap: bool = wrap
-        self.wrap_colour: str = wrap_colour
+        self.wrap_colour: colour = wrap_colour
 
         self.padding = 0
         self.padding_left = 0
@@ -87,6 +123,10 @@ class QRootItem(Item):
         self.border_width_bottom = 0
 
     def _init_flet(self) -> None:
+        if self.RENDER_MODE != "wrapped":
+            # a root has no parent to be positioned in, its lean tree serves every other mode
+            self._init_lean_flet()
+            return
         self._inner_container = ft.TransparentPointer(
             content=ft.Container(
                 content=self._frame,
@@ -108,6 +148,47 @@ class QRootItem(Item):
                 padding=self._padding,
             ),
         )
+        self._init_flet_wraps()
+        self._root_component = ft.Stack(
+            controls=[
+                self._container,
+                self._wrap_right,
+                self._wrap_bottom,
+            ],
+        )
+        self._frame_chain = (
+            self._root_component,
+            self._container,
+            self._inner_container,
+            self._frame,
+        )
+
+    def _init_lean_flet(self) -> None:
+        """ a single sized container around the frame, its margin undoes the page padding """
+        self._padding = ft.Margin(
+            left=self._padding.left, top=self._padding.top,
+            right=self._padding.right, bottom=self._padding.bottom,
+        )
+        self._container = ft.Container(
+            content=self._frame,
+            margin=self._padding,
+        )
+        self._inner_container = self._container
+        self._init_flet_wraps()
+        self._root_component = ft.Stack(
+            controls=[
+                self._container,
+                self._wrap_right,
+                self._wrap_bottom,
+            ],
+        )
+        self._frame_chain = (
+            self._root_component,
+            self._container,
+            self._frame,
+        )
+
+    def _init_flet_wraps(self) -> None:
         self._wrap_right_inner = ft.Container()
         self._wrap_right = (
             ft.Container(
@@ -122,31 +203,32 @@ class QRootItem(Item):
                 padding=ft.Padding(left=0, right=-10000, top=0, bottom=-10000),
             )
         )
-        self._root_component = ft.Stack(
-            controls=[
-                self._container,
-                self._wrap_right,
-                self._wrap_bottom,
-            ],
-        )
 
     def _on_width_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] width: {self.width}")
         self._container.width = self.width
+        self._touch(self._container)
         self._inner_container.width = self.width
+        self._touch(self._inner_container)
 
     def _on_height_change(self) -> None:
         # print(f"{self.__class__.__name__}[{self.displayed_id}] height: {self.height}")
         self._container.height = self.height
+        self._touch(self._container)
         self._inner_container.height = self.height
+        self._touch(self._inner_container)
 
     def _on_wrap_change(self) -> None:
         self._wrap_right.visible = self.wrap
+        self._touch(self._wrap_right)
         self._wrap_bottom.visible = self.wrap
+        self._touch(self._wrap_bottom)
 
     def _on_wrap_colour_change(self) -> None:
-        self._wrap_right_inner.bgcolor = self.wrap_colour
-        self._wrap_bottom_inner.bgcolor = self.wrap_colour
+        self._wrap_right_inner.bgcolor = to_flet_colour(self.wrap_colour)
+        self._touch(self._wrap_right_inner)
+        self._wrap_bottom_inner.bgcolor = to_flet_colour(self.wrap_colour)
+        self._touch(self._wrap_bottom_inner)
 
     def __read_new_page_padding(self) -> bool:
         """ :returns: True if padding has changed. """
@@ -196,30 +278,250 @@ class QRootItem(Item):
         self._padding.bottom = -self._page_padding_b
 
     def __on_page_resize(self, _: ControlEvent) -> None:
-        self._wrap_right.padding.left = self._page.width - self._page_padding_l
+        self._resize_coalescer.submit(self._page.width, self._page.height)
+
+    def __apply_page_size(self, width: number, height: number) -> None:
+        self._coordinator.call(self.__set_page_size, width, height)
+        self._coordinator.request_compute()
+
+    def __set_page_size(self, width: number, height: number) -> None:
+        self._wrap_right.padding.left = width - self._page_padding_l
         self._wrap_right.padding.top = -self._page_padding_t
+        self._touch(self._wrap_right)
         self._wrap_bottom.padding.left = -self._page_padding_l
-        self._wrap_bottom.padding.top = self._page.height - self._page_padding_t
+        self._wrap_bottom.padding.top = height - self._page_padding_t
+        self._touch(self._wrap_bottom)
+
+        self.width = width
+        self.height = height
+
+    @property
+    def coordinator(self) -> ComputeCoordinator:
+        """
+        Serializes the computes of the tree across threads. Event handlers
+        running on worker threads should write properties with
+        ``coordinator.set(item, name, value)`` (or ``coordinator.call(f)``) and
+        compute with ``coordinator.request_compute()``, which also flushes.
+        """
+        return self._coordinator
+
+    @property
+    def animator(self) -> Animator:
+        """
+        Animates properties of the items of the tree, e.g.
+        ``root.animator.tween(item, "x", 100, duration=0.3)``. Each frame
+        writes all the animated values, then computes and flushes once.
+        """
+        return self._animator
 
-        self.width = self._page.width
-        self.height = self._page.height
+    def __compute_pass(self) -> None:
+        if self._async_compute is not None:
+            # the tree is held by compute_async(), the pass runs once it completes
+            self._coordinator.request_compute()
+            return
         self.compute()
-        self._root_component.update()
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Sends the flet controls mutated since the last flush to the page, in a
+        single update. Only the outermost mutated controls are sent, as flet
+        updates the controls they contain along with them.
+        Does nothing if the root is not on a page.
+        """
+        if self._page is None:
+            return
+        controls = self._take_dirty_controls()
+        if controls:
+            self._page.update(*controls)
+
+    async def compute_async(
+            self, max_evaluations: int | None = 1000, max_ms: float | None = 10,
+            defer: Callable[[Item], bool] | None = None, on_slice: Callable[[], Any] | None = None,
+    ) -> ComputeSlices:
+        """
+        Item.compute_async(), holding the coordinator until it completes:
+        writes of other threads are queued meanwhile, and the passes requested
+        (by the coordinator, page resizes or the animator) fold into one pass
+        run right after it.
+        """
+        await self._coordinator.acquire_async()
+        try:
+            return await super().compute_async(max_evaluations, max_ms, defer, on_slice)
+        finally:
+            self._coordinator.release()
+
+    async def compute_progressive(self, frame_ms: float | None = None) -> ComputeSlices:
+        """
+        Computes the tree in slices of at most frame_ms milliseconds (see
+        Item.compute_async()), flushing each slice to the page. The offsprings
+        of items that are hidden or entirely outside the page are computed
+        last, so what is on screen is painted first. Only the order of the work
+        changes, the tree is consistent once the returned coroutine completes.
+
+        :param frame_ms: DEFAULT_FRAME_MS if None.
+        """
+        return await self.compute_async(
+            max_evaluations=None,
+            max_ms=self.DEFAULT_FRAME_MS if frame_ms is None else frame_ms,
+            defer=self._outside_viewport,
+            on_slice=self.flush,
+        )
+
+    def _outside_viewport(self, item: QItem) -> bool:
+        """ whether item is hidden or its box does not intersect the root's """
+        if item.visible is False:
+            return True
+        geometry = (item.global_x, item.global_y, item.width, item.height)
+        viewport = (self.global_x, self.global_y, self.width, self.height)
+        if any(isinstance(value, _NullValue) for value in geometry + viewport):
+            return False
+        x, y, width, height = geometry
+        left, top, viewport_width, viewport_height = viewport
+        return (
+            x >= left + viewport_width or x + width <= left
+            or y >= top + viewport_height or y + height <= top
+        )
+
+    @property
+    def spatial_index(self) -> SpatialIndex[QItem]:
+        """
+        The global rectangles of the computed offsprings (hidden ones included),
+        e.g. ``root.spatial_index.at(x, y)``. It is built on first access, then
+        updated on each access with the items whose geometry changed meanwhile.
+        """
+        index = self._spatial_index
+        if index is None:
+            index = self._spatial_index = SpatialIndex()
+            offsprings = self._offsprings()
+            next(offsprings)
+            self._queue_geometry(offsprings)
+        items, self._moved_items = self._moved_items, []
+        for item in items:
+            if item._geometry_queued is self:
+                item._geometry_queued = None
+            geometry = (item.global_x, item.global_y, item.width, item.height)
+            if item._tracking_root() is not self or any(isinstance(value, _NullValue) for value in geometry):
+                index.remove(item)
+            else:
+                index.insert(item, *geometry)
+        return index
+
+    def _queue_geometry(self, items: Iterable[QItem], indexed: bool = True) -> None:
+        """
+        queues items for the next update of the spatial index, if there is one.
+        :param indexed: False for items removed from the root, whose geometry is not tracked any more.
+        """
+        if self._spatial_index is None:
+            return
+        for item in items:
+            if indexed:
+                item._indexed_by = self
+            elif item._indexed_by is self:
+                item._indexed_by = None
+            if item._geometry_queued is not self:
+                item._geometry_queued = self
+                self._moved_items.append(item)
+
+    def _take_dirty_controls(self) -> list[ft.Control]:
+        """ :returns: the minimal set of controls covering all mutated controls on the page """
+        items, self._dirty_items = self._dirty_items, []
+        # items whose mutated controls contain their children
+        covering = {
+            id(item) for item in items
+            if item._dirty_controls is not None and not item._dirty_controls.isdisjoint(item._frame_chain)
+        }
+        controls: list[ft.Control] = []
+        for item in items:
+            dirty, item._dirty_controls = item._dirty_controls, None
+            if dirty is None:
+                continue
+            node = item
+            while node.parent is not None and id(node.parent) not in covering:
+                node = node.parent
+            if node.parent is not None:
+                # sent along with a mutated ancestor
+                continue
+            if node is not self:
+                # removed from the page since it was mutated
+                continue
+            chain = item._frame_chain
+            outermost = next((control for control in chain if control in dirty), None)
+            if outermost is not None:
+                controls.append(outermost)
+                if outermost is chain[0]:
+                    continue
+                dirty = dirty.difference(chain)
+            controls.extend(dirty)
+        return [control for control in controls if control.page is not None]
 
     def _on_children_computed(self) -> None:
         super()._on_children_computed()
+        if self._cull:
+            self._cull_offscreen()
+        if not self._z_order_outdated:
+            return
+        self._z_order_outdated = False
         def safe_z(control: ft.Control) -> number:
-            return control.q_data.z if hasattr(control, "q_data") else 0
-        self._frame.controls.sort(key=safe_z)
+            return control.q_data().z if hasattr(control, "q_data") else -math.inf
+        controls = self._frame.controls
+        ordered = sorted(controls, key=safe_z)
+        if ordered != controls:
+            controls[:] = ordered
+            self._touch(self._frame)
+
+    @property
+    def cull(self) -> bool:
+        """
+        Whether the subtrees entirely outside the root (or outside an ancestor
+        clipping them) are hidden from flet, after each compute. Only the
+        outermost item of such a subtree is hidden, and only when its state flips.
+        Items that are rotated or scaled are never culled with their offsprings.
+        """
+        return self._cull
+
+    @cull.setter
+    def cull(self, cull: bool) -> None:
+        if cull == self._cull:
+            return
+        self._cull = cull
+        if not cull:
+            offsprings = self._offsprings()
+            next(offsprings)
+            for item in offsprings:
+                item._set_culled(False)
+
+    def _cull_offscreen(self) -> None:
+        viewport = (self.global_x, self.global_y, self.global_x + self.width, self.global_y + self.height)
+        if any(isinstance(value, _NullValue) for value in viewport):
+            return
+        for child in self._children:
+            child._set_culled(not _on_screen(child, viewport))
 
     def add_child(self, new_child: QItem) -> None:
         super().add_child(new_child)
         self._frame.controls.append(new_child._root_component)
+        self._touch(self._frame)
+        self._queue_geometry(new_child._offsprings())
+        self._z_order_outdated = True
+
+    def remove_child(self, removed_child: QItem) -> None:
+        super().remove_child(removed_child)
+        self._frame.controls.remove(removed_child._root_component)
+        self._touch(self._frame)
+        self._queue_geometry(removed_child._offsprings(), indexed=False)
+        if self._cull:
+            for item in removed_child._offsprings():
+                item._set_culled(False)
 
     def __on_update_monitor(self, update: Callable, *controls) -> None:
         if len(controls) == 0:
             if self.__read_new_page_padding():
                 self.__apply_read_page_padding()
+            # the whole page is sent, nothing is left to flush
+            for item in self._dirty_items:
+                item._dirty_controls = None
+            self._dirty_items = []
         update(*controls)
 
     @classmethod
@@ -227,16 +529,24 @@ class QRootItem(Item):
             cls, page: ft.Page,
             id: str = "q_root_item",
             wrap: bool = False,
-            wrap_colour: str = "#FF000000",
+            wrap_colour: colour = "#FF000000",
+            resize_fps: float | None = DEFAULT_RESIZE_FPS,
+            render_mode: RenderMode | None = None,
+            cull: bool = False,
     ) -> QRootItem:
         """
         :param id: the id of the root item.
         :param wrap: whether to wrap the outer area of the root item with a colour.
         :param wrap_colour: the colour of the wrap.
+        :param resize_fps: the maximum number of page resizes applied per second, None for no limit.
+                           Intermediate sizes are dropped, the last one is always applied.
+        :param render_mode: the flet control tree of the root item itself, see QItem.RENDER_MODE.
+        :param cull: whether to hide the items entirely outside the page from flet, see QRootItem.cull.
         :returns: a root item attached to the page. Do not modify width, height of the root item.
         """
-        item = QRootItem(id=id, wrap=wrap, wrap_colour=wrap_colour)
+        item = QRootItem(id=id, wrap=wrap, wrap_colour=wrap_colour, render_mode=render_mode, cull=cull)
         item._page = page
+        item._resize_coalescer = ResizeCoalescer(item.__apply_page_size, max_fps=resize_fps)
         page.add(item._root_component)
         page.on_resize.subscribe(item.__on_page_resize)
         page.update = partial(item.__on_update_monitor, page.update)
@@ -246,6 +556,38 @@ class QRootItem(Item):
         return item
 
 
+_UNBOUNDED = (-math.inf, -math.inf, math.inf, math.inf)
+
+
+def _on_screen(item: QItem, viewport: tuple[number, number, number, number]) -> bool:
+    """
+    :param viewport: left, top, right and bottom of the visible area, in global coordinates.
+    :returns: whether item or one of its offsprings intersects the viewport. If so, the
+        children that do not are culled, and the others shown.
+    """
+    left, top, right, bottom = viewport
+    geometry = (item.global_x, item.global_y, item.width, item.height)
+    if any(isinstance(value, _NullValue) for value in geometry):
+        visible = True
+    else:
+        x, y, width, height = geometry
+        visible = x < right and x + width > left and y < bottom and y + height > top
+        if item.clip_behaviour not in (None, ft.ClipBehavior.NONE):
+            if not visible:
+                return False
+            left, top, right, bottom = max(left, x), max(top, y), min(right, x + width), min(bottom, y + height)
+    if item.rotate_angle or any(scale is not None for scale in (item.scale, item.scale_x, item.scale_y)):
+        # drawn outside of its box
+        left, top, right, bottom = _UNBOUNDED
+        visible = True
+    states = [(child, _on_screen(child, (left, top, right, bottom))) for child in item._children]
+    if visible or any(state for _, state in states):
+        for child, state in states:
+            child._set_culled(not state)
+        return True
+    return False
+
+
 if __name__ == "__main__":
     def main(page: ft.Page):
         page.padding = 0
@@ -1,33 +1,78 @@
 from __future__ import annotations
-import random
 from typing import Callable, Literal, Sequence
 
 import flet as ft
 
+from .core.effect import effect
 from .core.item import Item, ItemHandle
-from .core.colour import contrast_bw
-from ._typing_shortcut import number, optional_number
+from .core.null_value import _NullValue
+from .core.colour import contrast_bw, to_flet_colour
+from .core.text_metrics import fit_text_size, measure_text
+from ._typing_shortcut import colour, number, optional_number
+from .q_item import _lean
 from .q_rect import QRect
 
 
 __all__ = ["QText"]
 
 
+def _text_box_width(d: ItemHandle) -> number:
+    """ horizontal space taken by insets and borders around the text """
+    return d.inset_left + d.inset_right + max(d.border_width_left, 0) + max(d.border_width_right, 0)
+
+
+def _text_box_height(d: ItemHandle) -> number:
+    """ vertical space taken by insets and borders around the text """
+    return d.inset_top + d.inset_bottom + max(d.border_width_top, 0) + max(d.border_width_bottom, 0)
+
+
+def _check_resolved(*values: object) -> None:
+    """
+    Raises while an input is not computed yet, so that the value is computed
+    again once it is, without measuring (and caching) unresolved texts.
+    """
+    if any(isinstance(value, _NullValue) for value in values):
+        raise ValueError("Unresolved text measurement input")
+
+
 class QTextDefaultVals(QRect.DEFAULT_VALUES):
     default_text = "example text"
     default_text_colour = lambda d: contrast_bw(d.bgcolour)
-    default_text_size = lambda d: min(14, d.height // 1.5)
+    default_text_natural_size = 14
+    default_text_fit = False
     default_text_italic = False
+
+    @staticmethod
+    def default_text_size(d: ItemHandle) -> number:
+        if not d.text_fit:
+            return d.text_natural_size
+        args = (d.text, d.width - _text_box_width(d), d.height - _text_box_height(d), d.text_italic, d.text_wrap)
+        _check_resolved(*args)
+        return fit_text_size(*args)
+
+    @staticmethod
+    def default_implicit_width(d: ItemHandle) -> number:
+        # a fitted text is measured at its natural size, as its size depends on the size of the item
+        size = d.text_natural_size if d.text_fit else d.text_size
+        args = (d.text, size, d.text_italic)
+        box_width = _text_box_width(d)
+        _check_resolved(*args)
+        return measure_text(*args).width + box_width
+
+    @staticmethod
+    def default_implicit_height(d: ItemHandle) -> number:
+        size = d.text_natural_size if d.text_fit else d.text_size
+        wrap_width = d.width - _text_box_width(d) if d.text_wrap else None
+        args = (d.text, size, d.text_italic, wrap_width)
+        box_height = _text_box_height(d)
+        _check_resolved(*args)
+        return measure_text(*args).height + box_height
+
     default_text_alignment = "left"
     default_text_horizontal_align = None
     default_text_vertical_align = None
     default_text_wrap = True
 
-    @staticmethod
-    def default_READY_text_hv_align(d: ItemHandle) -> number:
-        d.text_horizontal_align, d.text_vertical_align, d.text_alignment
-        return random.random()
-
 
 DEFAULT_VALUES = QTextDefaultVals
 
@@ -41,9 +86,8 @@ class QText(QRect):
     @QRect.cached_classproperty
     def _RESERVED_PROPERTY_NAMES(cls) -> set[str]:
         return super()._RESERVED_PROPERTY_NAMES | {
-            "text", "text_alignment", "text_colour", "text_horizontal_align", "text_italic",
-            "text_size", "text_vertical_align", "text_wrap",
-            "READY_text_hv_align",
+            "text", "text_alignment", "text_colour", "text_fit", "text_horizontal_align", "text_italic",
+            "text_natural_size", "text_size", "text_vertical_align", "text_wrap",
         }
 
     def __init__(
@@ -52,8 +96,10 @@ class QText(QRect):
             children: Item | Sequence[Item] = (),
             
             text: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_text,
-            text_colour: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_text_colour,
+            text_colour: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_text_colour,
             text_size: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_text_size,
+            text_natural_size: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_text_natural_size,
+            text_fit: bool | Callable[[ItemHandle], bool] = DEFAULT_VALUES.default_text_fit,
             text_alignment: QTextAlign | Callable[[ItemHandle], QTextAlign] = DEFAULT_VALUES.default_text_alignment,
             text_horizontal_align: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_text_horizontal_align,
             text_vertical_align: optional_number | Callable[[ItemHandle], optional_number] = DEFAULT_VALUES.default_text_vertical_align,
@@ -66,17 +112,17 @@ class QText(QRect):
             inset_top: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_inset_top,
             inset_right: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_inset_right,
             inset_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_inset_bottom,
-            bgcolour: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_bgcolour,
+            bgcolour: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_bgcolour,
             border_width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width,
-            border_colour: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour,
+            border_colour: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour,
             border_width_left: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_left,
-            border_colour_left: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_left,
+            border_colour_left: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_left,
             border_width_top: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_top,
-            border_colour_top: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_top,
+            border_colour_top: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_top,
             border_width_right: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_right,
-            border_colour_right: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_right,
+            border_colour_right: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_right,
             border_width_bottom: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_border_width_bottom,
-            border_colour_bottom: str | Callable[[ItemHandle], str] = DEFAULT_VALUES.default_border_colour_bottom,
+            border_colour_bottom: colour | Callable[[ItemHandle], colour] = DEFAULT_VALUES.default_border_colour_bottom,
 
             # from super: QItem
             width: number | Callable[[ItemHandle], number] = DEFAULT_VALUES.default_width,
@@ -122,6 +168,8 @@ class QText(QRect):
         :param text: The text content of the item.
         :param text_colour: The text colour of the item.
         :param text_size: The text size of the item.
+        :param text_natural_size: The text size of the item unless the text is fitted.
+        :param text_fit: Whether the text size is the largest at which the text fits in the item.
         :param text_alignment: The text alignment of the item.
         :param text_horizontal_align: The horizontal alignment of the text, from -1 to 1 (left to right).
         :param text_vertical_align: The vertical alignment of the text, from -1 to 1 (top to bottom).
@@ -142,8 +190,8 @@ class QText(QRect):
 
         :param width: The width of the item.
         :param height: The height of the item.
-        :param implicit_width: The width of the item if width is not defined by any means.
-        :param implicit_height: The height of the item if height is not defined by any means.
+        :param implicit_width: The width of the item if width is not defined by any means, by default the width of the text.
+        :param implicit_height: The height of the item if height is not defined by any means, by default the height of the text.
         :param x: The x coordinate of the item.
         :param y: The y coordinate of the item.
         :param anchor_left: The global x coordinate of the left side of the item.
@@ -172,11 +220,12 @@ class QText(QRect):
         :param border_radius: The border radius of the item.
         :param clip_behaviour: The clip behaviour of the item.
         """
-        self._frame = ft.Stack()
-        self._ft_text = ft.Text(size=25)
-        self._bg_container: ft.Container
-        self._ft_text: ft.Text
-        self._text_container: ft.Container
+        if not self._reusing:
+            self._frame = ft.Stack()
+            self._ft_text = ft.Text(size=25)
+            self._bg_container: ft.Container
+            self._ft_text: ft.Text
+            self._text_container: ft.Container
 
         super().__init__(
             id, children,
@@ -203,6 +252,8 @@ class QText(QRect):
 
         self.text = text
         self.text_colour = text_colour
+        self.text_natural_size = text_natural_size
+        self.text_fit = text_fit
         self.text_size = text_size
         self.text_alignment = text_alignment
         self.text_horizontal_align = text_horizontal_align
@@ -210,28 +261,34 @@ class QText(QRect):
         self.text_wrap = text_wrap
         self.text_italic = text_italic
 
-        self.READY_text_hv_align = QTextDefaultVals.default_READY_text_hv_align
-
     def _init_flet(self) -> None:
         super()._init_flet()
         self._text_container = ft.Container(
             self._ft_text,
         )
+        if self.RENDER_MODE == "lean":
+            # below the children, positioned over the background by _apply_lean_text_box()
+            self._frame.controls.insert(0, self._text_container)
+            return
         self._bg_container.content = ft.TransparentPointer(
             self._text_container,
         )
 
     def _on_text_change(self) -> None:
         self._ft_text.value = self.text
+        self._touch(self._ft_text)
 
     def _on_text_colour_change(self) -> None:
-        self._ft_text.color = self.text_colour
+        self._ft_text.color = to_flet_colour(self.text_colour)
+        self._touch(self._ft_text)
 
     def _on_text_size_change(self) -> None:
         self._ft_text.size = self.text_size
+        self._touch(self._ft_text)
 
     def _on_text_italic_change(self) -> None:
         self._ft_text.italic = self.text_italic
+        self._touch(self._ft_text)
 
     __TEXT_ALIGN_MAP: dict[QTextAlign, ft.TextAlign] = {
         "left": ft.TextAlign.LEFT,
@@ -243,9 +300,11 @@ class QText(QRect):
     }
     def _on_text_alignment_change(self) -> None:
         self._ft_text.text_align = self.__TEXT_ALIGN_MAP.get(self.text_alignment, None)
+        self._touch(self._ft_text)
 
     def _on_text_wrap_change(self) -> None:
         self._ft_text.no_wrap = not self.text_wrap
+        self._touch(self._ft_text)
 
     __TEXT_ALIGN_H_MAP: dict[QTextAlign, int] = {
         "left": -1,
@@ -255,9 +314,23 @@ class QText(QRect):
         "justify": 0,
         "end": 1,
     }
-    def _on_READY_text_hv_align_change(self) -> None:
+    @effect(
+        "width", "height", "inset_left", "inset_top", "inset_right", "inset_bottom",
+        "padding_left", "padding_top", "padding_right", "padding_bottom",
+        when=_lean,
+    )
+    def _apply_lean_text_box(self) -> None:
+        self._text_container.left = self.inset_left - self.padding_left
+        self._text_container.top = self.inset_top - self.padding_top
+        self._text_container.width = self.width - self.inset_left - self.inset_right
+        self._text_container.height = self.height - self.inset_top - self.inset_bottom
+        self._touch(self._text_container)
+
+    @effect("text_horizontal_align", "text_vertical_align", "text_alignment")
+    def _apply_text_hv_align(self) -> None:
         if (self.text_horizontal_align is None and self.text_vertical_align is None):
             self._text_container.alignment = None
+            self._touch(self._text_container)
             return
         horizontal_align = (
             self.text_horizontal_align
@@ -266,6 +339,7 @@ class QText(QRect):
         )
         vertical_align = self.text_vertical_align if self.text_vertical_align is not None else -1
         self._text_container.alignment = ft.Alignment(horizontal_align, vertical_align)
+        self._touch(self._text_container)
 
 
 if __name__ == "__main__":